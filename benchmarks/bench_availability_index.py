@@ -0,0 +1,57 @@
+# benchmarks/bench_availability_index.py
+"""
+Compares the indexed closest-resource lookup against the original linear scan.
+
+Run from the project root:
+    python -m benchmarks.bench_availability_index
+"""
+
+import random
+import time
+
+from models.enums import ResourceType
+from models.resource import Resource
+from services.availability_index import AvailabilityIndex
+from utils.helpers import calculate_zone_distance
+from utils.zones import ZONES
+
+
+def _linear_scan(resources, resource_type_str, location):
+    available = [r for r in resources if r.resource_type.value == resource_type_str and r.is_available]
+    if not available:
+        return None
+    return min(available, key=lambda r: calculate_zone_distance(r.location, location))
+
+
+def run(fleet_size: int, lookups: int = 200, zones: int = 50, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    types = list(ResourceType)
+    resources = [
+        Resource(i, rng.choice(types), f"Zone {rng.randint(1, zones)}")
+        for i in range(fleet_size)
+    ]
+    index = AvailabilityIndex()
+    for resource in resources:
+        index.track(resource)
+
+    queries = [(rng.choice(types), f"Zone {rng.randint(1, zones)}") for _ in range(lookups)]
+
+    start = time.perf_counter()
+    scanned = [_linear_scan(resources, t.value, loc) for t, loc in queries]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [index.nearest(t, ZONES.intern(loc)) for t, loc in queries]
+    index_time = time.perf_counter() - start
+
+    assert scanned == indexed, "Index and scan disagree"
+    print(
+        f"fleet={fleet_size:>7} | scan: {scan_time / lookups * 1e6:>9.1f} us/lookup | "
+        f"index: {index_time / lookups * 1e6:>6.1f} us/lookup | "
+        f"speedup: {scan_time / index_time:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    for size in (1_000, 10_000, 50_000):
+        run(size)
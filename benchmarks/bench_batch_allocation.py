@@ -0,0 +1,73 @@
+# benchmarks/bench_batch_allocation.py
+"""
+Compares greedy and batch (min-cost) allocation on the same backlog of waiting incidents.
+
+Run from the project root:
+    python -m benchmarks.bench_batch_allocation
+"""
+
+import random
+import time
+from collections import Counter
+
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+from utils.helpers import calculate_zone_distance
+
+
+def _build(scale: int, zones: int, seed: int) -> ResourceManager:
+    rng = random.Random(seed)
+    types = list(ResourceType)
+    priorities = list(PriorityLevel)
+    # Non-incremental, so new units wait for the measured pass instead of being dispatched
+    manager = ResourceManager(incremental=False, events=NullSink())
+    # Incidents arrive first so the whole backlog is waiting when units come online
+    manager.add_incidents([
+        Incident(
+            i, f"Zone {rng.randint(1, zones)}", "Synthetic", rng.choice(priorities),
+            [t.value for t in rng.sample(types, rng.randint(1, 2))]
+        )
+        for i in range(scale)
+    ])
+    for i in range(scale):
+        manager.add_resource(Resource(i, rng.choice(types), f"Zone {rng.randint(1, zones)}"))
+    return manager
+
+
+def run(scale: int, zones: int = 50, seed: int = 11) -> None:
+    results = {}
+    for strategy in ("greedy", "batch"):
+        manager = _build(scale, zones, seed)
+        start = time.perf_counter()
+        manager.allocate_resources(strategy=strategy)
+        elapsed = time.perf_counter() - start
+        total = weighted = 0
+        coverage = Counter()  # Units served per priority level
+        for incident in manager.get_all_incidents():
+            for resource in incident.allocated_resources:
+                distance = calculate_zone_distance(resource.location, incident.location)
+                total += distance
+                weighted += incident.priority.value * distance
+                coverage[incident.priority] += 1
+        results[strategy] = (elapsed, total, weighted, coverage)
+
+    # The solver never trades a higher-priority unit for a shorter trip, so both strategies
+    # serve the same units per priority; among those it minimizes priority-weighted distance.
+    # Raw total distance may still come out higher for batch.
+    assert results["batch"][3] == results["greedy"][3], "Batch serves a different number of units per priority"
+    assert results["batch"][2] <= results["greedy"][2], "Batch assignment has a higher weighted distance than greedy"
+
+    for strategy, (elapsed, total, weighted, coverage) in results.items():
+        served = sum(coverage.values())
+        print(
+            f"scale={scale:>6} | {strategy:<10} | time: {elapsed:>7.3f} s | "
+            f"served: {served:>6} | total distance: {total:>8} | "
+            f"weighted: {weighted:>8} | mean: {total / max(served, 1):.2f} zone(s)"
+        )
+
+if __name__ == "__main__":
+    for size in (1_000, 10_000, 100_000):
+        run(size)
@@ -0,0 +1,59 @@
+# benchmarks/bench_memory.py
+"""
+Measures memory per resource for the original dict-backed layout, the __slots__
+Resource model and the columnar ResourceTable.
+
+Run from the project root:
+    python -m benchmarks.bench_memory [fleet_size]
+"""
+
+import random
+import sys
+import tracemalloc
+
+from models.enums import ResourceType
+from models.resource import Resource
+from models.tables import ResourceTable
+
+
+class _DictResource:
+    """
+    Mirror of the original dict-backed Resource, kept here as the baseline.
+    """
+
+    def __init__(self, resource_id, resource_type, location, is_available=True):
+        self.resource_id = resource_id
+        self.resource_type = resource_type
+        self.location = location
+        self.is_available = is_available
+        self.assigned_to_incident = None
+        self._listeners = []
+
+
+def _measure(build) -> int:
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def run(fleet_size: int, zones: int = 50, seed: int = 5) -> None:
+    rng = random.Random(seed)
+    types = list(ResourceType)
+    locations = [f"Zone {n}" for n in range(1, zones + 1)]
+    rows = [(i, rng.choice(types), rng.choice(locations)) for i in range(fleet_size)]
+
+    layouts = {
+        "dict objects": lambda: [_DictResource(*row) for row in rows],
+        "slots objects": lambda: [Resource(*row) for row in rows],
+        "ResourceTable": lambda: ResourceTable.from_resources(Resource(*row) for row in rows),
+    }
+    for name, build in layouts.items():
+        size = _measure(build)
+        print(f"fleet={fleet_size:>8} | {name:<14} | {size / 2**20:>8.1f} MiB | {size / fleet_size:>6.1f} B/unit")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,70 @@
+# benchmarks/bench_sharded.py
+"""
+Compares allocation throughput of one ResourceManager with zone-sharded worker
+processes on the same synthetic metro workload. Sharding only pays off with at
+least as many free cores as shards.
+
+Run from the project root:
+    python -m benchmarks.bench_sharded --incidents 200000 --shards 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.workload import WorkloadGenerator, WorkloadSpec
+from services.resource_manager import ResourceManager
+from services.sharded_manager import ShardedResourceManager, partition_zones
+from utils.events import NullSink
+
+
+def _batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def run(incidents: int, fleet: int, zones: int, shards: int, batch: int, seed: int) -> float:
+    """
+    :param shards: Number of worker processes; 0 runs a single in-process manager.
+    :return: Incidents allocated per second.
+    """
+    generator = WorkloadGenerator(WorkloadSpec(zones=zones, seed=seed))
+    units = generator.fleet(fleet)
+    stream = generator.incidents(incidents)
+
+    if shards:
+        manager = ShardedResourceManager(partition_zones(zones, shards))
+        manager.add_resources(units)
+    else:
+        manager = ResourceManager(events=NullSink())
+        for unit in units:
+            manager.add_resource(unit)
+
+    start = time.perf_counter()
+    for chunk in _batches(stream, batch):
+        manager.add_incidents(chunk)
+    elapsed = time.perf_counter() - start
+    if shards:
+        manager.close()
+    return incidents / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Single-process vs zone-sharded allocation throughput")
+    parser.add_argument("--incidents", type=int, default=100_000)
+    parser.add_argument("--fleet", type=int, default=50_000)
+    parser.add_argument("--zones", type=int, default=400)
+    parser.add_argument("--shards", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--batch", type=int, default=5000, help="incidents per add_incidents call")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    print(f"cores: {os.cpu_count()}")
+    for shards in [0] + args.shards:
+        throughput = run(args.incidents, args.fleet, args.zones, shards, args.batch, args.seed)
+        label = "single process" if shards == 0 else f"{shards} shards"
+        print(f"{label:<15} | {throughput:>10.0f} incidents/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/bench_simulation.py
+"""
+Replays a synthetic day of incidents through the discrete-event simulator and
+prints the report (response times, queue waits, utilization) as JSON.
+
+Run from the project root:
+    python -m benchmarks.bench_simulation --incidents 250000 --fleet 8000
+    python -m benchmarks.bench_simulation --replay data/incidents.json --fleet 50
+"""
+
+import argparse
+import json
+
+from benchmarks.workload import WorkloadGenerator, WorkloadSpec
+from services.simulator import Simulator
+from utils.persistence import load_data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Discrete-event replay of an incident stream")
+    parser.add_argument("--incidents", type=int, default=100_000, help="synthetic incidents over one day")
+    parser.add_argument("--fleet", type=int, default=4000)
+    parser.add_argument("--zones", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--replay", help="incidents JSON file to replay instead of a synthetic stream")
+    args = parser.parse_args()
+
+    generator = WorkloadGenerator(WorkloadSpec(
+        zones=args.zones, arrival_rate=args.incidents / 86400.0, seed=args.seed
+    ))
+    if args.replay:
+        incidents = load_data(args.replay, "incident")
+        for incident in incidents:
+            incident.allocated_resources = []
+            incident.status = "Pending"
+        start = min(i.timestamp for i in incidents)
+    else:
+        incidents = generator.incidents(args.incidents)
+        start = incidents[0].timestamp if incidents else None
+
+    simulator = Simulator(start=start) if start else Simulator()
+    for resource in generator.fleet(args.fleet):
+        simulator.add_resource(resource)
+    simulator.schedule_incidents(incidents)
+    print(json.dumps(simulator.run(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_spatial_index.py
+"""
+Compares grid k-nearest lookups against a linear scan over a fleet with coordinates,
+and measures the cost of moving units (incremental re-indexing).
+
+Run from the project root:
+    python -m benchmarks.bench_spatial_index
+"""
+
+import random
+import time
+
+from models.enums import ResourceType
+from models.resource import Resource
+from services.spatial_index import SpatialIndex
+from utils.geo import euclidean
+
+
+def _linear_scan(resources, resource_type, point, k):
+    available = [r for r in resources if r.resource_type == resource_type and r.is_available]
+    return sorted(available, key=lambda r: euclidean(r.coordinates, point))[:k]
+
+
+def run(fleet_size: int, lookups: int = 200, k: int = 5, extent: float = 30.0, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    types = list(ResourceType)
+    resources = [
+        Resource(i, rng.choice(types), "Zone 1", coordinates=(rng.uniform(0, extent), rng.uniform(0, extent)))
+        for i in range(fleet_size)
+    ]
+    # About five units of each type per cell
+    index = SpatialIndex(cell_size=extent * (25 / fleet_size) ** 0.5)
+    for resource in resources:
+        index.track(resource)
+
+    queries = [(rng.choice(types), (rng.uniform(0, extent), rng.uniform(0, extent))) for _ in range(lookups)]
+
+    start = time.perf_counter()
+    scanned = [_linear_scan(resources, t, p, k) for t, p in queries]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [[r for _, r in index.k_nearest(t, p, k)] for t, p in queries]
+    index_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for resource in rng.sample(resources, min(lookups, fleet_size)):
+        resource.coordinates = (rng.uniform(0, extent), rng.uniform(0, extent))
+        index.update(resource)
+    move_time = time.perf_counter() - start
+
+    assert scanned == indexed, "Index and scan disagree"
+    print(
+        f"fleet={fleet_size:>7} | scan: {scan_time / lookups * 1e6:>9.1f} us/query | "
+        f"grid: {index_time / lookups * 1e6:>6.1f} us/query | "
+        f"move: {move_time / lookups * 1e6:>5.1f} us | speedup: {scan_time / index_time:>6.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    for size in (1_000, 10_000, 50_000):
+        run(size)
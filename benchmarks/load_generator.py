@@ -0,0 +1,151 @@
+# benchmarks/load_generator.py
+"""
+Load generator for the allocation API server: measures throughput and latency
+percentiles of add_incident requests.
+
+Against a running server (python server.py):
+    python -m benchmarks.load_generator --port 8765 --incidents 20000
+
+Self-contained, with an in-process server on a free port:
+    python -m benchmarks.load_generator --local
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import List
+
+from models.enums import PriorityLevel, ResourceType
+from services.api_server import AllocationServer
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+
+
+async def _connection(host: str, port: int, requests: List[dict], window: int, latencies: List[float]) -> None:
+    """
+    Sends requests over one connection, keeping up to `window` of them in flight.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at = {}
+    slots = asyncio.Semaphore(window)
+
+    async def read_responses() -> None:
+        for _ in range(len(requests)):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent_at.pop(response['id']))
+            slots.release()
+
+    reading = asyncio.ensure_future(read_responses())
+    for request in requests:
+        await slots.acquire()
+        sent_at[request['id']] = time.perf_counter()
+        writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+    await reading
+    writer.close()
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run(
+    host: str,
+    port: int,
+    incidents: int,
+    resources: int,
+    connections: int,
+    window: int,
+    zones: int,
+    seed: int
+) -> dict:
+    """
+    Seeds resources, then sends add_incident requests over several connections.
+
+    :return: Results with 'requests', 'seconds', 'throughput' and latency percentiles in ms.
+    """
+    rng = random.Random(seed)
+    types = [t.value for t in ResourceType]
+    priorities = [p.name for p in PriorityLevel]
+
+    reader, writer = await asyncio.open_connection(host, port)
+    for i in range(resources):
+        writer.write((json.dumps({
+            'id': i, 'op': 'add_resource', 'resource_type': rng.choice(types),
+            'location': f"Zone {rng.randint(1, zones)}"
+        }) + "\n").encode())
+    await writer.drain()
+    for _ in range(resources):
+        await reader.readline()
+    writer.close()
+
+    per_connection = [[] for _ in range(connections)]
+    for i in range(incidents):
+        per_connection[i % connections].append({
+            'id': i, 'op': 'add_incident', 'location': f"Zone {rng.randint(1, zones)}",
+            'emergency_type': "Synthetic", 'priority': rng.choice(priorities),
+            'required_resources': rng.sample(types, rng.randint(1, 2)),
+        })
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _connection(host, port, requests, window, latencies) for requests in per_connection
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000,
+    }
+
+
+async def _run_local(args) -> dict:
+    server = AllocationServer(ResourceManager(events=NullSink()), port=0, batch_size=args.batch_size)
+    await server.start()
+    try:
+        return await run(
+            server.host, server.port, args.incidents, args.resources,
+            args.connections, args.window, args.zones, args.seed
+        )
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load generator for the allocation API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--local", action="store_true", help="start an in-process server on a free port")
+    parser.add_argument("--incidents", type=int, default=20000)
+    parser.add_argument("--resources", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--window", type=int, default=64, help="requests in flight per connection")
+    parser.add_argument("--zones", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=256, help="server batch size (with --local)")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    if args.local:
+        results = asyncio.run(_run_local(args))
+    else:
+        results = asyncio.run(run(
+            args.host, args.port, args.incidents, args.resources,
+            args.connections, args.window, args.zones, args.seed
+        ))
+    print(
+        f"requests: {results['requests']} | time: {results['seconds']:.2f} s | "
+        f"throughput: {results['throughput']:.0f} req/s | "
+        f"p50: {results['p50_ms']:.2f} ms | p99: {results['p99_ms']:.2f} ms | max: {results['max_ms']:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
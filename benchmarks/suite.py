@@ -0,0 +1,200 @@
+# benchmarks/suite.py
+"""
+Benchmark suite over seeded synthetic workloads. For each scale step it measures
+allocate_resources throughput, per-incident allocation latency percentiles,
+generate_summary_report time, save_data/load_data time and peak traced memory,
+and writes the results as JSON so two revisions can be compared.
+
+Run from the project root:
+    python -m benchmarks.suite --scales 1000 10000 --output results.json
+    python -m benchmarks.suite --scales 1000 10000 --compare results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+from benchmarks.workload import WorkloadGenerator, WorkloadSpec
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+from utils.persistence import load_data, save_data
+
+# Metrics where a higher value is better; every other metric is a duration or a size
+HIGHER_IS_BETTER = {"allocate_throughput"}
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def _bench_allocate(spec: WorkloadSpec, incidents: int, fleet: int) -> dict:
+    """
+    One full greedy pass over a backlog of waiting incidents.
+    """
+    generator = WorkloadGenerator(spec)
+    manager = ResourceManager(incremental=False, events=NullSink())
+    # Incidents arrive first so the whole backlog is waiting when units come online
+    manager.add_incidents(generator.incidents(incidents))
+    for resource in generator.fleet(fleet):
+        manager.add_resource(resource)
+
+    start = time.perf_counter()
+    manager.allocate_resources()
+    elapsed = time.perf_counter() - start
+    return {"allocate_seconds": elapsed, "allocate_throughput": incidents / elapsed}
+
+
+def _bench_latency(spec: WorkloadSpec, incidents: int, fleet: int) -> dict:
+    """
+    Streams incidents one at a time into a live manager and times each allocation.
+    Returns the manager's state for the reporting and persistence steps.
+    """
+    generator = WorkloadGenerator(spec)
+    manager = ResourceManager(events=NullSink())
+    for resource in generator.fleet(fleet):
+        manager.add_resource(resource)
+
+    latencies = []
+    clock = time.perf_counter
+    for incident in generator.incidents(incidents):
+        start = clock()
+        manager.add_incident(incident)
+        latencies.append(clock() - start)
+    latencies.sort()
+    results = {
+        "latency_p50_us": _percentile(latencies, 0.50) * 1e6,
+        "latency_p90_us": _percentile(latencies, 0.90) * 1e6,
+        "latency_p99_us": _percentile(latencies, 0.99) * 1e6,
+        "latency_max_us": latencies[-1] * 1e6,
+    }
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager.generate_summary_report()
+    results["report_seconds"] = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        incidents_file = os.path.join(directory, "incidents.json")
+        resources_file = os.path.join(directory, "resources.json")
+        start = time.perf_counter()
+        save_data(incidents_file, manager.get_all_incidents(), "incident")
+        save_data(resources_file, manager.get_all_resources(), "resource")
+        results["save_seconds"] = time.perf_counter() - start
+        results["save_bytes"] = os.path.getsize(incidents_file) + os.path.getsize(resources_file)
+
+        start = time.perf_counter()
+        load_data(incidents_file, "incident")
+        load_data(resources_file, "resource")
+        results["load_seconds"] = time.perf_counter() - start
+    return results
+
+
+def _bench_memory(spec: WorkloadSpec, incidents: int, fleet: int) -> dict:
+    """
+    Peak traced memory while building and allocating the workload. Run separately
+    because tracing slows every allocation down.
+    """
+    tracemalloc.start()
+    generator = WorkloadGenerator(spec)
+    manager = ResourceManager(events=NullSink())
+    for resource in generator.fleet(fleet):
+        manager.add_resource(resource)
+    manager.add_incidents(generator.incidents(incidents))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del manager
+    return {"peak_memory_bytes": peak}
+
+
+def run(scales: List[int], spec: WorkloadSpec, fleet_ratio: float = 0.5) -> dict:
+    """
+    Runs every benchmark at each scale step.
+
+    :param scales: Incident counts to run; the fleet is `fleet_ratio` times as large.
+    :param spec: Workload shape and seed.
+    :return: JSON-serializable results: {'meta': {...}, 'steps': [{'incidents': N, ...}]}
+    """
+    steps = []
+    for incidents in scales:
+        fleet = max(1, int(incidents * fleet_ratio))
+        step = {"incidents": incidents, "fleet": fleet}
+        step.update(_bench_allocate(spec, incidents, fleet))
+        step.update(_bench_latency(spec, incidents, fleet))
+        step.update(_bench_memory(spec, incidents, fleet))
+        steps.append(step)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fleet_ratio": fleet_ratio,
+            "workload": spec.to_dict(),
+        },
+        "steps": steps,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """
+    Lists metrics that got worse than the baseline by more than `threshold`
+    (a fraction, e.g. 0.2 for 20%), matching steps by incident count.
+    """
+    regressions = []
+    previous = {step["incidents"]: step for step in baseline["steps"]}
+    for step in current["steps"]:
+        old = previous.get(step["incidents"])
+        if old is None:
+            continue
+        for metric, value in step.items():
+            before = old.get(metric)
+            if metric in ("incidents", "fleet") or not before:
+                continue
+            change = (value - before) / before
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > threshold:
+                regressions.append(
+                    f"scale={step['incidents']} {metric}: {before:.6g} -> {value:.6g} ({change:+.0%} worse)"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Allocation and persistence benchmark suite")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--fleet-ratio", type=float, default=0.5, help="units per incident")
+    parser.add_argument("--zones", type=int, default=50)
+    parser.add_argument("--arrival-rate", type=float, default=10.0, help="incidents per second")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before flagging")
+    args = parser.parse_args()
+
+    spec = WorkloadSpec(zones=args.zones, arrival_rate=args.arrival_rate, seed=args.seed)
+    results = run(args.scales, spec, args.fleet_ratio)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
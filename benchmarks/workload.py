@@ -0,0 +1,101 @@
+# benchmarks/workload.py
+"""
+Seeded synthetic workloads: fleets and timestamped incident streams built with the
+same factories the application uses, so benchmarks exercise real objects.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from models.enums import ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from utils.factory import IncidentFactory, ResourceFactory
+
+
+class WorkloadSpec:
+    """
+    Shape of a synthetic workload. The same spec and seed always produce the same
+    fleet and incident stream (IDs aside, which come from the factory counters).
+    """
+
+    def __init__(
+        self,
+        zones: int = 50,
+        type_mix: Optional[Dict[str, float]] = None,
+        priority_mix: Optional[Dict[str, float]] = None,
+        arrival_rate: float = 10.0,
+        max_requirements: int = 2,
+        seed: int = 11
+    ):
+        """
+        :param zones: Number of zones ('Zone 1' .. 'Zone N') units and incidents are spread over.
+        :param type_mix: Resource type value -> relative weight, used for units and requirements.
+                         Defaults to an even mix of every ResourceType.
+        :param priority_mix: Priority name -> relative weight. Defaults to mostly low-priority calls.
+        :param arrival_rate: Mean incidents per second; gaps between timestamps are exponential.
+        :param max_requirements: Maximum number of distinct unit types an incident requires.
+        :param seed: Seed for the random generator.
+        """
+        self.zones = zones
+        self.type_mix = type_mix or {t.value: 1.0 for t in ResourceType}
+        self.priority_mix = priority_mix or {"HIGH": 0.2, "MEDIUM": 0.3, "LOW": 0.5}
+        self.arrival_rate = arrival_rate
+        self.max_requirements = max_requirements
+        self.seed = seed
+
+    def to_dict(self) -> dict:
+        return {
+            'zones': self.zones,
+            'type_mix': self.type_mix,
+            'priority_mix': self.priority_mix,
+            'arrival_rate': self.arrival_rate,
+            'max_requirements': self.max_requirements,
+            'seed': self.seed,
+        }
+
+
+class WorkloadGenerator:
+    """
+    Generates fleets and incident streams for a WorkloadSpec.
+    """
+
+    def __init__(self, spec: WorkloadSpec):
+        self.spec = spec
+        self._rng = random.Random(spec.seed)
+        self._types = list(spec.type_mix)
+        self._type_weights = list(spec.type_mix.values())
+        self._priorities = list(spec.priority_mix)
+        self._priority_weights = list(spec.priority_mix.values())
+
+    def _zone(self) -> str:
+        return f"Zone {self._rng.randint(1, self.spec.zones)}"
+
+    def fleet(self, size: int) -> List[Resource]:
+        """
+        Creates `size` available units with types drawn from the type mix.
+        """
+        types = self._rng.choices(self._types, self._type_weights, k=size)
+        return [ResourceFactory.create_resource(t, self._zone()) for t in types]
+
+    def incidents(self, count: int, start: Optional[datetime] = None) -> List[Incident]:
+        """
+        Creates `count` incidents in arrival order, with timestamps spaced by
+        exponential gaps at the spec's arrival rate.
+
+        :param start: Timestamp of the stream's origin. Defaults to a fixed date so
+                      repeated runs are identical.
+        """
+        rng = self._rng
+        clock = start or datetime(2024, 1, 1)
+        stream = []
+        for _ in range(count):
+            clock += timedelta(seconds=rng.expovariate(self.spec.arrival_rate))
+            required = set()
+            for _ in range(rng.randint(1, self.spec.max_requirements)):
+                required.add(rng.choices(self._types, self._type_weights)[0])
+            priority = rng.choices(self._priorities, self._priority_weights)[0]
+            stream.append(IncidentFactory.create_incident(self._zone(), "Synthetic", priority, sorted(required), clock))
+        return stream
+
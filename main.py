@@ -1,9 +1,16 @@
 # main.py
 
+import os
+
 from models.enums import ResourceType
 from services.resource_manager import ResourceManager
 from utils.factory import IncidentFactory, ResourceFactory
-from utils.persistence import save_data, load_data
+from utils.journal import Journal
+from utils.persistence import load_data
+from utils.travel_times import GraphDistanceProvider
+
+ZONE_GRAPH_FILE = "data/zone_graph.json"  # Optional road network for travel-time proximity
+JOURNAL_DIR = "data/journal"  # Snapshot + append-only journal of every state change
 
 
 def display_main_menu() -> None:
@@ -33,7 +40,8 @@ def add_incident_ui(resource_manager: ResourceManager) -> None:
         print("Available Resource Types:")
         for rt in ResourceType:
             print(f" - {rt.value}")
-        required = input("Enter required resources (comma-separated, e.g., Ambulance,Fire Truck): ")
+        required = input("Enter required resources (comma-separated, repeat a type for more units, "
+                         "e.g., Ambulance,Ambulance,Fire Truck): ")
         required_resources = [r.strip().title() for r in required.split(",")]
 
         incident = IncidentFactory.create_incident(location, emergency_type, priority, required_resources)
@@ -81,13 +89,10 @@ def view_resources(resource_manager: ResourceManager) -> None:
 def resolve_incident_ui(resource_manager: ResourceManager) -> None:
     try:
         incident_id = int(input("Enter Incident ID to resolve: "))
-        for incident in resource_manager.get_all_incidents():
-            if incident.incident_id == incident_id:
-                incident.update_status("Resolved")
-                print(f"[INFO] Incident {incident_id} marked as resolved.")
-                resource_manager.release_resources_from_resolved()
-                return
-        print("[WARN] Incident ID not found.")
+        if resource_manager.resolve_incident(incident_id) is None:
+            print("[WARN] Incident ID not found.")
+            return
+        print(f"[INFO] Incident {incident_id} marked as resolved.")
     except Exception as e:
         print(f"[ERROR] {e}")
 
@@ -95,17 +100,34 @@ def resolve_incident_ui(resource_manager: ResourceManager) -> None:
 def run():
     # === AUTO-LOAD ON STARTUP ===
     print("[SYSTEM] Loading previous state...")
-    resource_manager = ResourceManager()
-
-    # Load and inject data
-    incidents = load_data("data/incidents.json", "incident")
-    resources = load_data("data/resources.json", "resource")
-    for incident in incidents:
-        resource_manager.add_incident(incident)
-    for resource in resources:
-        resource_manager.add_resource(resource)
-
-    print(f"[SYSTEM] Loaded {len(incidents)} incidents and {len(resources)} resources.")
+    distances = None
+    if os.path.exists(ZONE_GRAPH_FILE):
+        distances = GraphDistanceProvider.from_file(ZONE_GRAPH_FILE)
+        print(f"[SYSTEM] Using road network from '{ZONE_GRAPH_FILE}'.")
+    journal = Journal(JOURNAL_DIR, binary=True)
+    resource_manager = ResourceManager(distances=distances, journal=journal)
+
+    # Load and inject data: the journal is the latest state; JSON files seed it on first run
+    seeded = not journal.exists()
+    if seeded:
+        incidents = load_data("data/incidents.json", "incident")
+        resources = load_data("data/resources.json", "resource")
+    else:
+        incidents, resources = journal.load()
+    history = journal.history  # Resolved incidents, decoded only when listed or reported
+    resource_manager.bulk_load(incidents, resources, history)
+    # Restored items are not journaled, so seeded state needs a first snapshot; a journal
+    # that already holds the state is only compacted once enough records piled up
+    if seeded or journal.compaction_due:
+        journal.compact(resource_manager.incidents, resource_manager.get_all_resources(), history)
+    last_incident_id = max((i.incident_id for i in incidents), default=0)
+    if history:
+        last_incident_id = max(last_incident_id, max(history.incident_ids()))
+    IncidentFactory.skip_past(last_incident_id)
+    ResourceFactory.skip_past(max((r.resource_id for r in resources), default=0))
+
+    total_incidents = len(incidents) + (len(history) if history else 0)
+    print(f"[SYSTEM] Loaded {total_incidents} incidents and {len(resources)} resources.")
 
     while True:
         display_main_menu()
@@ -136,9 +158,9 @@ def run():
                 priority_filter=priority or None
             )
         elif choice == "10":
-            print("[SYSTEM] Saving system state...")
-            save_data("data/incidents.json", resource_manager.get_all_incidents(), "incident")
-            save_data("data/resources.json", resource_manager.get_all_resources(), "resource")
+            # Every change is already in the journal, so exiting only closes it; the resolved
+            # history is never decoded just to rewrite the legacy JSON files
+            journal.close()
             print("Exiting application. Goodbye!")
             break
         else:
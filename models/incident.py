@@ -1,22 +1,120 @@
 # models/incident.py
 
-from models.enums import PriorityLevel
-from typing import List
+from models.enums import PriorityLevel, ResourceType
+from utils.zones import ZONES
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from datetime import datetime
 
 
+class AllocatedResources(list):
+    """
+    List of the units attached to an incident that also keeps, per resource type,
+    how many are attached and how many required units are still missing in total.
+    Every mutation updates the counts, so "what is still needed" is answered without
+    scanning the list.
+    """
+
+    __slots__ = ("_required", "_held", "missing")
+
+    def __init__(self, required: Dict[str, int], resources: Iterable = ()):
+        """
+        :param required: The incident's required units per type string (shared, not copied).
+        :param resources: Units already attached.
+        """
+        super().__init__(resources)
+        self._recount(required)
+
+    def __reduce_ex__(self, protocol):
+        # Rebuild through __init__ so the counts are recomputed from the restored units;
+        # the default list protocol would re-append them before the counts exist
+        return type(self), (self._required, list(self))
+
+    def held(self, resource_type_str: str) -> int:
+        """
+        Number of attached units of a type.
+        """
+        return self._held.get(resource_type_str, 0)
+
+    def append(self, resource) -> None:
+        super().append(resource)
+        self._added(resource)
+
+    def extend(self, resources: Iterable) -> None:
+        for resource in resources:
+            self.append(resource)
+
+    def __iadd__(self, resources: Iterable) -> "AllocatedResources":
+        self.extend(resources)
+        return self
+
+    def insert(self, index: int, resource) -> None:
+        super().insert(index, resource)
+        self._added(resource)
+
+    def remove(self, resource) -> None:
+        super().remove(resource)
+        self._removed(resource)
+
+    def pop(self, index: int = -1):
+        resource = super().pop(index)
+        self._removed(resource)
+        return resource
+
+    def clear(self) -> None:
+        super().clear()
+        self._held = {}
+        self.missing = sum(self._required.values())
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._recount(self._required)
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._recount(self._required)
+
+    def _recount(self, required: Dict[str, int]) -> None:
+        self._required = required
+        self._held: Dict[str, int] = {}
+        self.missing = sum(required.values())
+        for resource in self:
+            self._added(resource)
+
+    def _added(self, resource) -> None:
+        key = resource.resource_type.value
+        held = self._held.get(key, 0) + 1
+        self._held[key] = held
+        if held <= self._required.get(key, 0):
+            self.missing -= 1
+
+    def _removed(self, resource) -> None:
+        key = resource.resource_type.value
+        held = self._held[key]
+        self._held[key] = held - 1
+        if held <= self._required.get(key, 0):
+            self.missing += 1
+
+
 class Incident:
     """
     Represents an emergency incident that requires one or more resources.
+    Uses __slots__ to keep per-incident memory low when a long history is kept in process.
     """
 
+    __slots__ = (
+        "incident_id", "_location", "zone_id", "emergency_type", "priority", "_required",
+        "requirements", "_allocated", "status", "timestamp", "coordinates", "_listeners"
+    )
+
     def __init__(
         self,
         incident_id: int,
         location: str,
         emergency_type: str,
         priority: PriorityLevel,
-        required_resources: List[str]
+        required_resources: Union[List[str], Mapping[str, int]],
+        timestamp: Optional[datetime] = None,
+        coordinates: Optional[Tuple[float, float]] = None
     ):
         """
         Initializes a new incident.
@@ -25,24 +123,121 @@ class Incident:
         :param location: A string representing the location (e.g., 'Zone 1').
         :param emergency_type: Description of the type of emergency (e.g., 'Fire').
         :param priority: PriorityLevel enum indicating the urgency of the incident.
-        :param required_resources: List of resource types required (as strings).
+        :param required_resources: Resource types required (as strings), one entry per unit
+                                   (e.g., ['Ambulance', 'Ambulance']), or a mapping of type
+                                   to unit count (e.g., {'Ambulance': 2}).
+        :param timestamp: When the incident was reported. Defaults to now; simulations and
+                          replays pass their own (virtual) time.
+        :param coordinates: Optional planar (x, y) position of the incident. Without it
+                            the incident is placed at its zone's centroid.
         """
         self.incident_id = incident_id
-        self.location = location
+        self.location = location  # Also interns the zone id (see the location property)
         self.emergency_type = emergency_type
         self.priority = priority
-        self.required_resources = required_resources
-        self.allocated_resources = []  # Stores resources assigned to this incident
+        self._allocated = AllocatedResources({})  # Stores resources assigned to this incident
+        self.required_resources = required_resources  # Also sets requirements (see the property)
         self.status = "Pending"  # Can be 'Pending', 'In Progress', 'Resolved'
-        self.timestamp = datetime.now() #  When the incident was created
+        self.timestamp = datetime.now() if timestamp is None else timestamp  # When the incident was reported
+        self.coordinates = coordinates
+        self._listeners: Tuple[Callable[["Incident", str], None], ...] = ()  # Notified on status changes
+
+    def add_listener(self, listener: Callable[["Incident", str], None]) -> None:
+        """
+        Registers a callback invoked whenever the incident's status changes.
+
+        :param listener: Callable receiving this incident and its previous status.
+        """
+        self._listeners += (listener,)
+
+    @property
+    def location(self) -> str:
+        """
+        The location string (e.g., 'Zone 1').
+        """
+        return self._location
+
+    @location.setter
+    def location(self, value: str) -> None:
+        """
+        Sets the location and refreshes the interned zone id used for distance lookups.
+        """
+        self._location = value
+        self.zone_id = ZONES.intern(value)
+
+    @property
+    def required_resources(self) -> List[str]:
+        """
+        The required resource types, one entry per unit (e.g., ['Ambulance', 'Ambulance']).
+        """
+        return self._required
+
+    @required_resources.setter
+    def required_resources(self, value: Union[List[str], Mapping[str, int]]) -> None:
+        """
+        Sets the requirements from a list of type strings or a type -> count mapping,
+        and recounts what is still missing.
+        """
+        if isinstance(value, Mapping):
+            requirements = {
+                (t.value if isinstance(t, ResourceType) else t): count
+                for t, count in value.items() if count > 0
+            }
+            self._required = [t for t, count in requirements.items() for _ in range(count)]
+        else:
+            requirements = {}
+            for t in value:
+                requirements[t] = requirements.get(t, 0) + 1
+            self._required = list(value)
+        self.requirements: Dict[str, int] = requirements  # Units required per type string
+        self._allocated._recount(requirements)
+
+    @property
+    def allocated_resources(self) -> AllocatedResources:
+        """
+        The units attached to this incident.
+        """
+        return self._allocated
+
+    @allocated_resources.setter
+    def allocated_resources(self, resources: Iterable) -> None:
+        """
+        Replaces the attached units, recounting what is still missing.
+        """
+        self._allocated = AllocatedResources(self.requirements, resources)
+
+    def outstanding(self, resource_type_str: str) -> int:
+        """
+        Number of units of a type still missing, in constant time.
+
+        :param resource_type_str: Resource type as a string (e.g., 'Ambulance').
+        """
+        return max(0, self.requirements.get(resource_type_str, 0) - self._allocated.held(resource_type_str))
+
+    @property
+    def outstanding_count(self) -> int:
+        """
+        Total number of required units still missing, in constant time.
+        """
+        return self._allocated.missing
+
+    def needs(self) -> Dict[str, int]:
+        """
+        Returns the missing units per type string, in requirement order. Costs one
+        step per required type, not per attached unit.
+        """
+        if not self._allocated.missing:
+            return {}
+        held = self._allocated.held
+        return {t: count - held(t) for t, count in self.requirements.items() if count > held(t)}
 
     def is_fulfilled(self) -> bool:
         """
-        Checks whether all required resources have been allocated.
+        Checks whether every required unit has been allocated, in constant time.
 
         :return: True if all resources are allocated, False otherwise.
         """
-        return len(self.allocated_resources) >= len(self.required_resources)
+        return not self._allocated.missing
 
     def update_status(self, new_status: str) -> None:
         """
@@ -50,7 +245,11 @@ class Incident:
 
         :param new_status: A new status string ('Pending', 'In Progress', 'Resolved').
         """
+        old_status = self.status
         self.status = new_status
+        if new_status != old_status:
+            for listener in self._listeners:
+                listener(self, old_status)
 
     def __str__(self) -> str:
         """
@@ -1,19 +1,29 @@
 # models/resource.py
 
+from typing import Callable, Optional, Tuple
+
 from models.enums import ResourceType
+from utils.zones import ZONES
 
 
 class Resource:
     """
     Represents an emergency response resource such as an ambulance or medical team.
+    Uses __slots__ to keep per-unit memory low at fleet scale.
     """
 
+    __slots__ = (
+        "resource_id", "resource_type", "_location", "zone_id", "coordinates",
+        "is_available", "assigned_to_incident", "_listeners"
+    )
+
     def __init__(
         self,
         resource_id: int,
         resource_type: ResourceType,
         location: str,
-        is_available: bool = True
+        is_available: bool = True,
+        coordinates: Optional[Tuple[float, float]] = None
     ):
         """
         Initializes a new resource.
@@ -22,12 +32,41 @@ class Resource:
         :param resource_type: Type of the resource (e.g., ambulance, fire truck).
         :param location: The current location of the resource (e.g., 'Zone 1').
         :param is_available: Availability status of the resource.
+        :param coordinates: Optional planar (x, y) position, e.g. from GPS via
+                            utils.geo.project_latlon. Without it the unit is placed
+                            at its zone's centroid.
         """
         self.resource_id = resource_id
         self.resource_type = resource_type
-        self.location = location
+        self.location = location  # Also interns the zone id (see the location property)
+        self.coordinates = coordinates
         self.is_available = is_available
         self.assigned_to_incident = None  # Track incident ID if assigned
+        # Notified on availability changes; a tuple is smaller than a list and rarely grows
+        self._listeners: Tuple[Callable[["Resource"], None], ...] = ()
+
+    def add_listener(self, listener: Callable[["Resource"], None]) -> None:
+        """
+        Registers a callback invoked whenever the resource is assigned or released.
+
+        :param listener: Callable receiving this resource.
+        """
+        self._listeners += (listener,)
+
+    @property
+    def location(self) -> str:
+        """
+        The location string (e.g., 'Zone 1').
+        """
+        return self._location
+
+    @location.setter
+    def location(self, value: str) -> None:
+        """
+        Sets the location and refreshes the interned zone id used for distance lookups.
+        """
+        self._location = value
+        self.zone_id = ZONES.intern(value)
 
     def assign_to_incident(self, incident_id: int) -> None:
         """
@@ -37,6 +76,7 @@ class Resource:
         """
         self.is_available = False
         self.assigned_to_incident = incident_id
+        self._notify_listeners()
 
     def release(self) -> None:
         """
@@ -44,6 +84,14 @@ class Resource:
         """
         self.is_available = True
         self.assigned_to_incident = None
+        self._notify_listeners()
+
+    def _notify_listeners(self) -> None:
+        """
+        Informs registered listeners (e.g., availability indexes) of a state change.
+        """
+        for listener in self._listeners:
+            listener(self)
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,234 @@
+# models/tables.py
+
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+
+RESOURCE_TYPES: List[ResourceType] = list(ResourceType)  # Type code -> ResourceType
+TYPE_CODES: Dict[ResourceType, int] = {t: code for code, t in enumerate(RESOURCE_TYPES)}
+NO_INCIDENT = -1  # Stored in ResourceTable.assigned when a unit is unassigned
+
+
+class StringTable:
+    """
+    Interns repeated strings (locations, emergency types, statuses) into integer ids.
+    """
+
+    def __init__(self, strings: Iterable[str] = ()):
+        """
+        :param strings: Initial strings, assigned ids in order.
+        """
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for value in strings:
+            self.intern(value)
+
+    def intern(self, value: str) -> int:
+        """
+        Returns the id of a string, adding it on first sight.
+        """
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(value)
+            self._ids[value] = string_id
+        return string_id
+
+    def __getitem__(self, string_id: int) -> str:
+        return self.strings[string_id]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class ResourceTable:
+    """
+    Columnar, array-backed storage for resources.
+
+    One typed array per field keeps a fleet of millions of units in a few bytes
+    each, versus a full object per unit. Rows are materialized as Resource objects
+    only when asked for, so the manager and persistence can stream from a table.
+    """
+
+    def __init__(self, strings: Optional[StringTable] = None):
+        """
+        :param strings: String table for locations; shared with an IncidentTable if given.
+        """
+        self.strings = StringTable() if strings is None else strings
+        self.ids = array('q')
+        self.type_codes = array('b')
+        self.locations = array('i')  # String table ids
+        self.zone_ids = array('i')
+        self.available = array('b')
+        self.assigned = array('q')  # Incident id or NO_INCIDENT
+
+    @classmethod
+    def from_resources(cls, resources: Iterable[Resource], strings: Optional[StringTable] = None) -> "ResourceTable":
+        """
+        Builds a table from Resource objects.
+        """
+        table = cls(strings)
+        for resource in resources:
+            table.append(resource)
+        return table
+
+    def append(self, resource: Resource) -> int:
+        """
+        Adds a resource as a new row.
+
+        :return: Row number of the resource.
+        """
+        self.ids.append(resource.resource_id)
+        self.type_codes.append(TYPE_CODES[resource.resource_type])
+        self.locations.append(self.strings.intern(resource.location))
+        self.zone_ids.append(resource.zone_id)
+        self.available.append(1 if resource.is_available else 0)
+        assigned = resource.assigned_to_incident
+        self.assigned.append(NO_INCIDENT if assigned is None else assigned)
+        return len(self.ids) - 1
+
+    def resource(self, row: int) -> Resource:
+        """
+        Materializes one row as a Resource object.
+        """
+        resource = Resource(
+            resource_id=self.ids[row],
+            resource_type=RESOURCE_TYPES[self.type_codes[row]],
+            location=self.strings[self.locations[row]],
+            is_available=bool(self.available[row])
+        )
+        assigned = self.assigned[row]
+        resource.assigned_to_incident = None if assigned == NO_INCIDENT else assigned
+        return resource
+
+    def nbytes(self) -> int:
+        """
+        Returns the bytes held by the column arrays (excluding the string table).
+        """
+        return sum(column.itemsize * len(column) for column in (
+            self.ids, self.type_codes, self.locations, self.zone_ids, self.available, self.assigned
+        ))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Resource]:
+        for row in range(len(self.ids)):
+            yield self.resource(row)
+
+
+class IncidentTable:
+    """
+    Columnar, array-backed storage for incidents.
+
+    Timestamps are stored as epoch seconds, strings go through a shared string
+    table, and the variable-length required and allocated lists are flattened
+    into one array each with per-row offsets.
+    """
+
+    def __init__(self, strings: Optional[StringTable] = None):
+        """
+        :param strings: String table for locations, types and statuses.
+        """
+        self.strings = StringTable() if strings is None else strings
+        self.ids = array('q')
+        self.locations = array('i')
+        self.zone_ids = array('i')
+        self.emergency_types = array('i')
+        self.priorities = array('b')  # PriorityLevel values
+        self.statuses = array('i')
+        self.timestamps = array('d')  # Epoch seconds
+        self.required = array('i')  # Flattened string table ids
+        self.required_offsets = array('q', [0])
+        self.allocated = array('q')  # Flattened resource ids
+        self.allocated_offsets = array('q', [0])
+
+    @classmethod
+    def from_incidents(cls, incidents: Iterable[Incident], strings: Optional[StringTable] = None) -> "IncidentTable":
+        """
+        Builds a table from Incident objects.
+        """
+        table = cls(strings)
+        for incident in incidents:
+            table.append(incident)
+        return table
+
+    def append(self, incident: Incident) -> int:
+        """
+        Adds an incident as a new row.
+
+        :return: Row number of the incident.
+        """
+        intern = self.strings.intern
+        self.ids.append(incident.incident_id)
+        self.locations.append(intern(incident.location))
+        self.zone_ids.append(incident.zone_id)
+        self.emergency_types.append(intern(incident.emergency_type))
+        self.priorities.append(incident.priority.value)
+        self.statuses.append(intern(incident.status))
+        self.timestamps.append(incident.timestamp.timestamp())
+        self.required.extend(intern(name) for name in incident.required_resources)
+        self.required_offsets.append(len(self.required))
+        self.allocated.extend(r.resource_id for r in incident.allocated_resources)
+        self.allocated_offsets.append(len(self.allocated))
+        return len(self.ids) - 1
+
+    def status(self, row: int) -> str:
+        """
+        Returns the status of a row without materializing the incident.
+        """
+        return self.strings[self.statuses[row]]
+
+    def set_status(self, row: int, status: str) -> None:
+        """
+        Updates the status of a row in place.
+        """
+        self.statuses[row] = self.strings.intern(status)
+
+    def incident(self, row: int, resources_by_id: Optional[Dict[int, Resource]] = None) -> Incident:
+        """
+        Materializes one row as an Incident object.
+
+        :param row: Row number.
+        :param resources_by_id: Optional lookup used to restore allocated resources.
+        :return: Incident object.
+        """
+        incident = Incident(
+            incident_id=self.ids[row],
+            location=self.strings[self.locations[row]],
+            emergency_type=self.strings[self.emergency_types[row]],
+            priority=PriorityLevel(self.priorities[row]),
+            required_resources=[
+                self.strings[i] for i in self.required[self.required_offsets[row]:self.required_offsets[row + 1]]
+            ]
+        )
+        incident.status = self.strings[self.statuses[row]]
+        incident.timestamp = datetime.fromtimestamp(self.timestamps[row])
+        if resources_by_id is not None:
+            incident.allocated_resources = [
+                resources_by_id[rid]
+                for rid in self.allocated[self.allocated_offsets[row]:self.allocated_offsets[row + 1]]
+                if rid in resources_by_id
+            ]
+        return incident
+
+    def nbytes(self) -> int:
+        """
+        Returns the bytes held by the column arrays (excluding the string table).
+        """
+        return sum(column.itemsize * len(column) for column in (
+            self.ids, self.locations, self.zone_ids, self.emergency_types, self.priorities,
+            self.statuses, self.timestamps, self.required, self.required_offsets,
+            self.allocated, self.allocated_offsets
+        ))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Incident]:
+        for row in range(len(self.ids)):
+            yield self.incident(row)
@@ -0,0 +1,92 @@
+# server.py
+"""
+Runs the allocation API server (line-delimited JSON over TCP).
+
+    python server.py --port 8765 --journal data/journal --store data/state.db
+
+See services/api_server.py for the request format, and
+benchmarks/load_generator.py for a client that measures throughput and latency.
+"""
+
+import argparse
+import asyncio
+
+from services.api_server import AllocationServer
+from services.resource_manager import ResourceManager
+from utils.events import EventLevel, NullSink, StreamSink
+from utils.factory import IncidentFactory, ResourceFactory
+from utils.journal import Journal
+from utils.metrics import Metrics, write_prometheus
+from utils.sqlite_store import SQLiteStore
+
+
+def build_manager(
+    journal_dir: str = None,
+    verbose: bool = False,
+    metrics: bool = False,
+    store_path: str = None
+) -> ResourceManager:
+    """
+    Creates the manager, restoring state from a journal directory if one is given.
+    With a store path, every change is also written to that SQLite database.
+    """
+    events = StreamSink(level=EventLevel.INFO, buffer_size=1000) if verbose else NullSink()
+    journal = Journal(journal_dir, binary=True) if journal_dir else None
+    store = SQLiteStore(store_path) if store_path else None
+    manager = ResourceManager(
+        events=events, journal=journal, store=store, metrics=Metrics() if metrics else None
+    )
+    if journal and journal.exists():
+        incidents, resources = journal.load()
+        history = journal.history
+        manager.bulk_load(incidents, resources, history)
+        last_incident_id = max((i.incident_id for i in incidents), default=0)
+        if history:
+            last_incident_id = max(last_incident_id, max(history.incident_ids()))
+        IncidentFactory.skip_past(last_incident_id)
+        ResourceFactory.skip_past(max((r.resource_id for r in resources), default=0))
+    return manager
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Emergency resource allocation API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--batch-size", type=int, default=256, help="incidents per allocation step")
+    parser.add_argument("--batch-delay", type=float, default=0.002, help="seconds to wait for a fuller batch")
+    parser.add_argument("--journal", help="journal directory to restore from and persist to")
+    parser.add_argument("--store", help="SQLite database kept up to date with every change")
+    parser.add_argument("--verbose", action="store_true", help="print allocation events")
+    parser.add_argument("--metrics-file", help="write Prometheus text-format metrics to this file")
+    parser.add_argument("--metrics-interval", type=float, default=15.0, help="seconds between metrics writes")
+    args = parser.parse_args()
+
+    manager = build_manager(args.journal, args.verbose, metrics=bool(args.metrics_file), store_path=args.store)
+    server = AllocationServer(manager, args.host, args.port, args.batch_size, args.batch_delay)
+
+    async def export_metrics() -> None:
+        while True:
+            await asyncio.sleep(args.metrics_interval)
+            write_prometheus(args.metrics_file, manager.metrics())
+
+    async def serve() -> None:
+        await server.start()
+        print(f"[SYSTEM] Listening on {server.host}:{server.port}")
+        if args.metrics_file:
+            asyncio.ensure_future(export_metrics())
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.events.close()
+        if manager.journal:
+            manager.journal.close()
+        if manager.store:
+            manager.store.close()
+
+
+if __name__ == "__main__":
+    main()
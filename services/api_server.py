@@ -0,0 +1,190 @@
+# services/api_server.py
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Tuple, Union
+
+from models.incident import Incident
+from services.resource_manager import ResourceManager
+from utils.factory import IncidentFactory, ResourceFactory
+
+_log = logging.getLogger(__name__)
+
+
+class AllocationServer:
+    """
+    Line-delimited JSON API for a ResourceManager, served with asyncio.
+
+    Each request is one JSON object per line with an "op" field and an optional
+    "id" that is echoed back in its response line, so clients can pipeline:
+
+        {"id": 1, "op": "add_incident", "location": "Zone 3", "emergency_type": "Fire",
+         "priority": "High", "required_resources": ["Fire Truck"]}
+        {"id": 2, "op": "add_resource", "resource_type": "Ambulance", "location": "Zone 1"}
+        {"id": 3, "op": "resolve", "incident_ids": [7, 8]}
+        {"id": 4, "op": "summary", "status": "Pending", "zone": null, "priority": null}
+
+    "required_resources" lists one type per unit, or maps types to unit counts
+    (e.g., {"Ambulance": 2, "Police Unit": 1}).
+
+    Incoming incidents are collected into micro-batches that are allocated with a
+    single ResourceManager.add_incidents call, either when `batch_size` incidents
+    are waiting or `batch_delay` seconds after the first one arrived. Other
+    operations first flush the pending batch, so requests take effect in arrival
+    order. All manager calls run on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        manager: ResourceManager,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        batch_size: int = 256,
+        batch_delay: float = 0.002
+    ):
+        """
+        :param manager: ResourceManager to expose.
+        :param host: Interface to listen on.
+        :param port: TCP port to listen on (0 picks a free port).
+        :param batch_size: Number of pending incidents that triggers an immediate allocation step.
+        :param batch_delay: Seconds to wait for more incidents before allocating a partial batch.
+        """
+        self.manager = manager
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self._pending: List[Tuple[Incident, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """
+        Starts listening; `port` is updated to the bound port.
+        """
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """
+        Starts the server (if needed) and serves until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Allocates any pending batch and stops listening.
+        """
+        self._flush()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                # Requests are handled concurrently so a pipelining client fills a batch
+                task = asyncio.ensure_future(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            response = await self.handle(request)
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}  # Malformed request
+        except Exception as e:
+            # Anything else (e.g. a journal OSError) is a server fault; the client still gets a reply
+            _log.exception("Request failed: %r", line)
+            response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        response['id'] = request_id
+        if not writer.is_closing():
+            writer.write((json.dumps(response) + "\n").encode())
+            await writer.drain()
+
+    async def handle(self, request: dict) -> dict:
+        """
+        Executes one API request.
+
+        :param request: Decoded request object with an "op" field.
+        :return: Response object with "ok" and op-specific fields.
+        :raises KeyError, ValueError: For malformed requests or unknown ops.
+        """
+        op = request['op']
+        if op == 'add_incident':
+            incident = IncidentFactory.create_incident(
+                request['location'], request.get('emergency_type', ''),
+                request['priority'], _requirements(request['required_resources'])
+            )
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((incident, future))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(self.batch_delay, self._flush)
+            return await future
+
+        self._flush()
+        if op == 'add_resource':
+            resource = ResourceFactory.create_resource(request['resource_type'], request['location'])
+            self.manager.add_resource(resource)
+            return {'ok': True, 'resource_id': resource.resource_id, 'available': resource.is_available}
+        if op == 'resolve':
+            ids = request['incident_ids'] if 'incident_ids' in request else [request['incident_id']]
+            resolved = self.manager.resolve_incidents(ids)
+            return {'ok': True, 'resolved': [i.incident_id for i in resolved]}
+        if op == 'summary':
+            summary = self.manager.summary_counts(request.get('status'), request.get('zone'), request.get('priority'))
+            return {'ok': True, 'summary': summary}
+        raise ValueError(f"Unknown op: {op}")
+
+    def _flush(self) -> None:
+        """
+        Allocates the pending micro-batch in one step and answers its requests.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            self.manager.add_incidents([incident for incident, _ in batch])
+        except Exception as e:
+            _log.exception("Allocating a batch of %d incidents failed", len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_result({'ok': False, 'error': f"{type(e).__name__}: {e}"})
+            return
+        for incident, future in batch:
+            if not future.done():
+                future.set_result({
+                    'ok': True,
+                    'incident_id': incident.incident_id,
+                    'status': incident.status,
+                    'allocated': [r.resource_id for r in incident.allocated_resources],
+                })
+
+
+def _requirements(value) -> Union[List[str], Dict[str, int]]:
+    """
+    Decodes required_resources: a list of type strings or an object of type -> unit count.
+    """
+    return {str(t): int(count) for t, count in value.items()} if isinstance(value, dict) else list(value)
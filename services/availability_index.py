@@ -0,0 +1,218 @@
+# services/availability_index.py
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Tuple
+
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from utils.zones import ZONES
+
+
+class AvailabilityIndex:
+    """
+    Index of available resources bucketed by resource type and zone id.
+
+    Each bucket holds the insertion sequence numbers of its free units in sorted
+    order. Finding the closest unit walks zones outward from the origin using the
+    distance provider's precomputed ordering and stops at the first occupied
+    distance, instead of scanning the whole fleet. Ties are broken by insertion
+    order, matching a linear scan over the manager's resource list.
+    """
+
+    def __init__(self, distances=ZONES):
+        """
+        Initializes an empty index.
+
+        :param distances: Distance provider (ZoneRegistry or GraphDistanceProvider).
+        """
+        self._distances = distances
+        self._buckets: Dict[ResourceType, Dict[int, List[int]]] = {}
+        self._by_seq: Dict[int, Resource] = {}
+        self._entries: Dict[int, int] = {}  # id(resource) -> seq
+        self._indexed: Dict[int, int] = {}  # id(resource) -> zone id of its bucket
+        self._next_seq = 0
+        self.search_stats = None  # Optional Metrics told how many candidates each search examined
+
+    def track(self, resource: Resource) -> None:
+        """
+        Starts tracking a resource and subscribes to its availability changes.
+
+        :param resource: Resource to index.
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[id(resource)] = seq
+        self._by_seq[seq] = resource
+        resource.add_listener(self.update)
+        self.update(resource)
+
+    def update(self, resource: Resource) -> None:
+        """
+        Re-syncs a tracked resource with the index after its availability or zone changed.
+
+        :param resource: Resource whose state changed.
+        """
+        key = id(resource)
+        if key not in self._entries:
+            return
+        indexed_zone = self._indexed.get(key)
+        if indexed_zone is not None and (not resource.is_available or indexed_zone != resource.zone_id):
+            self._remove(resource, indexed_zone)
+            indexed_zone = None
+        if resource.is_available and indexed_zone is None:
+            self._insert(resource)
+
+    def nearest(self, resource_type: ResourceType, zone_id: int) -> Optional[Resource]:
+        """
+        Finds the closest available resource of a type.
+
+        :param resource_type: Required ResourceType.
+        :param zone_id: Interned zone id to measure proximity from.
+        :return: Closest available Resource or None.
+        """
+        buckets = self._buckets.get(resource_type)
+        best = _nearest_in_buckets(buckets, zone_id, self._distances)
+        if self.search_stats is not None:
+            self.search_stats.record_candidates(_candidates_scanned(buckets, zone_id, best, self._distances))
+        return self._by_seq[best[1]] if best else None
+
+    def free_units(self, resource_type: ResourceType) -> Dict[int, List[Resource]]:
+        """
+        Returns the free units of a type grouped by zone id, each group in insertion order.
+
+        :param resource_type: ResourceType to list.
+        :return: Mapping of zone id to available resources.
+        """
+        buckets = self._buckets.get(resource_type, {})
+        return {zone: [self._by_seq[seq] for seq in seqs] for zone, seqs in buckets.items()}
+
+    def _insert(self, resource: Resource) -> None:
+        zone = resource.zone_id
+        _insert_seq(self._buckets.setdefault(resource.resource_type, {}), zone, self._entries[id(resource)])
+        self._indexed[id(resource)] = zone
+
+    def _remove(self, resource: Resource, zone: int) -> None:
+        _remove_seq(self._buckets[resource.resource_type], zone, self._entries[id(resource)])
+        del self._indexed[id(resource)]
+
+
+class AllocationIndex:
+    """
+    Index of allocated resources bucketed by resource type, the priority of the
+    incident holding them, and zone id. Used to find the cheapest lower-priority
+    allocation to preempt without scanning every incident.
+    """
+
+    def __init__(self, distances=ZONES):
+        """
+        Initializes an empty index.
+
+        :param distances: Distance provider (ZoneRegistry or GraphDistanceProvider).
+        """
+        self._distances = distances
+        self._buckets: Dict[Tuple[ResourceType, PriorityLevel], Dict[int, List[int]]] = {}
+        self._by_seq: Dict[int, Tuple[Resource, Incident]] = {}
+        self._entries: Dict[int, Tuple[int, Tuple[ResourceType, PriorityLevel], int]] = {}
+        self._next_seq = 0
+
+    def add(self, resource: Resource, incident: Incident) -> None:
+        """
+        Records that a resource is allocated to an incident.
+        """
+        self.discard(resource)
+        seq = self._next_seq
+        self._next_seq += 1
+        key = (resource.resource_type, incident.priority)
+        _insert_seq(self._buckets.setdefault(key, {}), resource.zone_id, seq)
+        self._by_seq[seq] = (resource, incident)
+        self._entries[id(resource)] = (seq, key, resource.zone_id)
+
+    def discard(self, resource: Resource) -> None:
+        """
+        Forgets a resource's allocation, if recorded.
+        """
+        entry = self._entries.pop(id(resource), None)
+        if entry:
+            seq, key, zone = entry
+            _remove_seq(self._buckets[key], zone, seq)
+            del self._by_seq[seq]
+
+    def cheapest_below(
+        self,
+        resource_type: ResourceType,
+        priority: PriorityLevel,
+        zone_id: int
+    ) -> Optional[Tuple[Resource, Incident]]:
+        """
+        Finds the closest unit of a type held by an incident of lower priority.
+        Ties go to the lowest-priority holder, then to the oldest allocation.
+
+        :param resource_type: Required ResourceType.
+        :param priority: Priority of the incident that needs the unit.
+        :param zone_id: Zone id of the incident that needs the unit.
+        :return: (resource, holding incident) or None if nothing can be preempted.
+        """
+        best = None  # (distance, priority value, seq)
+        for level in PriorityLevel:
+            if level.value >= priority.value:
+                continue
+            found = _nearest_in_buckets(self._buckets.get((resource_type, level)), zone_id, self._distances)
+            if found:
+                candidate = (found[0], level.value, found[1])
+                best = candidate if best is None else min(best, candidate)
+        return self._by_seq[best[2]] if best else None
+
+
+def _nearest_in_buckets(buckets: Optional[Dict[int, List[int]]], zone_id: int, distances) -> Optional[Tuple[int, int]]:
+    """
+    Finds the (distance, seq) of the closest entry in zone buckets, ties going to the lowest seq.
+    """
+    if not buckets:
+        return None
+
+    if len(buckets) * 8 < len(distances):
+        # Few occupied zones: checking each one beats walking the full ordering
+        row = distances.row(zone_id)
+        return min((row[zone], seqs[0]) for zone, seqs in buckets.items())
+
+    best: Optional[Tuple[int, int]] = None
+    for distance, zone in distances.zones_by_distance(zone_id):
+        if best is not None and distance > best[0]:
+            break
+        seqs = buckets.get(zone)
+        if seqs and (best is None or seqs[0] < best[1]):
+            best = (distance, seqs[0])
+    return best
+
+
+def _candidates_scanned(
+    buckets: Optional[Dict[int, List[int]]],
+    zone_id: int,
+    best: Optional[Tuple[int, int]],
+    distances
+) -> int:
+    """
+    Number of zones _nearest_in_buckets examined for a search, derived from its result
+    so the search loop itself carries no bookkeeping.
+    """
+    if not buckets:
+        return 0
+    if len(buckets) * 8 < len(distances):
+        return len(buckets)
+    order = distances.zones_by_distance(zone_id)
+    if best is None:
+        return len(order)
+    # Every zone up to the best distance, plus the farther one that ended the walk
+    return min(len(order), bisect_right(order, (best[0], float("inf"))) + 1)
+
+
+def _insert_seq(buckets: Dict[int, List[int]], zone: int, seq: int) -> None:
+    insort(buckets.setdefault(zone, []), seq)
+
+
+def _remove_seq(buckets: Dict[int, List[int]], zone: int, seq: int) -> None:
+    seqs = buckets[zone]
+    del seqs[bisect_left(seqs, seq)]
+    if not seqs:
+        del buckets[zone]
@@ -0,0 +1,187 @@
+# services/batch_allocator.py
+
+import heapq
+import math
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.availability_index import AvailabilityIndex
+
+
+def solve_batch_assignment(
+    requirements: List[Tuple[Incident, str]],
+    availability: AvailabilityIndex,
+    distances
+) -> Dict[Tuple[int, str], List[Resource]]:
+    """
+    Assigns free units to a window of waiting incidents as one min-cost problem.
+
+    Each missing unit is one unit of demand. Requirements are grouped by
+    (resource type, zone, priority) and free units by (resource type, zone): units
+    in the same zone are interchangeable, so the assignment reduces to a small
+    transportation problem per type that is solved exactly with min-cost flow.
+    Serving a requirement costs its priority weight times the distance; leaving it
+    unserved costs a penalty large enough that a higher-priority requirement is
+    never left waiting so a lower-priority one can be served.
+
+    :param requirements: Unmet (incident, required type string) pairs, one per missing
+                         unit, ordered by incident priority then timestamp.
+    :param availability: Index of free units.
+    :param distances: Distance provider (ZoneRegistry or GraphDistanceProvider).
+    :return: Mapping of (id(incident), required type string) to the assigned Resources.
+    """
+    demand: Dict[ResourceType, Dict[Tuple[int, PriorityLevel], List[Tuple[Incident, str]]]] = \
+        defaultdict(lambda: defaultdict(list))
+    for incident, required_type in requirements:
+        try:
+            resource_type = ResourceType(required_type)
+        except ValueError:
+            continue  # Unknown types can never be served
+        demand[resource_type][(incident.zone_id, incident.priority)].append((incident, required_type))
+
+    assignments: Dict[Tuple[int, str], List[Resource]] = {}
+    for resource_type, groups in demand.items():
+        supply = availability.free_units(resource_type)
+        if supply:
+            _assign_type(groups, supply, distances, assignments)
+    return assignments
+
+
+def _assign_type(
+    groups: Dict[Tuple[int, PriorityLevel], List[Tuple[Incident, str]]],
+    supply: Dict[int, List[Resource]],
+    distances,
+    assignments: Dict[Tuple[int, str], List[Resource]]
+) -> None:
+    """
+    Solves the transportation problem for one resource type and records concrete pairings.
+    """
+    supply_zones = list(supply)
+    group_keys = list(groups)
+    max_weight = max(p.value for p in PriorityLevel)
+
+    costs: Dict[Tuple[int, int], float] = {}
+    longest = 0
+    for s, supply_zone in enumerate(supply_zones):
+        row = distances.row(supply_zone)
+        for g, (demand_zone, priority) in enumerate(group_keys):
+            distance = row[demand_zone]
+            if distance != math.inf:
+                costs[s, g] = priority.value * distance
+                longest = max(longest, distance)
+    step = max_weight * longest + 1  # Exceeds any difference in weighted distance
+
+    flow = _MinCostFlow(2 + len(supply_zones) + len(group_keys))
+    source, sink = 0, 1
+    for s, supply_zone in enumerate(supply_zones):
+        flow.add_edge(source, 2 + s, len(supply[supply_zone]), 0)
+    edges = {}
+    for (s, g), cost in costs.items():
+        edges[s, g] = flow.add_edge(2 + s, 2 + len(supply_zones) + g, len(groups[group_keys[g]]), cost)
+    for g, key in enumerate(group_keys):
+        flow.add_edge(2 + len(supply_zones) + g, sink, len(groups[key]), -key[1].value * step)
+    flow.solve(source, sink)
+
+    # Materialize zone-to-group flows into unit-to-incident pairings
+    next_unit = {zone: 0 for zone in supply_zones}
+    for g, key in enumerate(group_keys):
+        pending = iter(groups[key])
+        sources = sorted(
+            (costs[s, g], s) for s in range(len(supply_zones))
+            if (s, g) in edges and flow.flow(edges[s, g]) > 0
+        )
+        for _, s in sources:
+            zone = supply_zones[s]
+            for _ in range(flow.flow(edges[s, g])):
+                incident, required_type = next(pending)
+                assignments.setdefault((id(incident), required_type), []).append(supply[zone][next_unit[zone]])
+                next_unit[zone] += 1
+
+
+class _MinCostFlow:
+    """
+    Successive shortest path min-cost flow with Dijkstra and node potentials.
+    Stops as soon as no augmenting path has negative cost, so it returns the
+    cheapest flow of any size rather than a maximum flow.
+    """
+
+    def __init__(self, node_count: int):
+        self._graph: List[List[List]] = [[] for _ in range(node_count)]  # [to, cap, cost, rev index]
+        self._edges: List[Tuple[int, int]] = []  # edge handle -> (node, position)
+        self._capacities: List[int] = []  # edge handle -> original capacity
+
+    def add_edge(self, u: int, v: int, capacity: int, cost: float) -> int:
+        self._graph[u].append([v, capacity, cost, len(self._graph[v])])
+        self._graph[v].append([u, 0, -cost, len(self._graph[u]) - 1])
+        self._edges.append((u, len(self._graph[u]) - 1))
+        self._capacities.append(capacity)
+        return len(self._edges) - 1
+
+    def flow(self, handle: int) -> int:
+        u, position = self._edges[handle]
+        return self._capacities[handle] - self._graph[u][position][1]
+
+    def solve(self, source: int, sink: int) -> None:
+        potential = self._initial_potentials(source)
+        size = len(self._graph)
+        while True:
+            dist = [math.inf] * size
+            parent = [None] * size
+            dist[source] = 0
+            queue = [(0, source)]
+            while queue:
+                d, u = heapq.heappop(queue)
+                if d > dist[u]:
+                    continue
+                for position, (v, capacity, cost, _) in enumerate(self._graph[u]):
+                    if capacity <= 0:
+                        continue
+                    candidate = d + cost + potential[u] - potential[v]
+                    if candidate < dist[v]:
+                        dist[v] = candidate
+                        parent[v] = (u, position)
+                        heapq.heappush(queue, (candidate, v))
+            if dist[sink] == math.inf:
+                return
+            for node in range(size):
+                if dist[node] < math.inf:
+                    potential[node] += dist[node]
+            if potential[sink] - potential[source] >= 0:
+                return  # Further flow would only add cost
+
+            bottleneck = math.inf
+            node = sink
+            while node != source:
+                u, position = parent[node]
+                bottleneck = min(bottleneck, self._graph[u][position][1])
+                node = u
+            node = sink
+            while node != source:
+                u, position = parent[node]
+                edge = self._graph[u][position]
+                edge[1] -= bottleneck
+                self._graph[node][edge[3]][1] += bottleneck
+                node = u
+
+    def _initial_potentials(self, source: int) -> List[float]:
+        """
+        Bellman-Ford from the source so reduced costs start non-negative
+        despite the negative unserved-penalty edges.
+        """
+        potential = [math.inf] * len(self._graph)
+        potential[source] = 0
+        for _ in range(len(self._graph)):
+            changed = False
+            for u, edges in enumerate(self._graph):
+                if potential[u] == math.inf:
+                    continue
+                for v, capacity, cost, _ in edges:
+                    if capacity > 0 and potential[u] + cost < potential[v]:
+                        potential[v] = potential[u] + cost
+                        changed = True
+            if not changed:
+                break
+        return [0 if p == math.inf else p for p in potential]
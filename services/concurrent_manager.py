@@ -0,0 +1,312 @@
+# services/concurrent_manager.py
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from utils.persistent_map import PersistentMap
+
+
+class IncidentView(NamedTuple):
+    """
+    Immutable copy of an incident's state at snapshot time.
+    """
+    incident_id: int
+    location: str
+    emergency_type: str
+    priority: PriorityLevel
+    status: str
+    required_resources: Tuple[str, ...]
+    allocated_resources: Tuple[int, ...]  # Resource IDs
+
+
+class ResourceView(NamedTuple):
+    """
+    Immutable copy of a resource's state at snapshot time.
+    """
+    resource_id: int
+    resource_type: ResourceType
+    location: str
+    is_available: bool
+    assigned_to_incident: Optional[int]
+
+
+class StateSnapshot:
+    """
+    Read-only view of the managed state after a batch of commands.
+
+    Snapshots are never modified once published, so any number of reader threads
+    can use one without locks while the writer keeps working on the next. Their
+    maps are PersistentMaps that share unchanged entries with earlier snapshots.
+    """
+
+    __slots__ = ("version", "summary", "incidents", "resources")
+
+    def __init__(
+        self,
+        version: int,
+        summary: dict,
+        incidents: Mapping[int, IncidentView],
+        resources: Mapping[int, ResourceView]
+    ):
+        """
+        :param version: Number of batches applied when the snapshot was taken.
+        :param summary: Dashboard counts (see ResourceManager.summary_counts).
+        :param incidents: Incident ID -> IncidentView.
+        :param resources: Resource ID -> ResourceView.
+        """
+        self.version = version
+        self.summary = summary
+        self.incidents = incidents
+        self.resources = resources
+
+
+class ConcurrentResourceManager:
+    """
+    Thread-safe front end for a ResourceManager with a single writer thread.
+
+    Producer threads submit commands to a queue and get a Future back; only the
+    writer thread touches the manager, so no unit can be assigned twice and
+    producers never contend on a lock around the allocation state. The writer
+    drains the queue in batches, coalescing consecutive new incidents into one
+    allocation step, and publishes a new StateSnapshot after every batch. Queries
+    and reports read the latest snapshot instead of the live objects.
+    """
+
+    _STOP = object()
+
+    def __init__(self, manager: Optional[ResourceManager] = None, max_batch: int = 1024):
+        """
+        Wraps a manager and starts the writer thread. The wrapped manager must not be
+        used directly from other threads afterwards.
+
+        :param manager: ResourceManager to own. Defaults to a new one.
+        :param max_batch: Maximum number of commands applied between two snapshots.
+        """
+        self._manager = ResourceManager() if manager is None else manager
+        self.max_batch = max_batch
+        self._commands: "queue.Queue" = queue.Queue()
+        self._dirty_incidents: Dict[int, Incident] = {}
+        self._dirty_resources: Dict[int, Resource] = {}
+        self._version = 0
+
+        for incident in self._manager.incidents:
+            self._watch_incident(incident)
+        for resource in self._manager.resources:
+            self._watch_resource(resource)
+        self._snapshot = StateSnapshot(0, self._manager.summary_counts(), PersistentMap(), PersistentMap())
+        self._publish()
+
+        self._thread = threading.Thread(target=self._run, name="resource-manager-writer", daemon=True)
+        self._thread.start()
+
+    # ------------------------ Commands (any thread) ------------------------
+
+    def submit(self, command: Callable[[ResourceManager], object]) -> Future:
+        """
+        Queues a function to run on the writer thread with the manager as its argument.
+
+        :return: Future resolved with the function's return value.
+        """
+        future: Future = Future()
+        self._commands.put((command, future))
+        return future
+
+    def add_incident(self, incident: Incident) -> Future:
+        """
+        Queues a new incident. Incidents queued together are allocated in one step.
+
+        :return: Future resolved with the IncidentView after allocation.
+        """
+        future: Future = Future()
+        self._commands.put((incident, future))
+        return future
+
+    def add_resource(self, resource: Resource) -> Future:
+        """
+        Queues a new resource.
+
+        :return: Future resolved with the ResourceView after any dispatch.
+        """
+        def command(manager: ResourceManager) -> ResourceView:
+            manager.add_resource(resource)
+            self._watch_resource(resource)
+            return _resource_view(resource)
+        return self.submit(command)
+
+    def resolve_incidents(self, incident_ids: Iterable[int]) -> Future:
+        """
+        Queues the resolution of incidents.
+
+        :return: Future resolved with the IDs of the incidents that were resolved.
+        """
+        incident_ids = list(incident_ids)
+        return self.submit(lambda manager: [i.incident_id for i in manager.resolve_incidents(incident_ids)])
+
+    def resolve_incident(self, incident_id: int) -> Future:
+        """
+        Queues the resolution of one incident.
+
+        :return: Future resolved with True if the incident existed.
+        """
+        return self.submit(lambda manager: manager.resolve_incident(incident_id) is not None)
+
+    def allocate_resources(self, strategy: str = "greedy") -> Future:
+        """
+        Queues a full allocation pass.
+        """
+        return self.submit(lambda manager: manager.allocate_resources(strategy))
+
+    def flush(self) -> None:
+        """
+        Blocks until every command queued so far is applied and visible in the snapshot.
+        """
+        self.submit(lambda manager: None).result()
+
+    def close(self) -> None:
+        """
+        Applies the remaining commands and stops the writer thread.
+        """
+        self._commands.put((self._STOP, None))
+        self._thread.join()
+
+    # ------------------------ Queries (any thread, lock-free) ------------------------
+
+    def snapshot(self) -> StateSnapshot:
+        """
+        Returns the latest published snapshot.
+        """
+        return self._snapshot
+
+    def summary(self) -> dict:
+        """
+        Returns the dashboard counts from the latest snapshot.
+        """
+        return self._snapshot.summary
+
+    def get_incident(self, incident_id: int) -> Optional[IncidentView]:
+        """
+        Looks up an incident in the latest snapshot.
+        """
+        return self._snapshot.incidents.get(incident_id)
+
+    # ------------------------ Writer thread ------------------------
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._commands.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._commands.get_nowait())
+                except queue.Empty:
+                    break
+            outcomes, stop = self._apply(batch)
+            self._publish()
+            # Futures complete only after the snapshot reflects their command
+            for future, result, error in outcomes:
+                if error is not None:
+                    future.set_exception(error)
+                elif isinstance(result, Incident):
+                    future.set_result(self._snapshot.incidents[result.incident_id])
+                else:
+                    future.set_result(result)
+            if stop:
+                return
+
+    def _apply(self, batch: List[Tuple[object, Optional[Future]]]) -> Tuple[list, bool]:
+        """
+        Applies a batch of commands in order, coalescing runs of new incidents.
+        Live Incident results are turned into views before they reach producers.
+
+        :return: ([(future, result, exception)], whether the batch contained the stop command)
+        """
+        outcomes = []
+        incidents: List[Incident] = []
+        for command, future in batch:
+            if command is self._STOP:
+                self._add_incidents(incidents)
+                return outcomes, True
+            if not future.set_running_or_notify_cancel():
+                continue
+            if isinstance(command, Incident):
+                incidents.append(command)
+                outcomes.append((future, command, None))
+                continue
+            self._add_incidents(incidents)
+            incidents = []
+            try:
+                outcomes.append((future, command(self._manager), None))
+            except Exception as e:
+                outcomes.append((future, None, e))
+        self._add_incidents(incidents)
+        return outcomes, False
+
+    def _add_incidents(self, incidents: List[Incident]) -> None:
+        if incidents:
+            self._manager.add_incidents(incidents)
+            for incident in incidents:
+                self._watch_incident(incident)
+
+    def _watch_incident(self, incident: Incident) -> None:
+        incident.add_listener(self._on_incident_changed)
+        self._dirty_incidents[incident.incident_id] = incident
+
+    def _watch_resource(self, resource: Resource) -> None:
+        resource.add_listener(self._on_resource_changed)
+        self._dirty_resources[resource.resource_id] = resource
+
+    def _on_incident_changed(self, incident: Incident, old_status: str) -> None:
+        self._dirty_incidents[incident.incident_id] = incident
+
+    def _on_resource_changed(self, resource: Resource) -> None:
+        self._dirty_resources[resource.resource_id] = resource
+
+    def _publish(self) -> None:
+        """
+        Builds and publishes the next snapshot. Only the changed views are built, and
+        the maps share everything else with the previous snapshot, so the cost grows
+        with the batch rather than with the total state.
+        """
+        if not self._dirty_incidents and not self._dirty_resources and self._version:
+            return
+        previous = self._snapshot
+        resource_views = {}
+        for rid, resource in self._dirty_resources.items():
+            # A unit moving between incidents changes both incidents' allocations
+            old = previous.resources.get(rid)
+            for holder in (old.assigned_to_incident if old else None, resource.assigned_to_incident):
+                if holder is not None and holder not in self._dirty_incidents:
+                    incident = self._manager.get_incident(holder)
+                    if incident is not None:
+                        self._dirty_incidents[holder] = incident
+            resource_views[rid] = _resource_view(resource)
+        resources = previous.resources.updated(resource_views)
+        incidents = previous.incidents.updated(
+            {iid: _incident_view(incident) for iid, incident in self._dirty_incidents.items()}
+        )
+        self._dirty_incidents.clear()
+        self._dirty_resources.clear()
+
+        self._version += 1
+        # Attribute assignment is atomic, so readers see either the old or the new snapshot
+        self._snapshot = StateSnapshot(self._version, self._manager.summary_counts(), incidents, resources)
+
+
+def _incident_view(incident: Incident) -> IncidentView:
+    return IncidentView(
+        incident.incident_id, incident.location, incident.emergency_type, incident.priority,
+        incident.status, tuple(incident.required_resources),
+        tuple(r.resource_id for r in incident.allocated_resources)
+    )
+
+
+def _resource_view(resource: Resource) -> ResourceView:
+    return ResourceView(
+        resource.resource_id, resource.resource_type, resource.location,
+        resource.is_available, resource.assigned_to_incident
+    )
@@ -0,0 +1,127 @@
+# services/dashboard_counters.py
+
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from models.enums import ResourceType
+from models.incident import Incident
+from models.resource import Resource
+
+IncidentKey = Tuple[str, str, str]  # (status, priority name, location)
+ResourceKey = Tuple[ResourceType, str, bool]  # (type, location, is_available)
+
+
+class DashboardCounters:
+    """
+    Live aggregate counts behind the dashboard summary.
+
+    Incidents are counted per (status, priority, location) cell and resources per
+    (type, location, availability) cell. The manager updates the cells from its
+    incident and resource listeners, so a filtered summary only walks the occupied
+    cells, whose number depends on zones and statuses rather than on history size.
+    """
+
+    def __init__(self):
+        self.incidents: Counter = Counter()  # IncidentKey -> count
+        self.resources: Counter = Counter()  # ResourceKey -> count
+        self._resource_keys: Dict[int, ResourceKey] = {}  # resource_id -> counted cell
+
+    def add_incident(self, incident: Incident) -> None:
+        """
+        Counts a new incident.
+        """
+        self._increment(self.incidents, (incident.status, incident.priority.name, incident.location))
+
+    def add_incident_keys(self, keys: Iterable[IncidentKey]) -> None:
+        """
+        Counts incidents given directly as cells, e.g. from undecoded history records.
+        """
+        for key in keys:
+            self._increment(self.incidents, key)
+
+    def incident_status_changed(self, incident: Incident, old_status: str) -> None:
+        """
+        Moves an incident from its old status cell to its new one.
+        """
+        self._decrement(self.incidents, (old_status, incident.priority.name, incident.location))
+        self._increment(self.incidents, (incident.status, incident.priority.name, incident.location))
+
+    def add_resource(self, resource: Resource) -> None:
+        """
+        Counts a new resource.
+        """
+        key = (resource.resource_type, resource.location, resource.is_available)
+        self._resource_keys[resource.resource_id] = key
+        self._increment(self.resources, key)
+
+    def resource_changed(self, resource: Resource) -> None:
+        """
+        Moves a resource to the cell for its current availability and location.
+        """
+        key = (resource.resource_type, resource.location, resource.is_available)
+        old_key = self._resource_keys.get(resource.resource_id)
+        if key != old_key:
+            if old_key is not None:
+                self._decrement(self.resources, old_key)
+            self._resource_keys[resource.resource_id] = key
+            self._increment(self.resources, key)
+
+    def summary(
+        self,
+        status_filter: Optional[str] = None,
+        zone_filter: Optional[str] = None,
+        priority_filter: Optional[str] = None
+    ) -> dict:
+        """
+        Builds the summary counts from the aggregates.
+
+        :param status_filter: Filter by incident status (case-insensitive).
+        :param zone_filter: Filter by zone (case-insensitive).
+        :param priority_filter: Filter by priority name (case-insensitive).
+        :return: Dict in the shape of ResourceManager.summary_counts.
+        """
+        status_filter = status_filter.lower() if status_filter else None
+        zone_filter = zone_filter.lower() if zone_filter else None
+        priority_filter = priority_filter.lower() if priority_filter else None
+
+        status_count, priority_count, zone_count = Counter(), Counter(), Counter()
+        for (status, priority, location), count in self.incidents.items():
+            if status_filter and status.lower() != status_filter:
+                continue
+            if zone_filter and location.lower() != zone_filter:
+                continue
+            if priority_filter and priority.lower() != priority_filter:
+                continue
+            status_count[status] += count
+            priority_count[priority] += count
+            zone_count[location] += count
+
+        return {
+            'total': sum(status_count.values()),
+            'status': dict(status_count),
+            'priority': dict(priority_count),
+            'zone': dict(zone_count),
+            'resources': sum(self.resources.values()),
+            'available': self.available_units(),
+        }
+
+    def available_units(self, resource_type: Optional[ResourceType] = None, zone: Optional[str] = None) -> int:
+        """
+        Counts free units, optionally of one type and/or in one zone.
+        """
+        return sum(
+            count for (unit_type, location, available), count in self.resources.items()
+            if available
+            and (resource_type is None or unit_type == resource_type)
+            and (zone is None or location == zone)
+        )
+
+    @staticmethod
+    def _increment(counter: Counter, key) -> None:
+        counter[key] += 1
+
+    @staticmethod
+    def _decrement(counter: Counter, key) -> None:
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]  # Keep only occupied cells so summaries stay small
@@ -0,0 +1,135 @@
+# services/lookup_index.py
+
+from typing import Callable, Dict, Generic, Hashable, List, Optional, Set, Tuple, TypeVar
+
+from models.incident import Incident
+from models.resource import Resource
+
+T = TypeVar("T")
+
+
+class LookupIndex(Generic[T]):
+    """
+    ID -> object table with set-valued secondary indexes.
+
+    Each secondary index maps a key (e.g. a lower-cased status) to the IDs of the
+    objects that have it. `update`, which the manager calls from its listeners,
+    only marks an object dirty; dirty objects are re-keyed on the next `find`,
+    so bursts of state changes between queries cost one dict write each. `find`
+    answers multi-field queries by intersecting the index sets, smallest first,
+    instead of scanning.
+    """
+
+    def __init__(self, id_of: Callable[[T], int], keys: Dict[str, Callable[[T], Hashable]]):
+        """
+        :param id_of: Returns an object's ID.
+        :param keys: Index name -> function computing the object's key for that index.
+        """
+        self._id_of = id_of
+        self._key_funcs = keys
+        self._by_id: Dict[int, T] = {}
+        self._indexes: Dict[str, Dict[Hashable, Set[int]]] = {name: {} for name in keys}
+        self._keys: Dict[int, Tuple[Hashable, ...]] = {}  # ID -> keys it is indexed under
+        self._dirty: Dict[int, T] = {}  # Objects whose fields may have changed since the last find
+
+    def add(self, item: T) -> None:
+        """
+        Adds (or re-indexes) an object.
+        """
+        item_id = self._id_of(item)
+        self._by_id[item_id] = item
+        self._dirty[item_id] = item
+
+    def update(self, item: T) -> None:
+        """
+        Notes that an object's fields changed; it is re-keyed before the next query.
+        """
+        self._dirty[self._id_of(item)] = item
+
+    def _reindex(self) -> None:
+        """
+        Moves every dirty object to the index entries matching its current fields.
+        """
+        for item_id, item in self._dirty.items():
+            self._rekey(item_id, item)
+        self._dirty.clear()
+
+    def _rekey(self, item_id: int, item: T) -> None:
+        new_keys = tuple(func(item) for func in self._key_funcs.values())
+        old_keys = self._keys.get(item_id)
+        if new_keys == old_keys:
+            return
+        for position, (name, new) in enumerate(zip(self._indexes, new_keys)):
+            if old_keys is not None:
+                old = old_keys[position]
+                if old == new:
+                    continue
+                bucket = self._indexes[name][old]
+                bucket.discard(item_id)
+                if not bucket:
+                    del self._indexes[name][old]
+            self._indexes[name].setdefault(new, set()).add(item_id)
+        self._keys[item_id] = new_keys
+
+    def get(self, item_id: int) -> Optional[T]:
+        """
+        Returns the object with an ID, or None.
+        """
+        return self._by_id.get(item_id)
+
+    def find(self, **criteria) -> List[T]:
+        """
+        Returns objects matching every given index key, ordered by ID.
+        Criteria that are None are ignored.
+
+        :param criteria: Index name -> key to match.
+        """
+        if self._dirty:
+            self._reindex()
+        sets = []
+        for name, key in criteria.items():
+            if key is None:
+                continue
+            bucket = self._indexes[name].get(key)
+            if not bucket:
+                return []
+            sets.append(bucket)
+        if not sets:
+            return [self._by_id[i] for i in sorted(self._by_id)]
+        sets.sort(key=len)
+        ids = sets[0].intersection(*sets[1:])
+        return [self._by_id[i] for i in sorted(ids)]
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+def incident_lookup() -> LookupIndex[Incident]:
+    """
+    Builds a lookup for incidents, indexed by status, zone and priority (all case-insensitive).
+    """
+    return LookupIndex(
+        lambda incident: incident.incident_id,
+        {
+            'status': lambda incident: incident.status.lower(),
+            'zone': lambda incident: incident.location.lower(),
+            'priority': lambda incident: incident.priority.name.lower(),
+        }
+    )
+
+
+def resource_lookup() -> LookupIndex[Resource]:
+    """
+    Builds a lookup for resources, indexed by type, zone (case-insensitive) and availability.
+    """
+    return LookupIndex(
+        lambda resource: resource.resource_id,
+        {
+            'type': lambda resource: resource.resource_type,
+            'zone': lambda resource: resource.location.lower(),
+            'available': lambda resource: resource.is_available,
+        }
+    )
@@ -1,23 +1,25 @@
 # services/resource_manager.py
 
-from collections import Counter
+import heapq
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
+from models.enums import PriorityLevel, ResourceType
 from models.incident import Incident
 from models.resource import Resource
-from utils.helpers import calculate_zone_distance
+from services.availability_index import AllocationIndex, AvailabilityIndex
+from services.batch_allocator import solve_batch_assignment
+from services.dashboard_counters import DashboardCounters
+from services.lookup_index import incident_lookup, resource_lookup
+from services.spatial_index import SpatialIndex
+from utils.binary_snapshot import LazyIncidentHistory
+from utils.events import AllocationEvent, EventLevel, EventSink, StreamSink
+from utils.journal import Journal
+from utils.metrics import Metrics, TimedDistances
+from utils.sqlite_store import SQLiteStore
+from utils.zones import ZONES
 
-
-def _is_resource_type_allocated(incident: Incident, resource_type_str: str) -> bool:
-    """
-    Checks if a resource of the given type is already allocated to the incident.
-
-    :param incident: Incident object
-    :param resource_type_str: String representing the resource type
-    :return: True if allocated, False otherwise
-    """
-    return any(r.resource_type.value == resource_type_str for r in incident.allocated_resources)
+_MIN_WAITING_LIMIT = 64  # Smallest waiting queue worth cleaning up
 
 
 class ResourceManager:
@@ -26,112 +28,883 @@ class ResourceManager:
     Implements allocation and reallocation logic using observer-like behavior.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        incremental: bool = True,
+        distances=None,
+        preemption: bool = True,
+        events: Optional[EventSink] = None,
+        journal: Optional[Journal] = None,
+        store: Optional[SQLiteStore] = None,
+        metrics: Optional[Metrics] = None,
+        spatial: Optional[SpatialIndex] = None
+    ):
         """
         Initializes the resource manager with empty lists of incidents and resources.
+
+        :param incremental: If True, adding an incident only allocates for that incident
+                            and for waiting incidents whose needed types gained supply.
+                            If False, every new incident triggers a full allocation pass.
+        :param distances: Distance provider used for proximity, e.g. a GraphDistanceProvider.
+                          Defaults to the shared ZoneRegistry (zone number difference).
+        :param preemption: If True, an incident that finds no free unit may take one from a
+                           lower-priority incident, which then goes back to waiting.
+        :param events: Sink for allocation events. Defaults to writing every event to stdout.
+                       Use a NullSink, a higher level or a buffered/threaded sink so that
+                       allocation throughput does not depend on console speed.
+        :param journal: Optional Journal that every state change is appended to.
+        :param store: Optional SQLiteStore kept up to date with dirty-tracked upserts,
+                      flushed in one transaction at the end of every operation;
+                      dashboard counts are then computed in SQL.
+        :param metrics: Optional Metrics registry. When given, this manager's allocation
+                        entry points, nearest-unit searches and distance lookups are timed
+                        (see metrics()); when omitted, none of them carry any instrumentation.
+                        The registry is only recorded into by this manager.
+        :param spatial: Optional SpatialIndex. When given, the closest free unit is chosen
+                        by planar distance between coordinates (or zone centroids) rather
+                        than by zone distance, and nearest_resources() answers k-nearest
+                        queries. Preemption and the batch strategy stay zone-based.
         """
         self.incidents: List[Incident] = []
         self.resources: List[Resource] = []
+        self._history: Optional[Sequence[Incident]] = None  # Lazily decoded resolved incidents
+        self.incremental = incremental
+        self._distances = ZONES if distances is None else distances
+        if metrics is not None:
+            # Wrapped before the indexes are built so their lookups are timed too
+            self._distances = TimedDistances(self._distances, metrics)
+        self.preemption = preemption
+        self.events = StreamSink() if events is None else events
+        self.journal = journal
+        self.store = store
+        self._counters = DashboardCounters()
+        self._incident_lookup = incident_lookup()
+        self._resource_lookup = resource_lookup()
+        self._availability = AvailabilityIndex(self._distances)
+        self._allocated = AllocationIndex(self._distances)
+        self._spatial = spatial
+        # Priority queue of unresolved incidents: (-priority, timestamp, seq, incident)
+        self._waiting: List[Tuple[int, datetime, int, Incident]] = []
+        self._waiting_limit = _MIN_WAITING_LIMIT  # Queue size that triggers dropping stale entries
+        self._incident_seq = 0
+        # Per-type wait queues of incidents with an unserved requirement of that type,
+        # in the same (-priority, timestamp, seq, incident) order as the waiting queue
+        self._wait_queues: Dict[ResourceType, List[Tuple[int, datetime, int, Incident]]] = {}
+        self._queued: Set[Tuple[int, ResourceType]] = set()  # (id(incident), type) pairs in the queues
+        # Resolved incidents whose units have not been released yet
+        self._resolved_holding: Dict[int, Incident] = {}
+        # Types that gained a free unit since the last pass, and may unblock waiting incidents
+        self._dirty_types: Set[ResourceType] = set()
+        self._metrics = metrics
+        if metrics is not None:
+            self._instrument(metrics)
+
+    def _instrument(self, metrics: Metrics) -> None:
+        """
+        Replaces this instance's hot methods with timed wrappers, so managers
+        without metrics keep the plain methods and pay nothing.
+        """
+        for name in ("add_incidents", "allocate_resources", "resolve_incidents", "_find_available_resource"):
+            setattr(self, name, metrics.timed(name.lstrip("_"), getattr(self, name)))
+        # Wait-queue dispatch searches through _nearest_free; record it as the same lookup
+        self._nearest_free = metrics.timed("find_available_resource", self._nearest_free)
+        self._availability.search_stats = metrics
+
+    @property
+    def distances(self):
+        """
+        The distance provider used for proximity (ZoneRegistry or GraphDistanceProvider).
+        """
+        if isinstance(self._distances, TimedDistances):
+            return self._distances.provider
+        return self._distances
 
     def add_incident(self, incident: Incident) -> None:
         """
         Adds a new incident to the system and triggers allocation.
         """
-        self.incidents.append(incident)
-        self._notify_incident_added(incident)
+        self.add_incidents([incident])
+
+    def add_incidents(self, incidents: Iterable[Incident]) -> None:
+        """
+        Adds several incidents (e.g., a micro-batch from the API server) and runs
+        a single allocation step for all of them, serving them in priority order.
+        """
+        incidents = list(incidents)
+        for incident in incidents:
+            self.incidents.append(incident)
+            self._register_incident(incident)
+            if self.journal:
+                self.journal.record_incident(incident)
+                self._compact_journal_if_due()
+            self._enqueue(incident)
+        self._notify_incidents_added(incidents)
+        self._flush_store()
+
+    def bulk_load(
+        self,
+        incidents: Iterable[Incident],
+        resources: Iterable[Resource],
+        history: Optional[Sequence[Incident]] = None
+    ) -> None:
+        """
+        Restores incidents and resources in bulk (e.g., from saved state on startup).
+        Skips per-incident notifications, builds the waiting queue once and then
+        runs a single allocation pass. Restored items are not journaled, but
+        existing allocation links are kept and allocations made by the pass are.
+
+        :param incidents: Incidents to restore (a list, or an IncidentTable).
+        :param resources: Resources to restore (a list, or a ResourceTable).
+        :param history: Optional resolved incidents holding no units, e.g. a
+                        LazyIncidentHistory; only materialized by get_all_incidents.
+        """
+        self._history = history if history else None
+        if isinstance(self._history, LazyIncidentHistory):
+            self._counters.add_incident_keys(self._history.summary_keys())
+        elif self._history:
+            for incident in self._history:
+                self._counters.add_incident(incident)
+        for resource in resources:
+            self._register_resource(resource)
+
+        incidents = list(incidents)
+        self.incidents.extend(incidents)
+        for incident in incidents:
+            self._register_incident(incident)
+            for resource in incident.allocated_resources:
+                self._allocated.add(resource, incident)
+            entry = self._queue_entry(incident)
+            if entry:
+                self._waiting.append(entry)
+        heapq.heapify(self._waiting)
+
+        self.allocate_resources()
+
+    def _register_incident(self, incident: Incident, counted: bool = False) -> None:
+        """
+        Starts managing an incident: indexes it and subscribes to its status changes.
+
+        :param counted: True if the dashboard counters already include the incident
+                        (it comes from lazy history).
+        """
+        incident.add_listener(self._on_incident_status_changed)
+        self._incident_lookup.add(incident)
+        if not counted:
+            self._counters.add_incident(incident)
+        if incident.status == "Resolved" and incident.allocated_resources:
+            self._resolved_holding[incident.incident_id] = incident
+        if self.store is not None:
+            self.store.watch(incident)
 
     def add_resource(self, resource: Resource) -> None:
         """
         Adds a new resource to the system.
         """
+        self._register_resource(resource)
+        if self.journal:
+            self.journal.record_resource(resource)
+            self._compact_journal_if_due()
+        if self.incremental and self._dirty_types:
+            self._serve_wait_queues()
+            self.events.flush()
+        self._flush_store()
+
+    def _register_resource(self, resource: Resource) -> None:
+        """
+        Starts managing a resource: indexes it and subscribes to its changes.
+        """
         self.resources.append(resource)
+        self._availability.track(resource)
+        if self._spatial is not None:
+            self._spatial.track(resource)
+        resource.add_listener(self._on_resource_changed)
+        self._resource_lookup.add(resource)
+        self._counters.add_resource(resource)
+        if self.store is not None:
+            self.store.watch(resource)
+        if resource.is_available:
+            self._dirty_types.add(resource.resource_type)
+
+    def _on_resource_changed(self, resource: Resource) -> None:
+        """
+        Listener called when a managed resource is assigned or released.
+        Records the type as dirty when a unit becomes free.
+        """
+        self._counters.resource_changed(resource)
+        self._resource_lookup.update(resource)
+        if resource.is_available:
+            self._dirty_types.add(resource.resource_type)
+            self._allocated.discard(resource)
+            if self.journal:
+                self.journal.record_release(resource)
+                self._compact_journal_if_due()
+
+    def _on_incident_status_changed(self, incident: Incident, old_status: str) -> None:
+        """
+        Listener called when a managed incident changes status.
+        """
+        self._counters.incident_status_changed(incident, old_status)
+        self._incident_lookup.update(incident)
+        if incident.status == "Resolved" and incident.allocated_resources:
+            self._resolved_holding[incident.incident_id] = incident
+        if self.journal:
+            self.journal.record_status(incident)
+            self._compact_journal_if_due()
+
+    def _flush_store(self) -> None:
+        """
+        Writes the rows changed by the current operation to the store, if one is attached.
+        """
+        if self.store is not None:
+            self.store.flush()
 
-    def _notify_incident_added(self, incident: Incident) -> None:
+    def _compact_journal_if_due(self) -> None:
         """
-        Observer-style method called whenever a new incident is added.
+        Snapshots the full state and truncates the journal once enough records piled up.
+        """
+        if self.journal.compaction_due:
+            self.journal.compact(self.incidents, self.resources, self._history)
+
+    def _enqueue(self, incident: Incident) -> None:
+        """
+        Pushes an unresolved incident onto the waiting priority queue.
+
+        Incremental allocation never drains the queue, so once it doubles in size
+        since the last cleanup, entries of incidents that stopped waiting are dropped.
+        The queue then stays proportional to the backlog rather than to history.
+        """
+        entry = self._queue_entry(incident)
+        if entry:
+            heapq.heappush(self._waiting, entry)
+            if len(self._waiting) > self._waiting_limit:
+                self._prune_waiting()
+
+    def _queue_entry(self, incident: Incident) -> Optional[Tuple[int, datetime, int, Incident]]:
+        """
+        Builds the priority queue entry for an incident, or None if it is resolved.
+        """
+        if incident.status == "Resolved":
+            return None
+        entry = (-incident.priority.value, incident.timestamp, self._incident_seq, incident)
+        self._incident_seq += 1
+        return entry
+
+    def _waiting_in_order(self) -> List[Incident]:
+        """
+        Returns waiting incidents by priority (high to low), then timestamp (old to new).
+        Drops resolved and fulfilled incidents from the queue along the way.
+        """
+        self._prune_waiting()
+        # A sorted list is a valid heap, so it can stay the queue as-is
+        self._waiting.sort()
+        return [entry[-1] for entry in self._waiting]
+
+    def _prune_waiting(self) -> None:
+        """
+        Drops entries of resolved and fulfilled incidents from the waiting queue.
+        Preempted incidents are re-queued, so only the earliest entry of each is kept.
+        """
+        live: Dict[int, Tuple[int, datetime, int, Incident]] = {}
+        for entry in self._waiting:
+            incident = entry[-1]
+            if incident.status == "Resolved" or incident.is_fulfilled():
+                continue
+            kept = live.get(id(incident))
+            if kept is None or entry[2] < kept[2]:
+                live[id(incident)] = entry
+        self._waiting = list(live.values())
+        heapq.heapify(self._waiting)
+        self._waiting_limit = max(_MIN_WAITING_LIMIT, 2 * len(self._waiting))
+
+    def _notify_incidents_added(self, incidents: List[Incident]) -> None:
+        """
+        Observer-style method called whenever new incidents are added.
         Triggers reallocation logic if necessary.
         """
-        print(f"\n[INFO] New incident reported (Priority: {incident.priority})")
-        self.allocate_resources()
+        if self.events.enabled_for(EventLevel.INFO):
+            for incident in incidents:
+                self.events.emit(AllocationEvent("INCIDENT_ADDED", EventLevel.INFO, priority=incident.priority))
+        if self.incremental:
+            self._allocate_incremental(incidents)
+            self.events.flush()
+        else:
+            self.allocate_resources()
+
+    def _allocate_incremental(self, incidents: List[Incident]) -> None:
+        """
+        Allocates for new incidents without re-scanning the whole history.
 
-    def allocate_resources(self) -> None:
+        Units freed since the last step go to the best waiting incidents of their type
+        first; the new incidents join those queues for any freed type they need, so they
+        are served in priority order alongside them, and then take (or preempt) units
+        for their remaining requirements, highest priority first.
+        """
+        if self._dirty_types:
+            for incident in incidents:
+                for required_type in incident.requirements:
+                    try:
+                        resource_type = ResourceType(required_type)
+                    except ValueError:
+                        continue
+                    if resource_type in self._dirty_types:
+                        self._wait_for(incident, resource_type)
+            self._serve_wait_queues()
+        if len(incidents) > 1:
+            incidents = sorted(incidents, key=lambda i: (-i.priority.value, i.timestamp))
+        for incident in incidents:
+            self._allocate_for_incident(incident)
+
+    def _wait_for(self, incident: Incident, resource_type: ResourceType) -> None:
+        """
+        Puts an incident on the wait queue of a type it still needs (once per type).
+        Only incremental allocation serves the queues; full passes walk the waiting
+        queue instead, so without it nothing is queued (and nothing would be removed).
+        """
+        if not self.incremental:
+            return
+        key = (id(incident), resource_type)
+        if key in self._queued:
+            return
+        entry = self._queue_entry(incident)
+        if entry:
+            self._queued.add(key)
+            heapq.heappush(self._wait_queues.setdefault(resource_type, []), entry)
+
+    def _serve_wait_queues(self) -> None:
+        """
+        For each type that gained free units, hands the nearest free unit to the best
+        waiting incident of that type until units or waiters run out. An incident
+        missing several units of the type stays first in line until it has them all.
+        The cost is proportional to the units handed out, not to the number of
+        waiting incidents.
+        """
+        for resource_type in list(self._dirty_types):
+            queue = self._wait_queues.get(resource_type)
+            while queue:
+                incident = queue[0][-1]
+                if incident.status != "Resolved" and incident.outstanding(resource_type.value):
+                    resource = self._nearest_free(resource_type, incident)
+                    if resource is None:
+                        break  # No free unit left for this type
+                    self._assign(incident, resource)
+                    if incident.is_fulfilled():
+                        incident.update_status("In Progress")
+                    if incident.outstanding(resource_type.value):
+                        continue
+                heapq.heappop(queue)
+                self._queued.discard((id(incident), resource_type))
+        self._dirty_types.clear()
+
+    def _drop_stale_heads(self, resource_type: ResourceType) -> None:
+        """
+        Pops incidents that no longer need a type (resolved, or served by another path)
+        off the front of that type's wait queue.
+        """
+        queue = self._wait_queues.get(resource_type)
+        while queue:
+            incident = queue[0][-1]
+            if incident.status != "Resolved" and incident.outstanding(resource_type.value):
+                return
+            heapq.heappop(queue)
+            self._queued.discard((id(incident), resource_type))
+
+    def allocate_resources(self, strategy: str = "greedy") -> None:
         """
         Attempts to allocate available resources to pending incidents.
         Priority is given to high-priority incidents.
+
+        :param strategy: 'greedy' serves incidents one at a time in priority order with
+                         the closest free unit (preempting if enabled). 'batch' solves one
+                         min-cost assignment of free units over all waiting incidents,
+                         trading a little time for a lower total response distance.
         """
-        # Sort incidents by priority (high to low)
-        sorted_incidents = sorted(
-        self.incidents,
-        key=lambda i: (-i.priority.value, i.timestamp)  #  First by priority desc, then by timestamp asc
-        )
+        if strategy == "greedy":
+            for incident in self._waiting_in_order():
+                self._allocate_for_incident(incident)
+        elif strategy == "batch":
+            self._allocate_batch()
+        else:
+            raise ValueError(f"Unknown allocation strategy: {strategy}")
+        self._dirty_types.clear()
+        self.events.flush()
+        self._flush_store()
+
+    def _allocate_for_incident(self, incident: Incident) -> None:
+        """
+        Allocates the closest available resource for every missing unit of an incident,
+        all units of a multi-unit requirement in the same pass.
+        """
+        if incident.status == "Resolved":
+            return
+
+        position = self._position(incident)
+        for required_type, missing in incident.needs().items():
+            for _ in range(missing):
+                resource = self._find_available_resource(required_type, incident.zone_id, position)
+                if resource:
+                    self._assign(incident, resource)
+                elif not (self.preemption and self._preempt(incident, required_type)):
+                    self._report_waiting(incident, required_type)
+                    break
+
+        # Update incident status if all resources are fulfilled
+        if incident.is_fulfilled():
+            incident.update_status("In Progress")
+
+    def _preempt(self, incident: Incident, resource_type_str: str) -> bool:
+        """
+        Moves the cheapest unit of a type from a lower-priority incident to this one.
+        The victim incident reverts to Pending and is re-queued for allocation.
 
+        :return: True if a unit was reallocated, False if none could be taken.
+        """
+        try:
+            resource_type = ResourceType(resource_type_str)
+        except ValueError:
+            return False
+
+        found = self._allocated.cheapest_below(resource_type, incident.priority, incident.zone_id)
+        if not found:
+            return False
+
+        resource, victim = found
+        victim.allocated_resources.remove(resource)
+        if self.events.enabled_for(EventLevel.WARNING):
+            self.events.emit(AllocationEvent(
+                "PREEMPTED", EventLevel.WARNING,
+                resource_type=resource.resource_type, victim_id=victim.incident_id,
+                victim_priority=victim.priority, incident_id=incident.incident_id,
+                priority=incident.priority
+            ))
+        self._assign(incident, resource)
+        if victim.status != "Resolved":
+            victim.update_status("Pending")
+            self._enqueue(victim)
+            self._wait_for(victim, resource.resource_type)
+        return True
+
+    def _allocate_batch(self) -> None:
+        """
+        Allocates for every waiting incident at once using the min-cost batch solver.
+        """
+        waiting = self._waiting_in_order()
+        requirements = [
+            (incident, required_type)
+            for incident in waiting
+            for required_type, missing in incident.needs().items()
+            for _ in range(missing)
+        ]
+        assignments = solve_batch_assignment(requirements, self._availability, self._distances)
 
-        for incident in sorted_incidents:
-            if incident.status == "Resolved":
-                continue
+        for incident in waiting:
+            for required_type, missing in incident.needs().items():
+                units = assignments.get((id(incident), required_type), ())
+                for resource in units:
+                    self._assign(incident, resource)
+                if len(units) < missing:
+                    self._report_waiting(incident, required_type)
 
-            for required_type in incident.required_resources:
-                if not _is_resource_type_allocated(incident, required_type):
-                    resource = self._find_available_resource(required_type, incident.location)
-                    if resource:
-                        incident.allocated_resources.append(resource)
-                        resource.assign_to_incident(incident.incident_id)
-                        distance = calculate_zone_distance(resource.location, incident.location)
-                        print(
-                            f"[ALLOCATED] {resource.resource_type} from {resource.location} "
-                            f"→ Incident {incident.incident_id} ({incident.location}) "
-                            f"[Distance: {distance} zone(s)]"
-                        )
-
-                    else:
-                        print(f"[WAITING] No available {required_type} for Incident {incident.incident_id}")
-
-            # Update incident status if all resources are fulfilled
             if incident.is_fulfilled():
                 incident.update_status("In Progress")
 
-    def _find_available_resource(self, resource_type_str: str, incident_location: str) -> Optional[Resource]:
+    def _assign(self, incident: Incident, resource: Resource) -> None:
+        """
+        Attaches a resource to an incident and logs the allocation.
+        """
+        incident.allocated_resources.append(resource)
+        resource.assign_to_incident(incident.incident_id)
+        self._allocated.add(resource, incident)
+        if self.journal:
+            self.journal.record_allocation(incident, resource)
+            self._compact_journal_if_due()
+        if self.events.enabled_for(EventLevel.INFO):
+            self.events.emit(AllocationEvent(
+                "ALLOCATED", EventLevel.INFO,
+                resource_type=resource.resource_type, resource_location=resource.location,
+                incident_id=incident.incident_id, incident_location=incident.location,
+                distance=self._distances.distance(resource.zone_id, incident.zone_id)
+            ))
+
+    def _report_waiting(self, incident: Incident, required_type: str) -> None:
+        """
+        Queues an incident for a requirement that could not be served and emits a WAITING event.
+        Unknown types are reported but never queued, as no unit can serve them.
+        """
+        try:
+            self._wait_for(incident, ResourceType(required_type))
+        except ValueError:
+            pass
+        if self.events.enabled_for(EventLevel.DEBUG):
+            self.events.emit(AllocationEvent(
+                "WAITING", EventLevel.DEBUG, resource_type=required_type, incident_id=incident.incident_id
+            ))
+
+    def _find_available_resource(
+        self,
+        resource_type_str: str,
+        incident_zone: int,
+        position: Optional[Tuple[float, float]] = None
+    ) -> Optional[Resource]:
         """
         Finds the closest available resource of the given type.
 
         :param resource_type_str: Resource type as a string (e.g., 'Ambulance')
-        :param incident_location: Incident location to compare proximity
+        :param incident_zone: Interned zone id of the incident to compare proximity
+        :param position: Planar position of the incident; when given, the spatial
+                         index picks the unit instead of the zone index
         :return: Closest available Resource or None
         """
-        available_resources = [
-            r for r in self.resources
-            if r.resource_type.value == resource_type_str and r.is_available
-        ]
+        try:
+            resource_type = ResourceType(resource_type_str)
+        except ValueError:
+            return None  # Unknown resource type can never be allocated
 
-        if not available_resources:
-            return None
+        if position is not None:
+            return self._spatial.nearest(resource_type, position)
+        return self._availability.nearest(resource_type, incident_zone)
+
+    def _nearest_free(self, resource_type: ResourceType, incident: Incident) -> Optional[Resource]:
+        """
+        Finds the closest free unit of a type for an incident, by position when a
+        spatial index is configured and by zone otherwise.
+        """
+        position = self._position(incident)
+        if position is not None:
+            return self._spatial.nearest(resource_type, position)
+        return self._availability.nearest(resource_type, incident.zone_id)
+
+    def _position(self, incident: Incident) -> Optional[Tuple[float, float]]:
+        """
+        Returns the incident's planar position, or None without a spatial index
+        (or when neither coordinates nor a zone centroid are known).
+        """
+        return None if self._spatial is None else self._spatial.position(incident)
+
+    def resolve_incident(self, incident_id: int) -> Optional[Incident]:
+        """
+        Marks an incident resolved, releases its units and redeploys them right away
+        to the waiting incidents that need those types.
+
+        :param incident_id: ID of the incident to resolve.
+        :return: The resolved Incident, or None if there is no such incident.
+        """
+        resolved = self.resolve_incidents([incident_id])
+        return resolved[0] if resolved else None
+
+    def resolve_incidents(self, incident_ids: Iterable[int]) -> List[Incident]:
+        """
+        Resolves several incidents, then runs one allocation step for all freed units.
 
-        # Find the closest resource by zone distance
-        closest = min(available_resources, key=lambda r: calculate_zone_distance(r.location, incident_location))
-        return closest
+        :param incident_ids: IDs of the incidents to resolve; unknown IDs are skipped.
+        :return: The resolved incidents.
+        """
+        resolved = []
+        for incident_id in incident_ids:
+            incident = self.get_incident(incident_id)
+            if incident is None:
+                continue
+            incident.update_status("Resolved")
+            self._release_incident(incident)
+            resolved.append(incident)
+
+        if self._dirty_types:
+            if self.incremental:
+                self._serve_wait_queues()
+            else:
+                self.allocate_resources()
+        self.events.flush()
+        self._flush_store()
+        return resolved
+
+    def _release_incident(self, incident: Incident) -> None:
+        """
+        Returns all units held by an incident to the available pool.
+        """
+        for resource in incident.allocated_resources:
+            resource.release()
+        incident.allocated_resources.clear()
+        self._resolved_holding.pop(incident.incident_id, None)
 
     def release_resources_from_resolved(self) -> None:
         """
         Releases all resources from resolved incidents, making them available again.
+        Only resolved incidents still holding units are visited.
         """
-        for incident in self.incidents:
+        for incident in list(self._resolved_holding.values()):
             if incident.status == "Resolved":
-                for resource in incident.allocated_resources:
-                    resource.release()
-                incident.allocated_resources.clear()
+                self._release_incident(incident)
+            else:
+                del self._resolved_holding[incident.incident_id]  # Reopened since
+        self._flush_store()
+
+    def lend_resource(self, resource_type_str: str, location: str, incident_id: int) -> Optional[Resource]:
+        """
+        Takes the closest free unit of a type out of local service for an incident
+        managed elsewhere (e.g., by another shard). The unit shows as assigned to that
+        incident ID, cannot be preempted here, and stays out until return_resource.
+        The loan is journaled, so after a restart the unit is still out of service.
+
+        :param resource_type_str: Resource type as a string (e.g., 'Ambulance').
+        :param location: Location of the remote incident, used for proximity.
+        :param incident_id: ID of the remote incident.
+        :return: The lent Resource, or None if no unit of that type is free.
+        """
+        resource = self._find_available_resource(resource_type_str, ZONES.intern(location))
+        if resource is None:
+            return None
+        resource.assign_to_incident(incident_id)
+        if self.journal:
+            self.journal.record_lend(resource)
+            self._compact_journal_if_due()
+        if self.events.enabled_for(EventLevel.INFO):
+            self.events.emit(AllocationEvent(
+                "LENT", EventLevel.INFO,
+                resource_type=resource.resource_type, resource_location=resource.location,
+                incident_id=incident_id, incident_location=location
+            ))
+        self._flush_store()
+        return resource
+
+    def return_resource(self, resource_id: int) -> None:
+        """
+        Puts a lent unit back into local service and redeploys it to a waiting incident.
+        """
+        resource = self.get_resource(resource_id)
+        if resource is None or resource.is_available:
+            return
+        resource.release()  # Journaled as a release by the resource listener
+        if self.events.enabled_for(EventLevel.INFO):
+            self.events.emit(AllocationEvent(
+                "RETURNED", EventLevel.INFO, resource_type=resource.resource_type, resource_location=resource.location
+            ))
+        if self.incremental:
+            self._serve_wait_queues()
+        else:
+            self.allocate_resources()
+        self.events.flush()
+        self._flush_store()
+
+    def attach_borrowed(self, incident_id: int, resource: Resource) -> bool:
+        """
+        Attaches a unit owned elsewhere to an incident that is waiting for its type.
+        The unit is not added to the local fleet or preemption index; it is released
+        with the incident, and the caller hands it back to its owner. The attachment
+        is not journaled, as the unit belongs to the lender's state: after a restart
+        the incident needs the type again.
+
+        :return: True if attached, False if the incident is gone, resolved or no longer needs the type.
+        """
+        incident = self.get_incident(incident_id)
+        if (
+            incident is None
+            or incident.status == "Resolved"
+            or not incident.outstanding(resource.resource_type.value)
+        ):
+            return False
+        incident.allocated_resources.append(resource)
+        resource.assign_to_incident(incident_id)
+        if self.events.enabled_for(EventLevel.INFO):
+            self.events.emit(AllocationEvent(
+                "BORROWED", EventLevel.INFO,
+                resource_type=resource.resource_type, resource_location=resource.location,
+                incident_id=incident_id, incident_location=incident.location
+            ))
+        if incident.is_fulfilled():
+            incident.update_status("In Progress")
+        self._flush_store()
+        return True
 
     def get_all_incidents(self) -> List[Incident]:
         """
-        Returns a list of all recorded incidents.
+        Returns a list of all recorded incidents, materializing any lazy history first.
         """
+        if self._history:
+            history = list(self._history)
+            for incident in history:
+                self._register_incident(incident, counted=True)
+            self.incidents[:0] = history
+        self._history = None
         return self.incidents
 
+    def waiting_incidents(self) -> List[Incident]:
+        """
+        Returns the unresolved incidents still missing units, highest priority first.
+        Read from the waiting queue, so the cost follows the backlog, not the history.
+        """
+        return self._waiting_in_order()
+
+    def get_incident(self, incident_id: int) -> Optional[Incident]:
+        """
+        Looks up an incident by ID, decoding it from lazy history if needed.
+
+        :return: The Incident, or None if there is no such incident.
+        """
+        incident = self._incident_lookup.get(incident_id)
+        if incident is None and isinstance(self._history, LazyIncidentHistory):
+            incident = self._history.pop_by_id(incident_id)
+            if incident is not None:
+                self.incidents.append(incident)
+                self._register_incident(incident, counted=True)
+        elif incident is None and self._history:
+            self.get_all_incidents()
+            incident = self._incident_lookup.get(incident_id)
+        return incident
+
+    def find_incidents(
+        self,
+        status: Optional[str] = None,
+        zone: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> List[Incident]:
+        """
+        Returns incidents matching all given filters by intersecting the secondary
+        indexes. Matching is case-insensitive, as in the dashboard filters.
+
+        :param status: Status to match, e.g. 'Pending'.
+        :param zone: Zone to match, e.g. 'Zone 1'.
+        :param priority: Priority name to match, e.g. 'High'.
+        :return: Matching incidents ordered by ID.
+        """
+        if self._history and (status is None or status.lower() == "resolved"):
+            self.get_all_incidents()  # History only holds resolved incidents
+        return self._incident_lookup.find(
+            status=status.lower() if status else None,
+            zone=zone.lower() if zone else None,
+            priority=priority.lower() if priority else None
+        )
+
+    def get_resource(self, resource_id: int) -> Optional[Resource]:
+        """
+        Looks up a resource by ID.
+
+        :return: The Resource, or None if there is no such resource.
+        """
+        return self._resource_lookup.get(resource_id)
+
+    def find_resources(
+        self,
+        resource_type: Optional[ResourceType] = None,
+        zone: Optional[str] = None,
+        available: Optional[bool] = None
+    ) -> List[Resource]:
+        """
+        Returns resources matching all given filters by intersecting the secondary indexes.
+
+        :param resource_type: ResourceType to match.
+        :param zone: Zone to match (case-insensitive).
+        :param available: True for free units, False for assigned ones.
+        :return: Matching resources ordered by ID.
+        """
+        return self._resource_lookup.find(
+            type=resource_type,
+            zone=zone.lower() if zone else None,
+            available=available
+        )
+
+    def nearest_resources(
+        self,
+        resource_type: ResourceType,
+        location: str,
+        k: int = 1,
+        coordinates: Optional[Tuple[float, float]] = None
+    ) -> List[Resource]:
+        """
+        Returns the k closest available units of a type to a position.
+
+        :param resource_type: ResourceType to match.
+        :param location: Zone of the position, used for its centroid when no coordinates are given.
+        :param k: Number of units to return.
+        :param coordinates: Planar (x, y) position to measure from.
+        :return: Up to k available resources, closest first.
+        """
+        if self._spatial is None:
+            raise ValueError("nearest_resources needs a manager created with a SpatialIndex")
+        point = coordinates if coordinates is not None else self._spatial.centroid(ZONES.intern(location))
+        if point is None:
+            return []
+        return [resource for _, resource in self._spatial.k_nearest(resource_type, point, k)]
+
+    def move_resource(
+        self,
+        resource_id: int,
+        location: Optional[str] = None,
+        coordinates: Optional[Tuple[float, float]] = None
+    ) -> Optional[Resource]:
+        """
+        Records that a unit moved, e.g. from a GPS update, and re-indexes only that unit.
+
+        :param resource_id: ID of the unit.
+        :param location: New zone, if it changed.
+        :param coordinates: New planar (x, y) position, if known.
+        :return: The moved Resource, or None if the ID is unknown.
+        """
+        resource = self.get_resource(resource_id)
+        if resource is None:
+            return None
+        if location is not None:
+            resource.location = location
+        if coordinates is not None:
+            resource.coordinates = coordinates
+        self._availability.update(resource)
+        if self._spatial is not None:
+            self._spatial.update(resource)
+        self._counters.resource_changed(resource)
+        self._resource_lookup.update(resource)
+        if self.store is not None:
+            self.store.mark_dirty(resource)
+        if self.journal:
+            self.journal.record_move(resource)
+            self._compact_journal_if_due()
+        self._flush_store()
+        return resource
+
     def get_all_resources(self) -> List[Resource]:
         """
         Returns a list of all managed resources.
         """
         return self.resources
 
+    def summary_counts(
+        self,
+        status_filter: Optional[str] = None,
+        zone_filter: Optional[str] = None,
+        priority_filter: Optional[str] = None
+    ) -> dict:
+        """
+        Counts incidents by status, priority and zone, and resources by availability.
+        Answered from live aggregates kept up to date by the listeners, so the cost
+        does not grow with history; with a store attached the counting runs in SQL.
+
+        :param status_filter: Filter by incident status (case-insensitive).
+        :param zone_filter: Filter by zone (case-insensitive).
+        :param priority_filter: Filter by priority name (case-insensitive).
+        :return: Dict with 'total', 'status', 'priority' (by name) and 'zone' incident
+                 counts, and 'resources' / 'available' unit counts.
+        """
+        if self.store is not None:
+            return self.store.summary(status_filter, zone_filter, priority_filter)
+
+        return self._counters.summary(status_filter, zone_filter, priority_filter)
+
+    def metrics(self) -> dict:
+        """
+        Returns the recorded timings, search statistics and current queue depths,
+        or an empty dict if the manager was created without metrics.
+        Write the result with utils.metrics.write_prometheus for scraping.
+        """
+        if self._metrics is None:
+            return {}
+        depths = {}
+        for resource_type in self._wait_queues:
+            self._drop_stale_heads(resource_type)
+            depths[resource_type.value] = len(self._wait_queues[resource_type])
+        return self._metrics.snapshot({
+            'pending_incidents': self._counters.summary()['status'].get("Pending", 0),
+            'waiting_queue_entries': sum(depths.values()),
+            'wait_queue_depth': {'label': 'resource_type', 'values': depths},
+            'available_units': self._counters.available_units(),
+        })
+
     def generate_summary_report(
         self,
         export: bool = False,
@@ -148,39 +921,26 @@ class ResourceManager:
         :param priority_filter: Filter by priority (High, Medium, Low).
         """
         report_lines = ["===== DASHBOARD SUMMARY ====="]
-
-        # Apply filters
-        filtered_incidents = self.incidents
-        if status_filter:
-            filtered_incidents = [i for i in filtered_incidents if i.status.lower() == status_filter.lower()]
-        if zone_filter:
-            filtered_incidents = [i for i in filtered_incidents if i.location.lower() == zone_filter.lower()]
-        if priority_filter:
-            filtered_incidents = [i for i in filtered_incidents if i.priority.name.lower() == priority_filter.lower()]
+        summary = self.summary_counts(status_filter, zone_filter, priority_filter)
 
         report_lines.append(f"\n Filters Applied: "
                             f"{status_filter or 'All'} / {zone_filter or 'All'} / {priority_filter or 'All'}")
 
-        # Generate summary from filtered list
-        total = len(filtered_incidents)
-        status_count = Counter(i.status for i in filtered_incidents)
-        priority_count = Counter(i.priority.name for i in filtered_incidents)
-        zone_count = Counter(i.location for i in filtered_incidents)
-
-        report_lines.append(f"\n Total Filtered Incidents: {total}")
+        report_lines.append(f"\n Total Filtered Incidents: {summary['total']}")
         for status in ["Pending", "In Progress", "Resolved"]:
-            report_lines.append(f"   - {status:<11}: {status_count.get(status, 0)}")
+            report_lines.append(f"   - {status:<11}: {summary['status'].get(status, 0)}")
 
         report_lines.append("\n Incident Priorities:")
-        for p, count in priority_count.items():
-            report_lines.append(f"   - {p.capitalize():<8}: {count}")
+        for p in PriorityLevel:
+            if summary['priority'].get(p.name):
+                report_lines.append(f"   - {p.name.capitalize():<8}: {summary['priority'][p.name]}")
 
         report_lines.append("\n Incidents per Zone:")
-        for zone, count in sorted(zone_count.items()):
+        for zone, count in sorted(summary['zone'].items()):
             report_lines.append(f"   - {zone:<10}: {count}")
 
-        total_resources = len(self.resources)
-        available = sum(1 for r in self.resources if r.is_available)
+        total_resources = summary['resources']
+        available = summary['available']
         assigned = total_resources - available
 
         report_lines.append(f"\n Resources: {total_resources}")
@@ -0,0 +1,372 @@
+# services/sharded_manager.py
+
+import multiprocessing
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+from utils.zones import parse_zone_number
+
+# Wire formats. Objects are rebuilt inside each worker because interned zone ids
+# and listeners are local to a process.
+#   resource: (resource_id, type value, location, coordinates)
+#   incident: (incident_id, location, emergency_type, priority value, required types, timestamp, coordinates)
+#   need:     (incident_id, location, priority value, resource type value)
+
+_TYPE_VALUES = {t.value for t in ResourceType}
+
+
+def partition_zones(zone_count: int, shards: int) -> List[List[str]]:
+    """
+    Splits 'Zone 1' .. 'Zone N' into contiguous regions, so neighbouring zones
+    (the cheapest borrowing candidates) mostly share a shard.
+    """
+    regions: List[List[str]] = [[] for _ in range(shards)]
+    for number in range(1, zone_count + 1):
+        regions[(number - 1) * shards // zone_count].append(f"Zone {number}")
+    return regions
+
+
+class ShardedResourceManager:
+    """
+    Runs allocation in several worker processes, one per region of zones.
+
+    Each worker owns a ResourceManager with the units and incidents of its region,
+    so batches for different regions are allocated in parallel. The coordinator
+    routes incidents and units by location. When a shard has neither a free nor a
+    preemptable unit of a required type, the need is offered to the other shards,
+    closest region first: a lender takes its nearest free unit out of service
+    (ResourceManager.lend_resource) and the borrower attaches it to the incident.
+    When the incident is resolved the unit goes back to its lender, which
+    redeploys it locally.
+
+    Sharded mode is not journaled: each worker keeps its state, including which
+    units are on loan to which shard, in memory only, and a restart starts from
+    empty shards. Use a journaled ResourceManager where state must survive restarts.
+    """
+
+    def __init__(self, regions: Sequence[Sequence[str]], context: Optional[str] = None):
+        """
+        Starts one worker process per region.
+
+        :param regions: Location strings of each shard's zones (see partition_zones).
+                        Unlisted locations are routed by zone number to the region with
+                        the closest centre, or by a stable hash if they have no number.
+        :param context: multiprocessing start method ('fork', 'spawn', ...); platform default if None.
+        """
+        ctx = multiprocessing.get_context(context)
+        self._route: Dict[str, int] = {}
+        self._centres: List[Optional[float]] = []
+        for shard, locations in enumerate(regions):
+            numbers = []
+            for location in locations:
+                self._route[location.lower()] = shard
+                number = parse_zone_number(location)
+                if number is not None:
+                    numbers.append(number)
+            self._centres.append(sum(numbers) / len(numbers) if numbers else None)
+
+        self._connections = []
+        self._processes = []
+        for shard in range(len(regions)):
+            parent, child = ctx.Pipe()
+            process = ctx.Process(target=_shard_worker, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+        self._incident_shard: Dict[int, int] = {}
+        self.borrowed = 0  # Units lent across shards so far
+
+    # ------------------------ Routing ------------------------
+
+    def shard_of(self, location: str) -> int:
+        """
+        Returns the shard responsible for a location.
+        """
+        key = location.lower()
+        shard = self._route.get(key)
+        if shard is None:
+            number = parse_zone_number(location)
+            centred = [(abs(c - number), s) for s, c in enumerate(self._centres) if c is not None] \
+                if number is not None else []
+            if centred:
+                shard = min(centred)[1]
+            else:
+                shard = zlib.crc32(key.encode()) % len(self._connections)
+            self._route[key] = shard
+        return shard
+
+    def _lenders(self, location: str, borrower: int) -> List[int]:
+        """
+        Other shards ordered by how close their region's centre is to a location.
+        """
+        number = parse_zone_number(location)
+        others = [s for s in range(len(self._connections)) if s != borrower]
+        if number is None:
+            return others
+        return sorted(
+            others,
+            key=lambda s: float("inf") if self._centres[s] is None else abs(self._centres[s] - number)
+        )
+
+    # ------------------------ Commands ------------------------
+
+    def _call_all(self, requests: Dict[int, Tuple[str, object]]) -> Dict[int, object]:
+        """
+        Sends one request to each listed shard, then collects the replies, so the
+        shards work in parallel.
+        """
+        for shard, request in requests.items():
+            self._connections[shard].send(request)
+        replies = {}
+        for shard in requests:
+            ok, reply = self._connections[shard].recv()
+            if not ok:
+                raise RuntimeError(f"Shard {shard} failed: {reply}")
+            replies[shard] = reply
+        return replies
+
+    def add_resources(self, resources: Iterable[Resource]) -> None:
+        """
+        Adds units to the shards of their locations.
+        """
+        batches = defaultdict(list)
+        for resource in resources:
+            batches[self.shard_of(resource.location)].append(
+                (resource.resource_id, resource.resource_type.value, resource.location, resource.coordinates)
+            )
+        self._call_all({shard: ("add_resources", rows) for shard, rows in batches.items()})
+
+    def add_incidents(self, incidents: Iterable[Incident]) -> None:
+        """
+        Allocates a batch of incidents, each shard serving its own region in parallel,
+        then borrows across shards for the requirements no shard could meet locally.
+        """
+        batches = defaultdict(list)
+        for incident in incidents:
+            shard = self.shard_of(incident.location)
+            self._incident_shard[incident.incident_id] = shard
+            batches[shard].append((
+                incident.incident_id, incident.location, incident.emergency_type,
+                incident.priority.value, list(incident.required_resources), incident.timestamp,
+                incident.coordinates
+            ))
+        replies = self._call_all({shard: ("add_incidents", rows) for shard, rows in batches.items()})
+        self._borrow(replies)
+
+    def rebalance(self) -> None:
+        """
+        Offers every shard's unmet needs to the other shards again, e.g. after
+        units were added or freed elsewhere.
+        """
+        replies = self._call_all({shard: ("needs", None) for shard in range(len(self._connections))})
+        self._borrow(replies)
+
+    def _borrow(self, needs_by_shard: Dict[int, List[tuple]]) -> None:
+        """
+        Borrowing protocol: unmet needs are served highest priority first, asking
+        lenders in order of proximity; each round sends every lender its share of
+        requests in one message.
+        """
+        # (borrower shard, need, lenders still to ask), highest priority first
+        pending = [
+            (shard, need, self._lenders(need[1], shard))
+            for shard, needs in needs_by_shard.items() for need in needs
+        ]
+        pending.sort(key=lambda item: -item[1][2])
+        grants: Dict[int, List[tuple]] = defaultdict(list)  # Borrower shard -> (incident_id, lender, resource row)
+
+        while pending:
+            requests: Dict[int, List[tuple]] = defaultdict(list)
+            for shard, need, lenders in pending:
+                if lenders:
+                    requests[lenders.pop(0)].append((shard, need, lenders))
+            if not requests:
+                break
+            replies = self._call_all({
+                lender: ("lend", [need for _, need, _ in asked]) for lender, asked in requests.items()
+            })
+            pending = []
+            for lender, rows in replies.items():
+                for (shard, need, lenders), row in zip(requests[lender], rows):
+                    if row is not None:
+                        grants[shard].append((need[0], lender, row))
+                    elif lenders:
+                        pending.append((shard, need, lenders))
+            pending.sort(key=lambda item: -item[1][2])
+
+        if grants:
+            replies = self._call_all({shard: ("attach", rows) for shard, rows in grants.items()})
+            self.borrowed += sum(len(rows) for rows in grants.values())
+            self._return_units([unit for rejected in replies.values() for unit in rejected])
+
+    def resolve_incidents(self, incident_ids: Iterable[int]) -> List[int]:
+        """
+        Resolves incidents on their shards and hands borrowed units back to their lenders.
+        Resolved incidents are forgotten by the router, so resolving one again is a no-op.
+
+        :return: IDs of the incidents that were resolved.
+        """
+        batches = defaultdict(list)
+        for incident_id in incident_ids:
+            shard = self._incident_shard.get(incident_id)
+            if shard is not None:
+                batches[shard].append(incident_id)
+        replies = self._call_all({shard: ("resolve", ids) for shard, ids in batches.items()})
+        resolved = []
+        returned = []
+        for ids, units in replies.values():
+            resolved.extend(ids)
+            returned.extend(units)
+        for incident_id in resolved:
+            self._incident_shard.pop(incident_id, None)  # Resolved incidents take no further commands
+        self._return_units(returned)
+        return resolved
+
+    def _return_units(self, units: List[Tuple[int, int]]) -> None:
+        """
+        :param units: (resource_id, lender shard) pairs.
+        """
+        by_lender = defaultdict(list)
+        for resource_id, lender in units:
+            by_lender[lender].append(resource_id)
+        if by_lender:
+            self._call_all({lender: ("return", ids) for lender, ids in by_lender.items()})
+
+    # ------------------------ Queries ------------------------
+
+    def summary_counts(self, status_filter=None, zone_filter=None, priority_filter=None) -> dict:
+        """
+        Merges the shards' dashboard counts (see ResourceManager.summary_counts).
+        Lent units count once, as assigned, in their home shard.
+        """
+        replies = self._call_all({
+            shard: ("summary", (status_filter, zone_filter, priority_filter))
+            for shard in range(len(self._connections))
+        })
+        merged = {'total': 0, 'status': Counter(), 'priority': Counter(), 'zone': Counter(), 'resources': 0, 'available': 0}
+        for summary in replies.values():
+            for key in ('total', 'resources', 'available'):
+                merged[key] += summary[key]
+            for key in ('status', 'priority', 'zone'):
+                merged[key].update(summary[key])
+        for key in ('status', 'priority', 'zone'):
+            merged[key] = dict(merged[key])
+        return merged
+
+    def incident_states(self) -> Dict[int, Tuple[str, List[int]]]:
+        """
+        Returns incident ID -> (status, allocated resource IDs) across all shards.
+        """
+        states = {}
+        for reply in self._call_all({shard: ("states", None) for shard in range(len(self._connections))}).values():
+            states.update(reply)
+        return states
+
+    def close(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        for connection in self._connections:
+            connection.send(("stop", None))
+        for connection, process in zip(self._connections, self._processes):
+            connection.recv()
+            process.join()
+            connection.close()
+
+
+# ------------------------ Worker process ------------------------
+
+def _shard_worker(connection) -> None:
+    """
+    Serves one shard: applies requests to its ResourceManager until told to stop.
+    """
+    manager = ResourceManager(events=NullSink())
+    lenders: Dict[int, int] = {}  # Borrowed resource ID -> lender shard
+
+    def needs_of(incidents: Iterable[Incident]) -> List[tuple]:
+        needs = []
+        for incident in incidents:
+            if incident.status == "Resolved":
+                continue
+            for required, missing in incident.needs().items():
+                if required in _TYPE_VALUES:
+                    # One need per missing unit; each is lent one unit
+                    need = (incident.incident_id, incident.location, incident.priority.value, required)
+                    needs.extend([need] * missing)
+        return needs
+
+    def add_resources(rows):
+        for resource_id, type_value, location, coordinates in rows:
+            manager.add_resource(Resource(resource_id, ResourceType(type_value), location, coordinates=coordinates))
+
+    def add_incidents(rows):
+        incidents = [
+            Incident(incident_id, location, emergency_type, PriorityLevel(priority), required, timestamp, coordinates)
+            for incident_id, location, emergency_type, priority, required, timestamp, coordinates in rows
+        ]
+        manager.add_incidents(incidents)
+        return needs_of(incidents)
+
+    def lend(needs):
+        rows = []
+        for incident_id, location, _, type_value in needs:
+            resource = manager.lend_resource(type_value, location, incident_id)
+            rows.append(None if resource is None else (
+                resource.resource_id, type_value, resource.location, resource.coordinates
+            ))
+        return rows
+
+    def attach(grants):
+        rejected = []
+        for incident_id, lender, (resource_id, type_value, location, coordinates) in grants:
+            resource = Resource(resource_id, ResourceType(type_value), location, coordinates=coordinates)
+            if manager.attach_borrowed(incident_id, resource):
+                lenders[resource_id] = lender
+            else:
+                rejected.append((resource_id, lender))
+        return rejected
+
+    def resolve(ids):
+        returned = []
+        for incident_id in ids:
+            incident = manager.get_incident(incident_id)
+            if incident is not None:
+                returned.extend(
+                    (r.resource_id, lenders.pop(r.resource_id))
+                    for r in incident.allocated_resources if r.resource_id in lenders
+                )
+        return [i.incident_id for i in manager.resolve_incidents(ids)], returned
+
+    def return_units(ids):
+        for resource_id in ids:
+            manager.return_resource(resource_id)
+
+    handlers = {
+        "add_resources": add_resources,
+        "add_incidents": add_incidents,
+        "needs": lambda _: needs_of(manager.waiting_incidents()),
+        "lend": lend,
+        "attach": attach,
+        "resolve": resolve,
+        "return": return_units,
+        "summary": lambda filters: manager.summary_counts(*filters),
+        "states": lambda _: {
+            i.incident_id: (i.status, [r.resource_id for r in i.allocated_resources]) for i in manager.incidents
+        },
+    }
+    while True:
+        op, payload = connection.recv()
+        if op == "stop":
+            connection.send((True, None))
+            return
+        try:
+            connection.send((True, handlers[op](payload)))
+        except Exception as e:
+            connection.send((False, f"{type(e).__name__}: {e}"))
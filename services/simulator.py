@@ -0,0 +1,274 @@
+# services/simulator.py
+
+import heapq
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+
+# Event kinds, in the order they are handled when they fall on the same instant
+ARRIVAL, ON_SCENE, RESOLVE = 0, 1, 2
+
+
+def default_travel_time(distance: float) -> float:
+    """
+    Seconds for a unit to reach a scene: one minute to turn out plus two per zone.
+    """
+    return 60.0 + 120.0 * distance
+
+
+class Simulator:
+    """
+    Discrete-event simulator that drives a ResourceManager on a virtual clock.
+
+    Events live in a heap of (time, seq, kind, payload) and are processed in time
+    order; nothing waits in real time, so a day of traffic replays as fast as the
+    allocator can serve it. Arrivals add incidents (stamped with the virtual time,
+    which also orders the manager's wait queues). Dispatches are observed through
+    resource listeners whenever the manager assigns a unit, and schedule the
+    unit's arrival on scene after its travel time. Once every unit an incident
+    needs is on scene, a resolve event is scheduled after its service time;
+    resolving releases the units, and the manager redeploys them to waiting
+    incidents at that same instant.
+
+    A unit preempted while travelling is simply re-dispatched: its pending
+    on-scene event becomes stale and is ignored.
+    """
+
+    def __init__(
+        self,
+        manager: Optional[ResourceManager] = None,
+        travel_time: Callable[[float], float] = default_travel_time,
+        service_time: Optional[Callable[[Incident], float]] = None,
+        start: datetime = datetime(2024, 1, 1),
+        seed: int = 7
+    ):
+        """
+        :param manager: ResourceManager to drive. Defaults to a quiet incremental one.
+        :param travel_time: Seconds to travel a distance reported by the manager's distance provider.
+        :param service_time: Seconds an incident takes once all its units are on scene.
+                             Defaults to an exponential draw with a 30 minute mean.
+        :param start: Wall-clock time of virtual second 0, used for incident timestamps.
+        :param seed: Seed for the default service time draws.
+        """
+        self.manager = ResourceManager(events=NullSink()) if manager is None else manager
+        self.travel_time = travel_time
+        rng = random.Random(seed)
+        self.service_time = service_time or (lambda incident: rng.expovariate(1 / 1800.0))
+        self.start = start
+        self.now = 0.0
+        self.events_processed = 0
+
+        self._events: List[Tuple[float, int, int, object]] = []
+        self._seq = 0
+        self._incidents: Dict[int, Incident] = {}
+        self._arrived_at: Dict[int, float] = {}
+        # Resource ID -> (incident ID, dispatch time, token); the token invalidates
+        # on-scene events of a unit that was preempted on the way
+        self._dispatched: Dict[int, Tuple[int, float, int]] = {}
+        self._on_scene: Dict[int, Set[int]] = defaultdict(set)
+        self._resolving: Set[int] = set()
+        self._unit_keys: Dict[int, Tuple[str, str]] = {}  # Resource ID -> (type, home zone)
+
+        self._first_response: Dict[int, float] = {}
+        self._full_response: Dict[int, float] = {}
+        self._queue_waits: Dict[str, List[float]] = defaultdict(list)
+        self._busy: Dict[Tuple[str, str], float] = defaultdict(float)
+
+        for resource in self.manager.resources:
+            self._watch(resource)
+
+    # ------------------------ Scenario setup ------------------------
+
+    def add_resource(self, resource: Resource) -> None:
+        """
+        Adds a unit to the fleet at the current virtual time.
+        """
+        self.manager.add_resource(resource)
+        self._watch(resource)
+
+    def schedule_arrival(self, incident: Incident, at: float) -> None:
+        """
+        Schedules an incident to be reported at a virtual time.
+
+        :param at: Seconds since the start of the simulation.
+        """
+        self._push(at, ARRIVAL, incident)
+
+    def schedule_incidents(self, incidents: Iterable[Incident]) -> None:
+        """
+        Schedules recorded incidents at their timestamps' offsets from `start`
+        (e.g., last year's incidents loaded with load_data).
+        """
+        for incident in incidents:
+            self._push((incident.timestamp - self.start).total_seconds(), ARRIVAL, incident)
+
+    # ------------------------ Event loop ------------------------
+
+    def run(self, until: Optional[float] = None) -> dict:
+        """
+        Processes events in time order.
+
+        :param until: Stop before the first event later than this virtual time (seconds).
+        :return: The report (see report()).
+        """
+        handlers = (self._arrive, self._reach_scene, self._resolve)
+        events = self._events
+        wall = time.perf_counter()
+        while events:
+            if until is not None and events[0][0] > until:
+                break
+            at, _, kind, payload = heapq.heappop(events)
+            self.now = at
+            handlers[kind](payload)
+            self.events_processed += 1
+        return self.report(time.perf_counter() - wall)
+
+    def _push(self, at: float, kind: int, payload) -> None:
+        heapq.heappush(self._events, (at, self._seq, kind, payload))
+        self._seq += 1
+
+    def _arrive(self, incident: Incident) -> None:
+        incident.timestamp = self.start + timedelta(seconds=self.now)
+        self._incidents[incident.incident_id] = incident
+        self._arrived_at[incident.incident_id] = self.now
+        self.manager.add_incident(incident)
+        if not incident.required_resources:
+            # Nothing to dispatch: the incident is worked from the moment it is reported
+            self._full_response[incident.incident_id] = 0.0
+            self._resolving.add(incident.incident_id)
+            self._push(self.now + self.service_time(incident), RESOLVE, incident.incident_id)
+
+    def _reach_scene(self, payload: Tuple[Resource, int]) -> None:
+        resource, token = payload
+        dispatch = self._dispatched.get(resource.resource_id)
+        if dispatch is None or dispatch[2] != token:
+            return  # Preempted or released on the way
+        incident_id = dispatch[0]
+        incident = self._incidents.get(incident_id)
+        if incident is None:
+            return
+        on_scene = self._on_scene[incident_id]
+        on_scene.add(resource.resource_id)
+        response = self.now - self._arrived_at[incident_id]
+        self._first_response.setdefault(incident_id, response)
+        if (
+            incident_id not in self._resolving
+            and incident.is_fulfilled()
+            and len(on_scene) >= len(incident.allocated_resources)
+        ):
+            self._full_response[incident_id] = response
+            self._resolving.add(incident_id)
+            self._push(self.now + self.service_time(incident), RESOLVE, incident_id)
+
+    def _resolve(self, incident_id: int) -> None:
+        self._on_scene.pop(incident_id, None)
+        self.manager.resolve_incident(incident_id)
+
+    def _watch(self, resource: Resource) -> None:
+        self._unit_keys[resource.resource_id] = (resource.resource_type.value, resource.location)
+        resource.add_listener(self._on_resource_changed)
+
+    def _on_resource_changed(self, resource: Resource) -> None:
+        """
+        Tracks dispatches and releases as the manager assigns units.
+        """
+        rid = resource.resource_id
+        unit_key = self._unit_keys[rid]
+        previous = self._dispatched.pop(rid, None)
+        if previous is not None:
+            self._busy[unit_key] += self.now - previous[1]
+            on_scene = self._on_scene.get(previous[0])
+            if on_scene:
+                on_scene.discard(rid)
+        incident_id = resource.assigned_to_incident
+        if incident_id is None:
+            return
+        incident = self._incidents.get(incident_id)
+        arrived = self._arrived_at.get(incident_id)
+        if incident is None or arrived is None:
+            return  # Assigned outside the simulation (e.g., a pre-loaded allocation)
+
+        self.events_processed += 1  # The dispatch itself
+        token = self._seq
+        self._dispatched[rid] = (incident_id, self.now, token)
+        self._queue_waits[unit_key[0]].append(self.now - arrived)
+        distance = self.manager.distances.distance(resource.zone_id, incident.zone_id)
+        self._push(self.now + self.travel_time(distance), ON_SCENE, (resource, token))
+
+    # ------------------------ Reporting ------------------------
+
+    def report(self, wall_seconds: float = 0.0) -> dict:
+        """
+        Summarizes the simulation so far.
+
+        :param wall_seconds: Real time spent, for the events-per-second figure.
+        :return: Dict with event counts, response time and queue wait distributions
+                 (seconds), utilization by unit type and by home zone, and unserved counts.
+        """
+        busy = defaultdict(float, self._busy)
+        for rid, (_, dispatched_at, _) in self._dispatched.items():
+            busy[self._unit_keys[rid]] += self.now - dispatched_at
+
+        units_by_type: Dict[str, int] = defaultdict(int)
+        units_by_zone: Dict[str, int] = defaultdict(int)
+        busy_by_type: Dict[str, float] = defaultdict(float)
+        busy_by_zone: Dict[str, float] = defaultdict(float)
+        for rid, (unit_type, zone) in self._unit_keys.items():
+            units_by_type[unit_type] += 1
+            units_by_zone[zone] += 1
+        for (unit_type, zone), seconds in busy.items():
+            busy_by_type[unit_type] += seconds
+            busy_by_zone[zone] += seconds
+
+        horizon = self.now or 1.0
+        by_priority: Dict[str, List[float]] = defaultdict(list)
+        for incident_id, response in self._full_response.items():
+            by_priority[self._incidents[incident_id].priority.name].append(response)
+
+        return {
+            'virtual_seconds': self.now,
+            'wall_seconds': wall_seconds,
+            'events': self.events_processed,
+            'events_per_second': self.events_processed / wall_seconds if wall_seconds else None,
+            'incidents': len(self._incidents),
+            'unserved': len(self._incidents) - len(self._full_response),
+            'first_response': distribution(self._first_response.values()),
+            'full_response': distribution(self._full_response.values()),
+            'full_response_by_priority': {p: distribution(v) for p, v in sorted(by_priority.items())},
+            'queue_wait_by_type': {t: distribution(v) for t, v in sorted(self._queue_waits.items())},
+            'utilization_by_type': {
+                t: busy_by_type[t] / (n * horizon) for t, n in sorted(units_by_type.items())
+            },
+            'utilization_by_zone': {
+                z: busy_by_zone[z] / (n * horizon) for z, n in sorted(units_by_zone.items())
+            },
+        }
+
+
+def distribution(values: Iterable[float]) -> dict:
+    """
+    Summarizes a sample as count, mean and p50/p90/p99/max.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return {'count': 0}
+    n = len(ordered)
+
+    def pick(fraction: float) -> float:
+        return ordered[min(n - 1, int(fraction * n))]
+
+    return {
+        'count': n,
+        'mean': sum(ordered) / n,
+        'p50': pick(0.50),
+        'p90': pick(0.90),
+        'p99': pick(0.99),
+        'max': ordered[-1],
+    }
@@ -0,0 +1,187 @@
+# services/spatial_index.py
+
+import heapq
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models.enums import ResourceType
+from models.resource import Resource
+from utils.geo import CENTROIDS, Point, ZoneCentroids, euclidean
+
+Cell = Tuple[int, int]
+
+
+class SpatialIndex:
+    """
+    Uniform-grid index of available resources by type and planar position.
+
+    Each type has its own grid of square cells holding the free units inside them.
+    A k-nearest query scans rings of cells outward from the query point and stops
+    once the next ring cannot hold anything closer than the k-th unit found. Units
+    without coordinates sit at their zone's centroid. Ties are broken by tracking
+    order, like the AvailabilityIndex.
+    """
+
+    def __init__(self, cell_size: float = 1.0, centroids: ZoneCentroids = CENTROIDS):
+        """
+        Initializes an empty index.
+
+        :param cell_size: Side of a grid cell in coordinate units. Aim for a few
+                          units per cell per type; much smaller cells mean more empty
+                          cells to walk, much larger ones more units to measure.
+        :param centroids: Positions of zone-only incidents and units.
+        """
+        self._cell_size = float(cell_size)
+        self._centroids = centroids
+        self._cells: Dict[ResourceType, Dict[Cell, Dict[int, Tuple[Point, Resource]]]] = {}
+        self._counts: Dict[ResourceType, int] = {}
+        # Per type, the bounding box of cells ever occupied: [min x, max x, min y, max y]
+        self._extent: Dict[ResourceType, List[int]] = {}
+        self._entries: Dict[int, int] = {}  # id(resource) -> seq
+        self._indexed: Dict[int, Tuple[Cell, Point]] = {}  # id(resource) -> where it is indexed
+        self._next_seq = 0
+
+    def position(self, item) -> Optional[Point]:
+        """
+        Returns the position of an incident or resource: its coordinates, or its zone's centroid.
+        """
+        return self._centroids.position(item)
+
+    def centroid(self, zone_id: int) -> Optional[Point]:
+        """
+        Returns the centroid of a zone id, or None for the unknown zone.
+        """
+        return self._centroids.centroid(zone_id)
+
+    def track(self, resource: Resource) -> None:
+        """
+        Starts tracking a resource and subscribes to its availability changes.
+
+        :param resource: Resource to index.
+        """
+        self._entries[id(resource)] = self._next_seq
+        self._next_seq += 1
+        resource.add_listener(self.update)
+        self.update(resource)
+
+    def update(self, resource: Resource) -> None:
+        """
+        Re-syncs a tracked resource after its availability, location or coordinates changed.
+
+        :param resource: Resource whose state changed.
+        """
+        key = id(resource)
+        if key not in self._entries:
+            return
+        point = self.position(resource) if resource.is_available else None
+        indexed = self._indexed.get(key)
+        if indexed is not None and indexed[1] == point:
+            return
+        if indexed is not None:
+            self._remove(resource, indexed[0])
+        if point is not None:
+            self._insert(resource, point)
+
+    def k_nearest(self, resource_type: ResourceType, point: Point, k: int = 1) -> List[Tuple[float, Resource]]:
+        """
+        Finds the k closest available units of a type.
+
+        :param resource_type: Required ResourceType.
+        :param point: Planar (x, y) position to measure from.
+        :param k: Number of units to return.
+        :return: Up to k (distance, resource) pairs, closest first.
+        """
+        cells = self._cells.get(resource_type)
+        if not cells or k <= 0:
+            return []
+
+        size = self._cell_size
+        x, y = point
+        cx, cy = math.floor(x / size), math.floor(y / size)
+        min_x, max_x, min_y, max_y = self._extent[resource_type]
+        last_ring = max(cx - min_x, max_x - cx, cy - min_y, max_y - cy, 0)
+        best: List[Tuple[float, int, Resource]] = []  # Max-heap of the k best as (-distance, -seq, unit)
+        remaining = self._counts[resource_type]
+
+        for ring in range(last_ring + 1):
+            if len(best) == k:
+                # No cell of this ring or beyond is closer than this
+                bound = min(
+                    x - (cx - ring + 1) * size, (cx + ring) * size - x,
+                    y - (cy - ring + 1) * size, (cy + ring) * size - y
+                )
+                if bound > -best[0][0]:
+                    break
+            if 8 * ring >= len(cells):
+                # Sparse grid: measuring every cell left is cheaper than walking empty rings
+                ring_cells = [c for c in cells if max(abs(c[0] - cx), abs(c[1] - cy)) >= ring]
+                last_ring = ring
+            else:
+                ring_cells = _ring(cx, cy, ring)
+            for cell in ring_cells:
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                remaining -= len(bucket)
+                for seq, (unit_point, resource) in bucket.items():
+                    entry = (-euclidean(point, unit_point), -seq, resource)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry[:2] > best[0][:2]:
+                        heapq.heapreplace(best, entry)
+            if not remaining or ring == last_ring:
+                break
+
+        return [(-d, resource) for d, _, resource in sorted(best, key=lambda e: (-e[0], -e[1]))]
+
+    def nearest(self, resource_type: ResourceType, point: Point) -> Optional[Resource]:
+        """
+        Finds the closest available unit of a type.
+
+        :param resource_type: Required ResourceType.
+        :param point: Planar (x, y) position to measure from.
+        :return: Closest available Resource or None.
+        """
+        found = self.k_nearest(resource_type, point, 1)
+        return found[0][1] if found else None
+
+    def _cell(self, point: Point) -> Cell:
+        return math.floor(point[0] / self._cell_size), math.floor(point[1] / self._cell_size)
+
+    def _insert(self, resource: Resource, point: Point) -> None:
+        resource_type = resource.resource_type
+        cell = self._cell(point)
+        self._cells.setdefault(resource_type, {}).setdefault(cell, {})[self._entries[id(resource)]] = (point, resource)
+        self._counts[resource_type] = self._counts.get(resource_type, 0) + 1
+        extent = self._extent.get(resource_type)
+        if extent is None:
+            self._extent[resource_type] = [cell[0], cell[0], cell[1], cell[1]]
+        else:
+            extent[0], extent[1] = min(extent[0], cell[0]), max(extent[1], cell[0])
+            extent[2], extent[3] = min(extent[2], cell[1]), max(extent[3], cell[1])
+        self._indexed[id(resource)] = (cell, point)
+
+    def _remove(self, resource: Resource, cell: Cell) -> None:
+        resource_type = resource.resource_type
+        cells = self._cells[resource_type]
+        bucket = cells[cell]
+        del bucket[self._entries[id(resource)]]
+        if not bucket:
+            del cells[cell]
+        self._counts[resource_type] -= 1
+        del self._indexed[id(resource)]
+
+
+def _ring(cx: int, cy: int, ring: int) -> Iterator[Cell]:
+    """
+    Yields the cells at Chebyshev distance exactly `ring` from (cx, cy).
+    """
+    if ring == 0:
+        yield cx, cy
+        return
+    for dx in range(-ring, ring + 1):
+        yield cx + dx, cy - ring
+        yield cx + dx, cy + ring
+    for dy in range(-ring + 1, ring):
+        yield cx - ring, cy + dy
+        yield cx + ring, cy + dy
@@ -0,0 +1,91 @@
+# tests/test_api_server.py
+
+import asyncio
+import json
+import unittest
+from services.api_server import AllocationServer
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+
+
+class TestAllocationServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.manager = ResourceManager(events=NullSink())
+        self.server = AllocationServer(self.manager, port=0, batch_size=50, batch_delay=0.01)
+        await self.server.start()
+        self.reader, self.writer = await asyncio.open_connection(self.server.host, self.server.port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.server.close()
+
+    async def _send(self, *requests):
+        for request in requests:
+            self.writer.write((json.dumps(request) + "\n").encode())
+        await self.writer.drain()
+        responses = [json.loads(await self.reader.readline()) for _ in requests]
+        return {response['id']: response for response in responses}
+
+    async def test_incidents_are_batched_and_allocated(self):
+        calls = []
+        add_incidents = self.manager.add_incidents
+        self.manager.add_incidents = lambda incidents: calls.append(len(incidents)) or add_incidents(incidents)
+
+        responses = await self._send(
+            {'id': 'r', 'op': 'add_resource', 'resource_type': 'Ambulance', 'location': 'Zone 1'},
+            {'id': 'a', 'op': 'add_incident', 'location': 'Zone 2', 'emergency_type': 'Fall',
+             'priority': 'Low', 'required_resources': ['Ambulance']},
+            {'id': 'b', 'op': 'add_incident', 'location': 'Zone 3', 'emergency_type': 'Crash',
+             'priority': 'High', 'required_resources': ['Ambulance']},
+        )
+
+        self.assertEqual(calls, [2])
+        unit = responses['r']['resource_id']
+        self.assertEqual(responses['b']['allocated'], [unit])
+        self.assertEqual(responses['b']['status'], "In Progress")
+        self.assertEqual(responses['a']['status'], "Pending")
+
+        responses = await self._send(
+            {'id': 'x', 'op': 'resolve', 'incident_id': responses['b']['incident_id']},
+            {'id': 's', 'op': 'summary', 'status': 'in progress'},
+        )
+        self.assertTrue(responses['x']['ok'])
+        self.assertEqual(responses['s']['summary']['total'], 1)  # The waiting incident got the unit
+
+    async def test_errors_are_reported_per_request(self):
+        self.writer.write(b"not json\n")
+        self.writer.write((json.dumps({'id': 1, 'op': 'launch'}) + "\n").encode())
+        self.writer.write((json.dumps({'id': 2, 'op': 'add_incident'}) + "\n").encode())
+        await self.writer.drain()
+        responses = {}
+        for _ in range(3):
+            response = json.loads(await self.reader.readline())
+            responses[response['id']] = response
+
+        self.assertFalse(responses[None]['ok'])
+        self.assertIn("Unknown op", responses[1]['error'])
+        self.assertIn("KeyError", responses[2]['error'])
+        self.assertEqual(self.manager.incidents, [])
+
+    async def test_server_faults_still_get_a_reply(self):
+        def fail(*args):
+            raise OSError("disk full")
+        self.manager.add_resource = fail
+
+        with self.assertLogs("services.api_server", level="ERROR"):
+            responses = await self._send(
+                {'id': 1, 'op': 'add_resource', 'resource_type': 'Ambulance', 'location': 'Zone 1'},
+                {'id': 2, 'op': 'summary'},
+            )
+        self.assertFalse(responses[1]['ok'])
+        self.assertIn("OSError: disk full", responses[1]['error'])
+        self.assertTrue(responses[2]['ok'])
+
+    async def test_empty_resolve_batch(self):
+        responses = await self._send({'id': 1, 'op': 'resolve', 'incident_ids': []})
+        self.assertEqual(responses[1], {'ok': True, 'resolved': [], 'id': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# tests/test_availability_index.py
+
+import unittest
+from services.availability_index import AvailabilityIndex
+from models.resource import Resource
+from models.enums import ResourceType
+from utils.zones import ZONES
+
+
+class TestAvailabilityIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = AvailabilityIndex()
+
+    def test_nearest_picks_closest_zone(self):
+        far = Resource(1, ResourceType.AMBULANCE, "Zone 9")
+        near = Resource(2, ResourceType.AMBULANCE, "Zone 4")
+        self.index.track(far)
+        self.index.track(near)
+
+        self.assertIs(self.index.nearest(ResourceType.AMBULANCE, ZONES.intern("Zone 3")), near)
+        self.assertIsNone(self.index.nearest(ResourceType.FIRE_TRUCK, ZONES.intern("Zone 3")))
+
+    def test_ties_resolved_by_insertion_order(self):
+        first = Resource(1, ResourceType.POLICE_UNIT, "Zone 5")
+        second = Resource(2, ResourceType.POLICE_UNIT, "Zone 1")
+        self.index.track(first)
+        self.index.track(second)
+
+        # Both are two zones away from Zone 3
+        self.assertIs(self.index.nearest(ResourceType.POLICE_UNIT, ZONES.intern("Zone 3")), first)
+
+    def test_assign_and_release_keep_index_current(self):
+        unit = Resource(1, ResourceType.FIRE_TRUCK, "Zone 2")
+        self.index.track(unit)
+
+        unit.assign_to_incident(7)
+        self.assertIsNone(self.index.nearest(ResourceType.FIRE_TRUCK, ZONES.intern("Zone 2")))
+
+        unit.release()
+        self.assertIs(self.index.nearest(ResourceType.FIRE_TRUCK, ZONES.intern("Zone 2")), unit)
+
+    def test_unparseable_locations_use_fallback_distance(self):
+        unknown = Resource(1, ResourceType.AMBULANCE, "Depot")
+        distant = Resource(2, ResourceType.AMBULANCE, "Zone 500")
+        self.index.track(unknown)
+        self.index.track(distant)
+
+        # 'Depot' counts as 99 zones away, which beats 499
+        self.assertIs(self.index.nearest(ResourceType.AMBULANCE, ZONES.intern("Zone 1")), unknown)
+        self.assertIs(self.index.nearest(ResourceType.AMBULANCE, ZONES.intern("Zone 450")), distant)
+        self.assertIs(self.index.nearest(ResourceType.AMBULANCE, ZONES.intern("")), unknown)
+
+    def test_moving_a_free_unit_rebuckets_it(self):
+        unit = Resource(1, ResourceType.MEDICAL_TEAM, "Zone 1")
+        other = Resource(2, ResourceType.MEDICAL_TEAM, "Zone 6")
+        self.index.track(unit)
+        self.index.track(other)
+
+        unit.location = "Zone 20"
+        self.index.update(unit)
+        self.assertIs(self.index.nearest(ResourceType.MEDICAL_TEAM, ZONES.intern("Zone 2")), other)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+# tests/test_binary_snapshot.py
+
+import os
+import shutil
+import tempfile
+import unittest
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from utils.binary_snapshot import BinarySnapshot, save_binary_snapshot
+from utils.events import NullSink
+from utils.journal import Journal
+
+
+def _state(incidents, resources):
+    return (
+        sorted(
+            (i.incident_id, i.location, i.emergency_type, i.priority, i.status, i.timestamp,
+             tuple(i.required_resources), tuple(r.resource_id for r in i.allocated_resources), i.coordinates)
+            for i in incidents
+        ),
+        sorted(
+            (r.resource_id, r.resource_type, r.location, r.is_available, r.assigned_to_incident, r.coordinates)
+            for r in resources
+        ),
+    )
+
+
+class TestBinarySnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "state.bin")
+        self.resources = [
+            Resource(1, ResourceType.AMBULANCE, "Zone 1", coordinates=(1.25, -0.5)),
+            Resource(2, ResourceType.FIRE_TRUCK, "Zone 2", is_available=False),
+        ]
+        self.resources[1].assigned_to_incident = 2
+        resolved = Incident(1, "Zone 1", "Crash", PriorityLevel.LOW, ["Ambulance"], coordinates=(0.0, 3.5))
+        resolved.status = "Resolved"
+        active = Incident(2, "Zone 2", "Fire", PriorityLevel.HIGH, ["Fire Truck", "Ambulance"])
+        active.status = "In Progress"
+        active.allocated_resources.append(self.resources[1])
+        self.incidents = [resolved, active]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        save_binary_snapshot(self.path, self.incidents, self.resources, seq=7)
+        snapshot = BinarySnapshot(self.path)
+        resources = snapshot.resources()
+        by_id = {r.resource_id: r for r in resources}
+        incidents = [snapshot.incident(row, by_id) for row in range(snapshot.incident_count)]
+
+        self.assertEqual(snapshot.seq, 7)
+        self.assertEqual(_state(incidents, resources), _state(self.incidents, self.resources))
+        self.assertIs(incidents[1].allocated_resources[0], by_id[2])
+        snapshot.close()
+
+    def test_resolved_history_is_decoded_lazily(self):
+        save_binary_snapshot(self.path, self.incidents, self.resources)
+        snapshot = BinarySnapshot(self.path)
+        resources = snapshot.resources()
+        active, history = snapshot.split_incidents({r.resource_id: r for r in resources})
+
+        self.assertEqual([i.incident_id for i in active], [2])
+        self.assertEqual(len(history), 1)
+        self.assertFalse(history.is_decoded(0))
+        self.assertEqual(history.incident_ids(), [1])
+        self.assertEqual(history[0].status, "Resolved")
+        self.assertTrue(history.is_decoded(0))
+        self.assertIs(history[0], history[0])
+
+    def test_resave_copies_undecoded_history(self):
+        save_binary_snapshot(self.path, self.incidents, self.resources)
+        snapshot = BinarySnapshot(self.path)
+        resources = snapshot.resources()
+        active, history = snapshot.split_incidents({r.resource_id: r for r in resources})
+
+        second = os.path.join(self.directory, "second.bin")
+        save_binary_snapshot(second, active, resources, history)
+        reloaded = BinarySnapshot(second)
+        by_id = {r.resource_id: r for r in reloaded.resources()}
+        incidents = [reloaded.incident(row, by_id) for row in range(reloaded.incident_count)]
+        self.assertFalse(history.is_decoded(0))
+        self.assertEqual(_state(incidents, by_id.values()), _state(self.incidents, self.resources))
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as f:
+            f.write(b"\0" * 128)
+        with self.assertRaises(ValueError):
+            BinarySnapshot(self.path)
+
+
+class TestBinaryJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _run_session(self, journal: Journal) -> ResourceManager:
+        manager = ResourceManager(events=NullSink(), journal=journal)
+        manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        for incident_id in range(1, 6):
+            manager.add_incident(Incident(incident_id, "Zone 1", "Crash", PriorityLevel.MEDIUM, ["Ambulance"]))
+            manager.get_all_incidents()[-1].update_status("Resolved")
+            manager.release_resources_from_resolved()
+        return manager
+
+    def test_restart_keeps_history_lazy_and_complete(self):
+        journal = Journal(self.directory, compact_every=3, binary=True)
+        manager = self._run_session(journal)
+        # Touch a resolved incident after the last compaction so replay has to decode it
+        manager.get_all_incidents()[0].update_status("In Progress")
+        journal.close()
+        expected = _state(manager.get_all_incidents(), manager.get_all_resources())
+
+        journal = Journal(self.directory, binary=True)
+        incidents, resources = journal.load()
+        self.assertIn(1, [i.incident_id for i in incidents])
+        self.assertGreater(len(journal.history), 0)
+        self.assertEqual(_state(list(journal.history) + incidents, resources), expected)
+
+        restored = ResourceManager(events=NullSink(), journal=journal)
+        restored.bulk_load(incidents, resources, journal.history)
+        self.assertEqual(len(restored.incidents), len(incidents))
+        self.assertEqual(len(restored.get_all_incidents()), 5)
+        journal.close()
+
+    def test_summary_counts_history_without_decoding(self):
+        journal = Journal(self.directory, compact_every=3, binary=True)
+        self._run_session(journal)
+        journal.close()
+
+        journal = Journal(self.directory, binary=True)
+        incidents, resources = journal.load()
+        restored = ResourceManager(events=NullSink())
+        restored.bulk_load(incidents, resources, journal.history)
+        summary = restored.summary_counts(status_filter="resolved")
+        self.assertEqual(summary['total'], 5)
+        self.assertFalse(any(journal.history.is_decoded(p) for p in range(len(journal.history))))
+        journal.close()
+
+    def test_lookup_decodes_single_history_incident(self):
+        journal = Journal(self.directory, compact_every=3, binary=True)
+        self._run_session(journal)
+        journal.close()
+
+        journal = Journal(self.directory, binary=True)
+        incidents, resources = journal.load()
+        restored = ResourceManager(events=NullSink())
+        restored.bulk_load(incidents, resources, journal.history)
+        remaining = len(journal.history)
+        incident = restored.get_incident(journal.history.incident_ids()[0])
+        self.assertEqual(incident.status, "Resolved")
+        self.assertEqual(len(journal.history), remaining - 1)
+        self.assertIs(restored.get_incident(incident.incident_id), incident)
+        self.assertEqual(restored.summary_counts()['total'], 5)
+        journal.close()
+
+    def test_coordinates_survive_compaction(self):
+        journal = Journal(self.directory, binary=True)
+        manager = ResourceManager(events=NullSink(), journal=journal)
+        manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1", coordinates=(1.0, 2.0)))
+        manager.add_resource(Resource(2, ResourceType.POLICE_UNIT, "Zone 3"))
+        manager.add_incident(Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, ["Ambulance"], coordinates=(1.5, 2.0)))
+        manager.move_resource(2, location="Zone 4", coordinates=(4.0, 0.5))
+        journal.compact(manager.incidents, manager.resources)
+        journal.close()
+
+        journal = Journal(self.directory, binary=True)
+        incidents, resources = journal.load()
+        self.assertEqual([r.coordinates for r in resources], [(1.0, 2.0), (4.0, 0.5)])
+        self.assertEqual(incidents[0].coordinates, (1.5, 2.0))
+        journal.close()
+
+    def test_compaction_preserves_lazy_history(self):
+        journal = Journal(self.directory, compact_every=3, binary=True)
+        manager = self._run_session(journal)
+        journal.close()
+        expected = _state(manager.get_all_incidents(), manager.get_all_resources())
+
+        journal = Journal(self.directory, binary=True)
+        incidents, resources = journal.load()
+        history = journal.history
+        journal.compact(incidents, resources, history)
+        journal.close()
+
+        journal = Journal(self.directory, binary=True)
+        incidents, resources = journal.load()
+        self.assertEqual(_state(list(journal.history) + incidents, resources), expected)
+        journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# tests/test_concurrent_manager.py
+
+import threading
+import unittest
+from collections import Counter
+from services.concurrent_manager import ConcurrentResourceManager, IncidentView
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+from utils.factory import IncidentFactory, ResourceFactory
+
+
+class TestConcurrentResourceManager(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ResourceManager(events=NullSink())
+        self.concurrent = ConcurrentResourceManager(self.manager)
+
+    def tearDown(self):
+        self.concurrent.close()
+
+    def _produce(self, threads, per_thread):
+        def worker(n):
+            for i in range(per_thread):
+                zone = f"Zone {(n + i) % 5 + 1}"
+                if i % 3 == 0:
+                    self.concurrent.add_resource(ResourceFactory.create_resource("Ambulance", zone))
+                self.concurrent.add_incident(
+                    IncidentFactory.create_incident(zone, "Test", "Medium", ["Ambulance"])
+                )
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        self.concurrent.flush()
+
+    def test_concurrent_producers_never_double_assign(self):
+        self._produce(threads=8, per_thread=60)
+
+        ids = [i.incident_id for i in self.manager.incidents]
+        self.assertEqual(len(ids), 8 * 60)
+        self.assertEqual(len(set(ids)), len(ids))
+
+        holders = Counter(r.resource_id for i in self.manager.incidents for r in i.allocated_resources)
+        self.assertTrue(holders)
+        self.assertEqual(max(holders.values()), 1)
+        for incident in self.manager.incidents:
+            for resource in incident.allocated_resources:
+                self.assertEqual(resource.assigned_to_incident, incident.incident_id)
+
+    def test_snapshot_matches_live_state(self):
+        self._produce(threads=4, per_thread=30)
+        snapshot = self.concurrent.snapshot()
+
+        self.assertEqual(snapshot.summary, self.manager.summary_counts())
+        self.assertEqual(len(snapshot.incidents), len(self.manager.incidents))
+        self.assertEqual(len(snapshot.resources), len(self.manager.resources))
+        for incident in self.manager.incidents:
+            view = snapshot.incidents[incident.incident_id]
+            self.assertEqual(view.status, incident.status)
+            self.assertEqual(view.allocated_resources, tuple(r.resource_id for r in incident.allocated_resources))
+        for resource in self.manager.resources:
+            view = snapshot.resources[resource.resource_id]
+            self.assertEqual(view.is_available, resource.is_available)
+            self.assertEqual(view.assigned_to_incident, resource.assigned_to_incident)
+
+    def test_snapshots_are_not_modified_after_publish(self):
+        resource = ResourceFactory.create_resource("Fire Truck", "Zone 1")
+        self.concurrent.add_resource(resource).result()
+        before = self.concurrent.snapshot()
+
+        view = self.concurrent.add_incident(
+            IncidentFactory.create_incident("Zone 1", "Fire", "High", ["Fire Truck"])
+        ).result()
+        after = self.concurrent.snapshot()
+
+        self.assertIsInstance(view, IncidentView)
+        self.assertEqual(view.allocated_resources, (resource.resource_id,))
+        self.assertGreater(after.version, before.version)
+        self.assertTrue(before.resources[resource.resource_id].is_available)
+        self.assertFalse(after.resources[resource.resource_id].is_available)
+        self.assertNotIn(view.incident_id, before.incidents)
+
+    def test_resolve_redeploys_and_updates_views(self):
+        ambulance = ResourceFactory.create_resource("Ambulance", "Zone 1")
+        self.concurrent.add_resource(ambulance)
+        first = self.concurrent.add_incident(
+            IncidentFactory.create_incident("Zone 1", "Fall", "High", ["Ambulance"])
+        ).result()
+        second = self.concurrent.add_incident(
+            IncidentFactory.create_incident("Zone 2", "Fall", "Low", ["Ambulance"])
+        ).result()
+        self.assertEqual(second.allocated_resources, ())
+
+        self.assertEqual(self.concurrent.resolve_incidents([first.incident_id]).result(), [first.incident_id])
+
+        self.assertEqual(self.concurrent.get_incident(first.incident_id).allocated_resources, ())
+        self.assertEqual(self.concurrent.get_incident(second.incident_id).allocated_resources, (ambulance.resource_id,))
+        self.assertEqual(self.concurrent.snapshot().resources[ambulance.resource_id].assigned_to_incident,
+                         second.incident_id)
+
+    def test_command_errors_reach_the_caller(self):
+        future = self.concurrent.submit(lambda manager: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            future.result()
+        # The writer keeps running after a failed command
+        self.assertEqual(self.concurrent.submit(lambda manager: 42).result(), 42)
+
+
+class TestFactoryThreadSafety(unittest.TestCase):
+
+    def test_concurrent_factory_ids_are_unique(self):
+        ids = []
+        lock = threading.Lock()
+
+        def worker():
+            created = [IncidentFactory.create_incident("Zone 1", "Test", "Low", []).incident_id
+                       for _ in range(500)]
+            with lock:
+                ids.extend(created)
+
+        workers = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        self.assertEqual(len(set(ids)), len(ids))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# tests/test_dashboard_counters.py
+
+import random
+import unittest
+from collections import Counter
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.dashboard_counters import DashboardCounters
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+
+
+def _scan(manager, status=None, zone=None, priority=None):
+    """
+    Recomputes the summary the slow way, by scanning every incident and resource.
+    """
+    incidents = [
+        i for i in manager.get_all_incidents()
+        if (not status or i.status.lower() == status.lower())
+        and (not zone or i.location.lower() == zone.lower())
+        and (not priority or i.priority.name.lower() == priority.lower())
+    ]
+    return {
+        'total': len(incidents),
+        'status': dict(Counter(i.status for i in incidents)),
+        'priority': dict(Counter(i.priority.name for i in incidents)),
+        'zone': dict(Counter(i.location for i in incidents)),
+        'resources': len(manager.resources),
+        'available': sum(1 for r in manager.resources if r.is_available),
+    }
+
+
+class TestDashboardCounters(unittest.TestCase):
+
+    def test_status_change_moves_incident_between_cells(self):
+        counters = DashboardCounters()
+        incident = Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, [])
+        counters.add_incident(incident)
+        incident.add_listener(counters.incident_status_changed)
+        incident.update_status("Resolved")
+
+        self.assertEqual(counters.summary()['status'], {"Resolved": 1})
+        self.assertEqual(counters.summary(status_filter="pending")['total'], 0)
+        self.assertEqual(len(counters.incidents), 1)
+
+    def test_resource_cells_follow_availability(self):
+        counters = DashboardCounters()
+        unit = Resource(1, ResourceType.AMBULANCE, "Zone 2")
+        counters.add_resource(unit)
+        unit.add_listener(counters.resource_changed)
+
+        unit.assign_to_incident(5)
+        self.assertEqual(counters.available_units(), 0)
+        unit.assign_to_incident(6)  # Reassignment keeps the unit in the same cell
+        unit.release()
+        self.assertEqual(counters.available_units(ResourceType.AMBULANCE, "Zone 2"), 1)
+        self.assertEqual(counters.available_units(ResourceType.FIRE_TRUCK), 0)
+        self.assertEqual(sum(counters.resources.values()), 1)
+
+
+class TestManagerCounters(unittest.TestCase):
+
+    def test_counters_match_full_scan(self):
+        rng = random.Random(11)
+        manager = ResourceManager(events=NullSink())
+        for rid in range(25):
+            manager.add_resource(Resource(rid, rng.choice(list(ResourceType)), f"Zone {rng.randint(1, 4)}"))
+        for iid in range(80):
+            required = [rng.choice(list(ResourceType)).value for _ in range(rng.randint(1, 2))]
+            manager.add_incident(Incident(
+                iid, f"Zone {rng.randint(1, 5)}", "Test", rng.choice(list(PriorityLevel)), required
+            ))
+            if rng.random() < 0.3:
+                rng.choice(manager.incidents).update_status("Resolved")
+                manager.release_resources_from_resolved()
+                manager.allocate_resources()
+
+        for filters in [(), ("Resolved",), (None, "zone 3"), (None, None, "MEDIUM"), ("pending", "Zone 1", "high")]:
+            self.assertEqual(manager.summary_counts(*filters), _scan(manager, *filters))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+# tests/test_events.py
+
+import io
+import unittest
+from services.resource_manager import ResourceManager
+from models.incident import Incident
+from models.resource import Resource
+from models.enums import PriorityLevel, ResourceType
+from utils.events import (
+    AllocationEvent, EventLevel, NullSink, RingBufferSink, StreamSink, ThreadedSink
+)
+
+
+class TestEventSinks(unittest.TestCase):
+
+    def test_manager_emits_structured_events(self):
+        sink = RingBufferSink()
+        manager = ResourceManager(events=sink)
+        manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        manager.add_incident(Incident(7, "Zone 3", "Crash", PriorityLevel.HIGH, ["Ambulance", "Fire Truck"]))
+
+        self.assertEqual([e.kind for e in sink.events], ["INCIDENT_ADDED", "ALLOCATED", "WAITING"])
+        self.assertEqual(sink.events[1].data["distance"], 2)
+        self.assertEqual(
+            sink.messages()[1],
+            "[ALLOCATED] Ambulance from Zone 1 → Incident 7 (Zone 3) [Distance: 2 zone(s)]"
+        )
+        self.assertEqual(sink.messages()[2], "[WAITING] No available Fire Truck for Incident 7")
+
+    def test_level_filter(self):
+        sink = RingBufferSink(level=EventLevel.INFO)
+        manager = ResourceManager(events=sink)
+        manager.add_incident(Incident(1, "Zone 1", "Crash", PriorityLevel.LOW, ["Ambulance"]))
+
+        self.assertFalse(sink.enabled_for(EventLevel.DEBUG))
+        self.assertEqual([e.kind for e in sink.events], ["INCIDENT_ADDED"])
+
+    def test_null_sink_disables_everything(self):
+        sink = NullSink()
+        self.assertFalse(sink.enabled_for(EventLevel.WARNING))
+
+    def test_stream_sink_buffers_lines(self):
+        stream = io.StringIO()
+        sink = StreamSink(stream, buffer_size=10)
+        for i in range(3):
+            sink.emit(AllocationEvent("WAITING", EventLevel.DEBUG, resource_type="Ambulance", incident_id=i))
+
+        self.assertEqual(stream.getvalue(), "")
+        sink.flush()
+        self.assertEqual(len(stream.getvalue().splitlines()), 3)
+
+    def test_threaded_sink_delivers_on_flush(self):
+        ring = RingBufferSink()
+        sink = ThreadedSink(ring)
+        for i in range(50):
+            sink.emit(AllocationEvent("WAITING", EventLevel.DEBUG, resource_type="Ambulance", incident_id=i))
+        sink.flush()
+
+        self.assertEqual(len(ring.events), 50)
+        sink.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# tests/test_lookup_index.py
+
+import random
+import unittest
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.lookup_index import incident_lookup
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+
+
+class TestLookupIndex(unittest.TestCase):
+
+    def test_update_moves_between_index_entries(self):
+        lookup = incident_lookup()
+        crash = Incident(2, "Zone 1", "Crash", PriorityLevel.HIGH, [])
+        lookup.add(crash)
+        lookup.add(Incident(1, "Zone 1", "Fire", PriorityLevel.LOW, []))
+
+        self.assertIs(lookup.get(2), crash)
+        self.assertEqual([i.incident_id for i in lookup.find(zone="zone 1")], [1, 2])
+        crash.status = "Resolved"
+        lookup.update(crash)
+        self.assertEqual(lookup.find(status="pending", priority="high"), [])
+        self.assertEqual(lookup.find(status="resolved"), [crash])
+        self.assertEqual(lookup.find(status="unknown"), [])
+
+
+class TestManagerLookups(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(5)
+        self.manager = ResourceManager(events=NullSink())
+        for rid in range(20):
+            self.manager.add_resource(Resource(rid, rng.choice(list(ResourceType)), f"Zone {rng.randint(1, 3)}"))
+        for iid in range(50):
+            required = [rng.choice(list(ResourceType)).value]
+            self.manager.add_incident(Incident(
+                iid, f"Zone {rng.randint(1, 4)}", "Test", rng.choice(list(PriorityLevel)), required
+            ))
+            if rng.random() < 0.3:
+                rng.choice(self.manager.incidents).update_status("Resolved")
+                self.manager.release_resources_from_resolved()
+
+    def test_find_incidents_matches_scan(self):
+        for status in (None, "Pending", "in progress", "RESOLVED"):
+            for zone in (None, "Zone 2", "zone 4"):
+                for priority in (None, "High", "low"):
+                    expected = [
+                        i for i in sorted(self.manager.incidents, key=lambda i: i.incident_id)
+                        if (not status or i.status.lower() == status.lower())
+                        and (not zone or i.location.lower() == zone.lower())
+                        and (not priority or i.priority.name.lower() == priority.lower())
+                    ]
+                    self.assertEqual(self.manager.find_incidents(status, zone, priority), expected)
+
+    def test_find_resources_matches_scan(self):
+        for resource_type in (None, ResourceType.AMBULANCE):
+            for available in (None, True, False):
+                expected = [
+                    r for r in self.manager.resources
+                    if (resource_type is None or r.resource_type == resource_type)
+                    and (available is None or r.is_available == available)
+                ]
+                self.assertEqual(self.manager.find_resources(resource_type, available=available), expected)
+
+    def test_get_by_id(self):
+        self.assertIs(self.manager.get_incident(7), self.manager.incidents[7])
+        self.assertIs(self.manager.get_resource(3), self.manager.resources[3])
+        self.assertIsNone(self.manager.get_incident(999))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# tests/test_metrics.py
+
+import os
+import tempfile
+import unittest
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+from utils.metrics import Histogram, Metrics, to_prometheus, write_prometheus
+from utils.zones import ZONES
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+        data = histogram.to_dict()
+        self.assertEqual(data['count'], 4)
+        self.assertEqual(data['sum'], 56.5)
+        self.assertEqual(data['buckets'], [[1, 2], [10, 3], ["+Inf", 4]])
+
+
+class TestManagerMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = Metrics()
+        self.manager = ResourceManager(events=NullSink(), metrics=self.metrics)
+
+    def test_disabled_manager_is_not_instrumented(self):
+        plain = ResourceManager(events=NullSink())
+        self.assertEqual(plain.metrics(), {})
+        self.assertNotIn('allocate_resources', vars(plain))
+        self.assertIsNone(plain._availability.search_stats)
+
+    def test_records_calls_searches_and_queue_depths(self):
+        self.manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        self.manager.add_incident(Incident(1, "Zone 2", "Fall", PriorityLevel.HIGH, ["Ambulance"]))
+        self.manager.add_incident(Incident(2, "Zone 3", "Fall", PriorityLevel.LOW, ["Ambulance", "Fire Truck"]))
+        self.manager.allocate_resources()
+
+        metrics = self.manager.metrics()
+        self.assertEqual(metrics['calls']['add_incidents']['count'], 2)
+        self.assertEqual(metrics['calls']['allocate_resources']['count'], 1)
+        self.assertGreaterEqual(metrics['calls']['find_available_resource']['count'], 3)
+        self.assertGreater(metrics['candidates_scanned']['count'], 0)
+        self.assertEqual(metrics['gauges']['pending_incidents'], 1)
+        self.assertEqual(metrics['gauges']['wait_queue_depth']['values'], {"Ambulance": 1, "Fire Truck": 1})
+        self.assertEqual(metrics['gauges']['available_units'], 0)
+
+    def test_wait_queue_dispatch_and_distance_lookups_are_timed(self):
+        self.manager.add_incident(Incident(1, "Zone 2", "Fall", PriorityLevel.HIGH, ["Ambulance"]))
+        lookups = self.metrics.timers['find_available_resource'].count
+        self.manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 40"))
+
+        calls = self.manager.metrics()['calls']
+        self.assertEqual(calls['find_available_resource']['count'], lookups + 1)
+        self.assertGreater(calls['distance_row']['count'] + calls.get('zones_by_distance', {}).get('count', 0), 0)
+        self.assertIs(self.manager.distances, ZONES)
+
+    def test_queue_gauges_report_the_live_backlog(self):
+        for incident_id in range(1, 4):
+            self.manager.add_incident(Incident(incident_id, "Zone 1", "Fall", PriorityLevel.HIGH, ["Ambulance"]))
+        self.manager.resolve_incidents([1, 2])
+
+        gauges = self.manager.metrics()['gauges']
+        self.assertEqual(gauges['waiting_queue_entries'], 1)
+        self.assertEqual(gauges['wait_queue_depth']['values'], {"Ambulance": 1})
+
+    def test_registries_are_per_manager(self):
+        other = Metrics()
+        second = ResourceManager(events=NullSink(), metrics=other)
+        self.manager.add_incident(Incident(1, "Zone 2", "Fall", PriorityLevel.HIGH, ["Ambulance"]))
+        second.add_incident(Incident(1, "Zone 2", "Fall", PriorityLevel.HIGH, ["Ambulance"]))
+        second.add_incident(Incident(2, "Zone 2", "Fall", PriorityLevel.HIGH, ["Ambulance"]))
+
+        self.assertEqual(self.metrics.timers['add_incidents'].count, 1)
+        self.assertEqual(other.timers['add_incidents'].count, 2)
+
+    def test_prometheus_text_format(self):
+        self.manager.add_incident(Incident(1, "Zone 2", "Fall", PriorityLevel.HIGH, ["Ambulance"]))
+        text = to_prometheus(self.manager.metrics())
+
+        self.assertIn("# TYPE era_call_seconds histogram", text)
+        self.assertIn('era_call_seconds_count{function="add_incidents"} 1', text)
+        self.assertIn('era_call_seconds_bucket{function="add_incidents",le="+Inf"} 1', text)
+        self.assertIn('era_wait_queue_depth{resource_type="Ambulance"} 1', text)
+        self.assertIn("era_pending_incidents 1", text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "era.prom")
+            write_prometheus(path, self.manager.metrics())
+            with open(path) as f:
+                self.assertEqual(f.read(), text)
+            self.assertEqual(os.listdir(directory), ["era.prom"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 # tests/test_models.py
 
+import copy
+import pickle
 import unittest
 from models.enums import PriorityLevel, ResourceType
 from models.incident import Incident
@@ -27,6 +29,52 @@ class TestIncident(unittest.TestCase):
         self.incident.update_status("In Progress")
         self.assertEqual(self.incident.status, "In Progress")
 
+    def test_unit_counts_track_attached_units(self):
+        incident = Incident(2, "Zone 1", "Crash", PriorityLevel.HIGH, {ResourceType.AMBULANCE: 2, "Police Unit": 1})
+        first = Resource(1, ResourceType.AMBULANCE, "Zone 1")
+        second = Resource(2, ResourceType.AMBULANCE, "Zone 1")
+        self.assertEqual(incident.required_resources, ["Ambulance", "Ambulance", "Police Unit"])
+        self.assertEqual(incident.outstanding_count, 3)
+
+        incident.allocated_resources.append(first)
+        incident.allocated_resources.append(Resource(3, ResourceType.FIRE_TRUCK, "Zone 1"))  # Not required
+        self.assertEqual(incident.outstanding("Ambulance"), 1)
+        self.assertEqual(incident.needs(), {"Ambulance": 1, "Police Unit": 1})
+
+        incident.allocated_resources.extend([second, Resource(4, ResourceType.POLICE_UNIT, "Zone 1")])
+        self.assertTrue(incident.is_fulfilled())
+        self.assertEqual(incident.needs(), {})
+
+        incident.allocated_resources.remove(second)
+        self.assertEqual(incident.needs(), {"Ambulance": 1})
+        incident.allocated_resources.clear()
+        self.assertEqual(incident.outstanding_count, 3)
+
+    def test_repeated_types_and_reassignment_recount(self):
+        incident = Incident(3, "Zone 1", "Fire", PriorityLevel.LOW, ["Fire Truck", "Fire Truck"])
+        truck = Resource(1, ResourceType.FIRE_TRUCK, "Zone 1")
+        incident.allocated_resources = [truck]
+        self.assertEqual(incident.outstanding("Fire Truck"), 1)
+
+        incident.required_resources = ["Fire Truck"]
+        self.assertTrue(incident.is_fulfilled())
+        self.assertEqual(incident.requirements, {"Fire Truck": 1})
+
+    def test_pickle_and_deepcopy_keep_unit_counts(self):
+        incident = Incident(4, "Zone 2", "Crash", PriorityLevel.HIGH, {"Ambulance": 2})
+        incident.allocated_resources.append(Resource(1, ResourceType.AMBULANCE, "Zone 2"))
+
+        for restored in (pickle.loads(pickle.dumps(incident)), copy.deepcopy(incident)):
+            with self.subTest(restored=restored):
+                self.assertEqual(restored.outstanding_count, 1)
+                self.assertEqual([r.resource_id for r in restored.allocated_resources], [1])
+                restored.allocated_resources.append(Resource(2, ResourceType.AMBULANCE, "Zone 2"))
+                self.assertTrue(restored.is_fulfilled())
+                # The copy's requirements stay shared with its own allocation, not the original's
+                restored.required_resources = {"Ambulance": 3}
+                self.assertEqual(restored.outstanding_count, 1)
+        self.assertEqual(incident.outstanding_count, 1)
+
 
 class TestResource(unittest.TestCase):
 
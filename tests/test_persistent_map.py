@@ -0,0 +1,38 @@
+# tests/test_persistent_map.py
+
+import random
+import unittest
+from utils.persistent_map import PersistentMap
+
+
+class TestPersistentMap(unittest.TestCase):
+
+    def test_matches_dict_and_keeps_old_versions(self):
+        rng = random.Random(4)
+        expected = {}
+        current = PersistentMap()
+        versions = []
+        for _ in range(200):
+            changes = {rng.randint(-500, 5000): rng.random() for _ in range(rng.randint(1, 40))}
+            versions.append((current, dict(expected)))
+            current = current.updated(changes)
+            expected.update(changes)
+
+        self.assertEqual(dict(current), expected)
+        self.assertEqual(len(current), len(expected))
+        for version, contents in versions[::20]:
+            self.assertEqual(dict(version), contents)
+            self.assertEqual(len(version), len(contents))
+
+    def test_lookups(self):
+        table = PersistentMap({"a": 1, ("zone", 2): 2})
+        self.assertEqual(table["a"], 1)
+        self.assertEqual(table.get(("zone", 2)), 2)
+        self.assertNotIn("b", table)
+        with self.assertRaises(KeyError):
+            table["b"]
+        self.assertIs(table.updated({}), table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# tests/test_preemption.py
+
+import unittest
+from services.resource_manager import ResourceManager
+from models.incident import Incident
+from models.resource import Resource
+from models.enums import PriorityLevel, ResourceType
+
+
+class TestPreemption(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ResourceManager()
+        self.truck = Resource(1, ResourceType.FIRE_TRUCK, "Zone 1")
+        self.manager.add_resource(self.truck)
+        self.low = Incident(1, "Zone 1", "Bin Fire", PriorityLevel.LOW, ["Fire Truck"])
+        self.manager.add_incident(self.low)
+
+    def test_high_priority_takes_unit_from_low(self):
+        high = Incident(2, "Zone 2", "House Fire", PriorityLevel.HIGH, ["Fire Truck"])
+        self.manager.add_incident(high)
+
+        self.assertEqual(high.allocated_resources, [self.truck])
+        self.assertEqual(high.status, "In Progress")
+        self.assertEqual(self.truck.assigned_to_incident, 2)
+        self.assertEqual(self.low.allocated_resources, [])
+        self.assertEqual(self.low.status, "Pending")
+
+    def test_preempted_incident_is_served_when_unit_returns(self):
+        high = Incident(2, "Zone 2", "House Fire", PriorityLevel.HIGH, ["Fire Truck"])
+        self.manager.add_incident(high)
+
+        high.update_status("Resolved")
+        self.manager.release_resources_from_resolved()
+        self.manager.allocate_resources()
+
+        self.assertEqual(self.low.allocated_resources, [self.truck])
+        self.assertEqual(self.low.status, "In Progress")
+
+    def test_prefers_closest_lower_priority_unit(self):
+        far_truck = Resource(2, ResourceType.FIRE_TRUCK, "Zone 9")
+        self.manager.add_resource(far_truck)
+        medium = Incident(3, "Zone 9", "Car Fire", PriorityLevel.MEDIUM, ["Fire Truck"])
+        self.manager.add_incident(medium)
+
+        high = Incident(4, "Zone 8", "Warehouse Fire", PriorityLevel.HIGH, ["Fire Truck"])
+        self.manager.add_incident(high)
+
+        self.assertEqual(high.allocated_resources, [far_truck])
+        self.assertEqual(self.low.allocated_resources, [self.truck])
+        self.assertEqual(medium.status, "Pending")
+
+    def test_equal_priority_is_not_preempted(self):
+        other_low = Incident(2, "Zone 1", "Smoke", PriorityLevel.LOW, ["Fire Truck"])
+        self.manager.add_incident(other_low)
+
+        self.assertEqual(self.low.allocated_resources, [self.truck])
+        self.assertEqual(other_low.status, "Pending")
+
+    def test_preemption_can_be_disabled(self):
+        manager = ResourceManager(preemption=False)
+        truck = Resource(1, ResourceType.FIRE_TRUCK, "Zone 1")
+        manager.add_resource(truck)
+        low = Incident(1, "Zone 1", "Bin Fire", PriorityLevel.LOW, ["Fire Truck"])
+        high = Incident(2, "Zone 1", "House Fire", PriorityLevel.HIGH, ["Fire Truck"])
+        manager.add_incident(low)
+        manager.add_incident(high)
+
+        self.assertEqual(low.allocated_resources, [truck])
+        self.assertEqual(high.status, "Pending")
+
+
+if __name__ == '__main__':
+    unittest.main()
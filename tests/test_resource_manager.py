@@ -1,7 +1,11 @@
 # tests/test_resource_manager.py
 
+import random
+import tempfile
 import unittest
 from services.resource_manager import ResourceManager
+from utils.events import RingBufferSink
+from utils.journal import Journal
 from models.incident import Incident
 from models.resource import Resource
 from models.enums import PriorityLevel, ResourceType
@@ -100,6 +104,340 @@ class TestResourceManager(unittest.TestCase):
         self.assertEqual(new_incident.status, "In Progress")
 
 
+class TestIncrementalAllocation(unittest.TestCase):
+
+    def _run_workload(self, incremental: bool, seed: int = 7):
+        rng = random.Random(seed)
+        manager = ResourceManager(incremental=incremental)
+        types = [t.value for t in ResourceType]
+        for i in range(30):
+            manager.add_resource(Resource(i, rng.choice(list(ResourceType)), f"Zone {rng.randint(1, 8)}"))
+        for i in range(60):
+            incident = Incident(
+                incident_id=i,
+                location=f"Zone {rng.randint(1, 8)}",
+                emergency_type="Test",
+                priority=rng.choice(list(PriorityLevel)),
+                required_resources=rng.sample(types, rng.randint(1, 3))
+            )
+            manager.add_incident(incident)
+            if i % 7 == 0 and manager.incidents:
+                resolved = rng.choice(manager.incidents)
+                resolved.update_status("Resolved")
+                manager.release_resources_from_resolved()
+        return [
+            (i.incident_id, i.status, [r.resource_id for r in i.allocated_resources])
+            for i in manager.get_all_incidents()
+        ]
+
+    def test_incremental_matches_full_pass(self):
+        self.assertEqual(self._run_workload(incremental=True), self._run_workload(incremental=False))
+
+    def test_waiting_queue_stays_proportional_to_backlog(self):
+        manager = ResourceManager(events=RingBufferSink())
+        manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        waiting = Incident(0, "Zone 1", "Fire", PriorityLevel.HIGH, ["Fire Truck"])
+        manager.add_incident(waiting)
+        for incident_id in range(1, 1000):
+            manager.add_incident(Incident(incident_id, "Zone 1", "Fall", PriorityLevel.LOW, ["Ambulance"]))
+            manager.resolve_incident(incident_id)
+
+        self.assertLessEqual(len(manager._waiting), 64)
+        manager.add_resource(Resource(2, ResourceType.FIRE_TRUCK, "Zone 3"))
+        self.assertEqual(waiting.status, "In Progress")
+
+    def test_full_passes_leave_no_wait_queue_entries(self):
+        manager = ResourceManager(incremental=False, events=RingBufferSink())
+        manager.add_incidents([
+            Incident(i, f"Zone {i % 5 + 1}", "Fall", PriorityLevel.MEDIUM, ["Ambulance"]) for i in range(50)
+        ])
+        for i in range(50):
+            manager.add_resource(Resource(i, ResourceType.AMBULANCE, "Zone 3"))
+        manager.allocate_resources()
+
+        self.assertTrue(all(i.status == "In Progress" for i in manager.incidents))
+        self.assertEqual(manager._queued, set())
+        self.assertFalse(any(manager._wait_queues.values()))
+
+    def test_waiting_incident_served_after_supply_returns(self):
+        manager = ResourceManager()
+        ambulance = Resource(1, ResourceType.AMBULANCE, "Zone 1")
+        manager.add_resource(ambulance)
+
+        first = Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, ["Ambulance"])
+        waiting = Incident(2, "Zone 2", "Fall", PriorityLevel.MEDIUM, ["Ambulance"])
+        manager.add_incident(first)
+        manager.add_incident(waiting)
+        self.assertEqual(waiting.status, "Pending")
+
+        first.update_status("Resolved")
+        manager.release_resources_from_resolved()
+
+        # Any later incident triggers a pass that revisits the unblocked waiter
+        manager.add_incident(Incident(3, "Zone 3", "Fire", PriorityLevel.LOW, ["Fire Truck"]))
+        self.assertEqual(waiting.allocated_resources, [ambulance])
+        self.assertEqual(waiting.status, "In Progress")
+
+    def test_waiting_incidents_lists_only_the_backlog(self):
+        manager = ResourceManager(events=RingBufferSink())
+        manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        low = Incident(1, "Zone 1", "Fall", PriorityLevel.LOW, ["Ambulance"])
+        resolved = Incident(2, "Zone 1", "Fire", PriorityLevel.MEDIUM, ["Fire Truck"])
+        manager.add_incidents([low, resolved])
+        manager.resolve_incident(2)
+        self.assertEqual(manager.waiting_incidents(), [])
+
+        # The preempted victim goes back to waiting, behind nothing else
+        high = Incident(3, "Zone 2", "Crash", PriorityLevel.HIGH, ["Ambulance", "Police Unit"])
+        manager.add_incident(high)
+        self.assertEqual(manager.waiting_incidents(), [high, low])
+
+
+class TestBulkLoad(unittest.TestCase):
+
+    def test_bulk_load_allocates_once_resources_are_present(self):
+        manager = ResourceManager()
+        ambulance = Resource(1, ResourceType.AMBULANCE, "Zone 2")
+        truck = Resource(2, ResourceType.FIRE_TRUCK, "Zone 5")
+        low = Incident(1, "Zone 1", "Fall", PriorityLevel.LOW, ["Ambulance"])
+        high = Incident(2, "Zone 3", "Fire", PriorityLevel.HIGH, ["Ambulance", "Fire Truck"])
+        resolved = Incident(3, "Zone 2", "Old", PriorityLevel.HIGH, ["Ambulance"])
+        resolved.update_status("Resolved")
+
+        manager.bulk_load([low, high, resolved], [ambulance, truck])
+
+        self.assertEqual(len(manager.get_all_incidents()), 3)
+        self.assertEqual(high.allocated_resources, [ambulance, truck])
+        self.assertEqual(high.status, "In Progress")
+        self.assertEqual(low.status, "Pending")
+        self.assertEqual(resolved.allocated_resources, [])
+
+    def test_bulk_load_keeps_incremental_state_consistent(self):
+        manager = ResourceManager()
+        manager.bulk_load([], [Resource(1, ResourceType.POLICE_UNIT, "Zone 1")])
+
+        incident = Incident(1, "Zone 1", "Theft", PriorityLevel.MEDIUM, ["Police Unit"])
+        manager.add_incident(incident)
+        self.assertEqual(incident.status, "In Progress")
+
+
+class TestResolveIncident(unittest.TestCase):
+
+    def setUp(self):
+        self.events = RingBufferSink()
+        self.manager = ResourceManager(events=self.events)
+        self.ambulance = Resource(1, ResourceType.AMBULANCE, "Zone 1")
+        self.truck = Resource(2, ResourceType.FIRE_TRUCK, "Zone 1")
+        self.manager.add_resource(self.ambulance)
+        self.manager.add_resource(self.truck)
+        self.first = Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, ["Ambulance", "Fire Truck"])
+        self.waiting = Incident(2, "Zone 2", "Fall", PriorityLevel.LOW, ["Ambulance"])
+        self.unrelated = Incident(3, "Zone 3", "Theft", PriorityLevel.MEDIUM, ["Police Unit"])
+        for incident in (self.first, self.waiting, self.unrelated):
+            self.manager.add_incident(incident)
+
+    def test_resolve_releases_units_and_serves_waiters(self):
+        self.events.events.clear()
+        resolved = self.manager.resolve_incident(1)
+
+        self.assertIs(resolved, self.first)
+        self.assertEqual(self.first.status, "Resolved")
+        self.assertEqual(self.first.allocated_resources, [])
+        self.assertEqual(self.waiting.allocated_resources, [self.ambulance])
+        self.assertTrue(self.truck.is_available)
+        # The incident waiting for a police unit is not re-examined
+        self.assertNotIn(3, [e.data.get('incident_id') for e in self.events.events])
+
+    def test_resolve_unknown_incident(self):
+        self.assertIsNone(self.manager.resolve_incident(99))
+        self.assertEqual(self.manager.resolve_incidents([99, 2]), [self.waiting])
+
+    def test_release_from_resolved_only_visits_holders(self):
+        self.first.update_status("Resolved")
+        self.manager.release_resources_from_resolved()
+        self.assertTrue(self.ambulance.is_available)
+        self.assertEqual(self.first.allocated_resources, [])
+
+
+class TestWaitQueues(unittest.TestCase):
+
+    def setUp(self):
+        self.events = RingBufferSink()
+        self.manager = ResourceManager(events=self.events, preemption=False)
+        self.low = Incident(1, "Zone 1", "Fall", PriorityLevel.LOW, ["Ambulance"])
+        self.high = Incident(2, "Zone 9", "Crash", PriorityLevel.HIGH, ["Ambulance"])
+        self.police = Incident(3, "Zone 1", "Theft", PriorityLevel.HIGH, ["Police Unit"])
+        for incident in (self.low, self.high, self.police):
+            self.manager.add_incident(incident)
+
+    def test_new_unit_goes_to_best_waiter_of_its_type(self):
+        self.events.events.clear()
+        unit = Resource(1, ResourceType.AMBULANCE, "Zone 1")
+        self.manager.add_resource(unit)
+
+        self.assertEqual(self.high.allocated_resources, [unit])
+        self.assertEqual(self.high.status, "In Progress")
+        self.assertEqual(self.low.status, "Pending")
+        # Waiters are not rescanned, so no WAITING events are produced
+        self.assertEqual([e.kind for e in self.events.events], ["ALLOCATED"])
+
+        second = Resource(2, ResourceType.AMBULANCE, "Zone 5")
+        self.manager.add_resource(second)
+        self.assertEqual(self.low.allocated_resources, [second])
+        self.assertEqual(self.police.status, "Pending")
+
+    def test_released_unit_skips_resolved_waiters(self):
+        unit = Resource(1, ResourceType.AMBULANCE, "Zone 1")
+        self.manager.add_resource(unit)
+        self.low.update_status("Resolved")
+        self.manager.resolve_incident(2)
+
+        self.assertTrue(unit.is_available)
+        self.assertEqual(self.low.allocated_resources, [])
+
+
+class TestMultiUnitRequirements(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ResourceManager(events=RingBufferSink())
+
+    def _units(self, resource_type, *zones, start=1):
+        units = [Resource(start + i, resource_type, f"Zone {z}") for i, z in enumerate(zones)]
+        for unit in units:
+            self.manager.add_resource(unit)
+        return units
+
+    def test_fills_every_unit_of_a_requirement_in_one_pass(self):
+        near, middle, far = self._units(ResourceType.AMBULANCE, 2, 4, 9)
+        incident = Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, {"Ambulance": 2})
+        self.manager.add_incident(incident)
+
+        self.assertEqual(incident.allocated_resources, [near, middle])
+        self.assertEqual(incident.status, "In Progress")
+        self.assertTrue(far.is_available)
+
+    def test_partially_served_incident_waits_for_the_rest(self):
+        first, = self._units(ResourceType.FIRE_TRUCK, 3)
+        incident = Incident(1, "Zone 1", "Fire", PriorityLevel.HIGH, ["Fire Truck"] * 3)
+        self.manager.add_incident(incident)
+        self.assertEqual(incident.needs(), {"Fire Truck": 2})
+        self.assertEqual(incident.status, "Pending")
+
+        # Both new trucks go to the same waiter, which stays first in line until served
+        second, third = self._units(ResourceType.FIRE_TRUCK, 5, 6, start=2)
+        self.assertEqual(incident.allocated_resources, [first, second, third])
+        self.assertEqual(incident.status, "In Progress")
+
+    def test_preemption_takes_only_the_missing_units(self):
+        units = self._units(ResourceType.POLICE_UNIT, 1, 2)
+        low = Incident(1, "Zone 1", "Theft", PriorityLevel.LOW, {"Police Unit": 2})
+        self.manager.add_incident(low)
+        high = Incident(2, "Zone 2", "Riot", PriorityLevel.HIGH, {"Police Unit": 1})
+        self.manager.add_incident(high)
+
+        self.assertEqual(len(high.allocated_resources), 1)
+        self.assertEqual(low.needs(), {"Police Unit": 1})
+        self.assertEqual(low.status, "Pending")
+
+        self.manager.resolve_incident(2)
+        self.assertEqual(sorted(r.resource_id for r in low.allocated_resources), [u.resource_id for u in units])
+        self.assertEqual(low.status, "In Progress")
+
+    def test_batch_strategy_serves_unit_counts(self):
+        manager = ResourceManager(incremental=False, events=RingBufferSink())
+        incident = Incident(1, "Zone 5", "Flood", PriorityLevel.MEDIUM, {"Search & Rescue Team": 2})
+        manager.add_incident(incident)
+        for rid, zone in enumerate((1, 4, 6), start=1):
+            manager.add_resource(Resource(rid, ResourceType.SEARCH_RESCUE_TEAM, f"Zone {zone}"))
+
+        manager.allocate_resources(strategy="batch")
+
+        self.assertEqual(sorted(r.resource_id for r in incident.allocated_resources), [2, 3])
+        self.assertEqual(incident.status, "In Progress")
+
+    def test_attach_borrowed_accepts_units_while_outstanding(self):
+        incident = Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, {"Ambulance": 2})
+        self.manager.add_incident(incident)
+
+        self.assertTrue(self.manager.attach_borrowed(1, Resource(90, ResourceType.AMBULANCE, "Zone 30")))
+        self.assertEqual(incident.status, "Pending")
+        self.assertTrue(self.manager.attach_borrowed(1, Resource(91, ResourceType.AMBULANCE, "Zone 30")))
+        self.assertFalse(self.manager.attach_borrowed(1, Resource(92, ResourceType.AMBULANCE, "Zone 30")))
+        self.assertEqual(incident.status, "In Progress")
+
+
+class TestLending(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ResourceManager(events=RingBufferSink())
+        self.near = Resource(1, ResourceType.AMBULANCE, "Zone 2")
+        self.far = Resource(2, ResourceType.AMBULANCE, "Zone 9")
+        self.manager.add_resource(self.far)
+        self.manager.add_resource(self.near)
+
+    def test_lend_takes_nearest_unit_out_of_service(self):
+        lent = self.manager.lend_resource("Ambulance", "Zone 1", 500)
+
+        self.assertIs(lent, self.near)
+        self.assertEqual(lent.assigned_to_incident, 500)
+        self.assertEqual(self.manager.summary_counts()['available'], 1)
+        self.assertIsNone(self.manager.lend_resource("Fire Truck", "Zone 1", 500))
+
+    def test_lent_unit_is_not_preempted_and_returns_to_waiters(self):
+        self.manager.lend_resource("Ambulance", "Zone 1", 500)
+        self.manager.lend_resource("Ambulance", "Zone 1", 501)
+        incident = Incident(1, "Zone 1", "Fall", PriorityLevel.HIGH, ["Ambulance"])
+        self.manager.add_incident(incident)
+        self.assertEqual(incident.allocated_resources, [])
+
+        self.manager.return_resource(self.near.resource_id)
+
+        self.assertEqual(incident.allocated_resources, [self.near])
+        self.assertEqual(incident.status, "In Progress")
+
+    def test_attach_borrowed_unit(self):
+        incident = Incident(1, "Zone 1", "Fire", PriorityLevel.MEDIUM, ["Ambulance", "Fire Truck"])
+        self.manager.add_incident(incident)
+        foreign = Resource(99, ResourceType.FIRE_TRUCK, "Zone 40")
+
+        self.assertTrue(self.manager.attach_borrowed(1, foreign))
+        self.assertFalse(self.manager.attach_borrowed(1, Resource(98, ResourceType.FIRE_TRUCK, "Zone 40")))
+        self.assertFalse(self.manager.attach_borrowed(1, Resource(97, ResourceType.POLICE_UNIT, "Zone 40")))
+        self.assertEqual(incident.status, "In Progress")
+        self.assertEqual(self.manager.summary_counts()['resources'], 2)  # Not part of the local fleet
+
+        self.manager.resolve_incident(1)
+        self.assertTrue(foreign.is_available)
+        self.assertFalse(self.manager.attach_borrowed(1, foreign))
+        self.assertEqual(
+            [e.kind for e in self.manager.events.events if e.kind in ("LENT", "BORROWED", "RETURNED")], ["BORROWED"]
+        )
+
+    def test_loans_survive_a_restart(self):
+        with tempfile.TemporaryDirectory() as directory:
+            journal = Journal(directory)
+            manager = ResourceManager(events=RingBufferSink(), journal=journal)
+            manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 2"))
+            manager.add_resource(Resource(2, ResourceType.AMBULANCE, "Zone 3"))
+            manager.lend_resource("Ambulance", "Zone 1", 500)
+            manager.lend_resource("Ambulance", "Zone 1", 501)
+            manager.return_resource(2)
+            journal.close()
+            self.assertIn("[LENT] Ambulance from Zone 2", manager.events.messages()[0])
+
+            journal = Journal(directory)
+            incidents, resources = journal.load()
+            restored = ResourceManager(events=RingBufferSink(), journal=journal)
+            restored.bulk_load(incidents, resources)
+            lent = restored.get_resource(1)
+            self.assertEqual((lent.is_available, lent.assigned_to_incident), (False, 500))
+            self.assertTrue(restored.get_resource(2).is_available)
+
+            restored.return_resource(1)
+            self.assertTrue(lent.is_available)
+            journal.close()
+
+
 if __name__ == '__main__':
     unittest.main()
 
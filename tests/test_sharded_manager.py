@@ -0,0 +1,118 @@
+# tests/test_sharded_manager.py
+
+import unittest
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.sharded_manager import ShardedResourceManager, partition_zones
+
+
+class TestPartition(unittest.TestCase):
+
+    def test_contiguous_regions(self):
+        regions = partition_zones(10, 3)
+        self.assertEqual(regions[0], ["Zone 1", "Zone 2", "Zone 3", "Zone 4"])
+        self.assertEqual(sum(len(r) for r in regions), 10)
+
+
+class TestShardedResourceManager(unittest.TestCase):
+
+    def setUp(self):
+        # Shard 0: zones 1-10, shard 1: zones 11-20, shard 2: zones 21-30
+        self.manager = ShardedResourceManager(partition_zones(30, 3))
+
+    def tearDown(self):
+        self.manager.close()
+
+    def test_routing(self):
+        self.assertEqual(self.manager.shard_of("Zone 4"), 0)
+        self.assertEqual(self.manager.shard_of("zone 15"), 1)
+        self.assertEqual(self.manager.shard_of("Zone 99"), 2)  # Closest region centre
+        self.assertEqual(self.manager.shard_of("Downtown"), self.manager.shard_of("downtown"))
+
+    def test_local_allocation(self):
+        self.manager.add_resources([
+            Resource(1, ResourceType.AMBULANCE, "Zone 2"),
+            Resource(2, ResourceType.AMBULANCE, "Zone 25"),
+        ])
+        self.manager.add_incidents([
+            Incident(1, "Zone 3", "Fall", PriorityLevel.HIGH, ["Ambulance"]),
+            Incident(2, "Zone 24", "Fall", PriorityLevel.HIGH, ["Ambulance"]),
+        ])
+
+        states = self.manager.incident_states()
+        self.assertEqual(states[1], ("In Progress", [1]))
+        self.assertEqual(states[2], ("In Progress", [2]))
+        self.assertEqual(self.manager.borrowed, 0)
+
+    def test_borrows_from_closest_region_and_returns_on_resolve(self):
+        self.manager.add_resources([
+            Resource(1, ResourceType.FIRE_TRUCK, "Zone 12"),
+            Resource(2, ResourceType.FIRE_TRUCK, "Zone 28"),
+        ])
+        self.manager.add_incidents([Incident(1, "Zone 9", "Fire", PriorityLevel.HIGH, ["Fire Truck"])])
+
+        self.assertEqual(self.manager.incident_states()[1], ("In Progress", [1]))
+        self.assertEqual(self.manager.borrowed, 1)
+        summary = self.manager.summary_counts()
+        self.assertEqual((summary['total'], summary['resources'], summary['available']), (1, 2, 1))
+
+        # The lender's own incidents borrow the last truck, then wait while theirs is on loan...
+        self.manager.add_incidents([
+            Incident(2, "Zone 13", "Fire", PriorityLevel.LOW, ["Fire Truck"]),
+            Incident(3, "Zone 14", "Fire", PriorityLevel.LOW, ["Fire Truck"]),
+        ])
+        states = self.manager.incident_states()
+        self.assertEqual(states[2], ("In Progress", [2]))
+        self.assertEqual(states[3], ("Pending", []))
+
+        # ...and get it back as soon as the borrower resolves
+        self.assertEqual(self.manager.resolve_incidents([1]), [1])
+        states = self.manager.incident_states()
+        self.assertEqual(states[1], ("Resolved", []))
+        self.assertEqual(states[3], ("In Progress", [1]))
+
+    def test_rebalance_serves_needs_after_units_arrive_elsewhere(self):
+        self.manager.add_incidents([
+            Incident(1, "Zone 5", "Crash", PriorityLevel.LOW, ["Police Unit"]),
+            Incident(2, "Zone 6", "Crash", PriorityLevel.HIGH, ["Police Unit"]),
+        ])
+        self.manager.add_resources([Resource(1, ResourceType.POLICE_UNIT, "Zone 30")])
+        self.assertEqual(self.manager.incident_states()[2], ("Pending", []))
+
+        self.manager.rebalance()
+
+        states = self.manager.incident_states()
+        self.assertEqual(states[2], ("In Progress", [1]))  # Highest priority first
+        self.assertEqual(states[1], ("Pending", []))
+
+    def test_resolved_incidents_leave_the_router(self):
+        self.manager.add_incidents([
+            Incident(1, "Zone 2", "Fall", PriorityLevel.LOW, ["Ambulance"]),
+            Incident(2, "Zone 22", "Fall", PriorityLevel.LOW, ["Ambulance"]),
+        ])
+        self.assertEqual(self.manager.resolve_incidents([1, 2, 3]), [1, 2])
+        self.assertEqual(self.manager._incident_shard, {})
+        self.assertEqual(self.manager.resolve_incidents([1]), [])
+
+        # Resolved incidents are no longer offered to lenders
+        self.manager.add_resources([Resource(1, ResourceType.AMBULANCE, "Zone 12")])
+        self.manager.rebalance()
+        self.assertEqual(self.manager.borrowed, 0)
+
+    def test_summary_merges_shards(self):
+        self.manager.add_resources([Resource(1, ResourceType.AMBULANCE, "Zone 1")])
+        self.manager.add_incidents([
+            Incident(1, "Zone 1", "Fall", PriorityLevel.LOW, ["Ambulance"]),
+            Incident(2, "Zone 21", "Fall", PriorityLevel.LOW, ["Medical Team"]),
+        ])
+
+        summary = self.manager.summary_counts()
+        self.assertEqual(summary['total'], 2)
+        self.assertEqual(summary['status'], {"In Progress": 1, "Pending": 1})
+        self.assertEqual(summary['zone'], {"Zone 1": 1, "Zone 21": 1})
+        self.assertEqual(self.manager.summary_counts(zone_filter="zone 21")['total'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
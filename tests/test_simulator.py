@@ -0,0 +1,104 @@
+# tests/test_simulator.py
+
+import unittest
+from datetime import datetime, timedelta
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.simulator import Simulator, distribution
+
+
+def _incident(incident_id, location, priority, required):
+    return Incident(incident_id, location, "Test", priority, required, timestamp=datetime(2000, 1, 1))
+
+
+class TestSimulator(unittest.TestCase):
+
+    def setUp(self):
+        # One zone of distance is 100 s of travel; every incident takes 1000 s on scene
+        self.simulator = Simulator(
+            travel_time=lambda distance: 100.0 * distance,
+            service_time=lambda incident: 1000.0,
+            start=datetime(2024, 1, 1)
+        )
+
+    def test_virtual_clock_and_response_times(self):
+        self.simulator.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        first = _incident(1, "Zone 3", PriorityLevel.HIGH, ["Ambulance"])
+        second = _incident(2, "Zone 1", PriorityLevel.HIGH, ["Ambulance"])
+        self.simulator.schedule_arrival(first, 10.0)
+        self.simulator.schedule_arrival(second, 20.0)
+
+        report = self.simulator.run()
+
+        # Incident timestamps follow the virtual clock, not the real one
+        self.assertEqual(first.timestamp, datetime(2024, 1, 1) + timedelta(seconds=10))
+        self.assertEqual(second.timestamp, datetime(2024, 1, 1) + timedelta(seconds=20))
+        # First: dispatched at 10, on scene at 210 (200 s), resolved at 1210.
+        # Second waits for the unit until 1210; it is in the same zone, so no travel (1190 s)
+        self.assertEqual(report['full_response']['count'], 2)
+        self.assertEqual(report['full_response']['mean'], (200.0 + 1190.0) / 2)
+        self.assertEqual(report['full_response']['max'], 1190.0)
+        self.assertEqual(report['queue_wait_by_type']['Ambulance']['max'], 1190.0)
+        self.assertEqual(report['virtual_seconds'], 2210.0)
+        self.assertEqual(report['unserved'], 0)
+        # Busy from 10 to 1210 and from 1210 to 2210
+        self.assertAlmostEqual(report['utilization_by_type']['Ambulance'], 2200.0 / 2210.0)
+        self.assertEqual(first.status, "Resolved")
+        self.assertEqual(second.status, "Resolved")
+
+    def test_unit_preempted_in_transit_is_redispatched(self):
+        self.simulator.add_resource(Resource(1, ResourceType.FIRE_TRUCK, "Zone 1"))
+        low = _incident(1, "Zone 5", PriorityLevel.LOW, ["Fire Truck"])
+        high = _incident(2, "Zone 2", PriorityLevel.HIGH, ["Fire Truck"])
+        self.simulator.schedule_arrival(low, 0.0)
+        self.simulator.schedule_arrival(high, 50.0)  # Before the truck reaches zone 5 at 400
+
+        report = self.simulator.run()
+
+        self.assertEqual(report['full_response_by_priority']['HIGH']['max'], 100.0)
+        # Low waits until the high-priority incident resolves at 1150, then 400 s of travel
+        self.assertEqual(report['full_response_by_priority']['LOW']['max'], 1550.0)
+        self.assertEqual(report['incidents'], 2)
+        self.assertEqual(report['unserved'], 0)
+
+    def test_multi_unit_incident_waits_for_every_unit(self):
+        self.simulator.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        self.simulator.add_resource(Resource(2, ResourceType.POLICE_UNIT, "Zone 4"))
+        self.simulator.schedule_arrival(_incident(1, "Zone 2", PriorityLevel.MEDIUM, ["Ambulance", "Police Unit"]), 0)
+
+        report = self.simulator.run()
+
+        self.assertEqual(report['first_response']['max'], 100.0)
+        self.assertEqual(report['full_response']['max'], 200.0)
+        self.assertEqual(report['virtual_seconds'], 1200.0)
+
+    def test_until_stops_the_clock(self):
+        self.simulator.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        self.simulator.schedule_arrival(_incident(1, "Zone 1", PriorityLevel.LOW, ["Ambulance"]), 0)
+
+        report = self.simulator.run(until=500)
+
+        self.assertEqual(report['virtual_seconds'], 0.0)  # On scene at 0, resolve at 1000 is pending
+        self.assertEqual(self.simulator.run()['virtual_seconds'], 1000.0)
+
+    def test_schedule_incidents_uses_timestamp_offsets(self):
+        self.simulator.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+        incident = Incident(1, "Zone 1", "Fall", PriorityLevel.LOW, ["Ambulance"],
+                            timestamp=datetime(2024, 1, 1, 0, 5))
+        self.simulator.schedule_incidents([incident])
+
+        report = self.simulator.run()
+
+        self.assertEqual(report['virtual_seconds'], 1300.0)
+
+    def test_distribution(self):
+        self.assertEqual(distribution([]), {'count': 0})
+        summary = distribution(range(1, 101))
+        self.assertEqual(summary['p50'], 51)
+        self.assertEqual(summary['p99'], 100)
+        self.assertEqual(summary['mean'], 50.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+# tests/test_spatial_index.py
+
+import os
+import random
+import tempfile
+import unittest
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from services.spatial_index import SpatialIndex
+from utils.events import NullSink
+from utils.geo import ZoneCentroids, euclidean, project_latlon
+from utils.journal import Journal
+from utils.persistence import load_data, save_data
+from utils.zones import ZoneRegistry
+
+
+class TestGeo(unittest.TestCase):
+
+    def test_zone_centroids_default_to_zone_numbers(self):
+        zones = ZoneRegistry()
+        centroids = ZoneCentroids(zones)
+        self.assertEqual(centroids.centroid(zones.intern("Zone 7")), (7.0, 0.0))
+        self.assertIsNone(centroids.centroid(zones.intern("Downtown")))
+
+        centroids.set_centroid("zone7", (3.0, 4.0))
+        self.assertEqual(centroids.centroid(zones.intern("Zone 7")), (3.0, 4.0))
+
+    def test_project_latlon(self):
+        # One degree of latitude is about 111.2 km
+        x, y = project_latlon(41.0, 29.0, (40.0, 29.0))
+        self.assertAlmostEqual(x, 0.0)
+        self.assertAlmostEqual(y, 111.19, places=1)
+
+
+class TestSpatialIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SpatialIndex(cell_size=2.0)
+
+    def _unit(self, resource_id, point, resource_type=ResourceType.AMBULANCE):
+        resource = Resource(resource_id, resource_type, "Zone 1", coordinates=point)
+        self.index.track(resource)
+        return resource
+
+    def test_k_nearest_filters_by_type_and_orders_by_distance(self):
+        far = self._unit(1, (9.0, 9.0))
+        near = self._unit(2, (1.0, 1.0))
+        self._unit(3, (0.5, 0.5), ResourceType.FIRE_TRUCK)
+        middle = self._unit(4, (-3.0, 0.0))
+
+        found = self.index.k_nearest(ResourceType.AMBULANCE, (0.0, 0.0), k=2)
+
+        self.assertEqual([r for _, r in found], [near, middle])
+        self.assertAlmostEqual(found[0][0], 2 ** 0.5)
+        self.assertEqual(len(self.index.k_nearest(ResourceType.AMBULANCE, (0.0, 0.0), k=10)), 3)
+        self.assertEqual(self.index.nearest(ResourceType.AMBULANCE, (10.0, 10.0)), far)
+        self.assertIsNone(self.index.nearest(ResourceType.POLICE_UNIT, (0.0, 0.0)))
+
+    def test_ties_go_to_the_earliest_tracked_unit(self):
+        first = self._unit(1, (1.0, 0.0))
+        second = self._unit(2, (-1.0, 0.0))
+        self.assertEqual(self.index.nearest(ResourceType.AMBULANCE, (0.0, 0.0)), first)
+        first.assign_to_incident(1)
+        self.assertEqual(self.index.nearest(ResourceType.AMBULANCE, (0.0, 0.0)), second)
+
+    def test_updates_incrementally_on_availability_and_moves(self):
+        unit = self._unit(1, (0.0, 0.0))
+        other = self._unit(2, (5.0, 0.0))
+
+        unit.assign_to_incident(9)
+        self.assertEqual(self.index.nearest(ResourceType.AMBULANCE, (0.0, 0.0)), other)
+        unit.release()
+        self.assertEqual(self.index.nearest(ResourceType.AMBULANCE, (0.0, 0.0)), unit)
+
+        unit.coordinates = (50.0, 50.0)
+        self.index.update(unit)
+        self.assertEqual(self.index.nearest(ResourceType.AMBULANCE, (0.0, 0.0)), other)
+        self.assertEqual(self.index.nearest(ResourceType.AMBULANCE, (49.0, 49.0)), unit)
+
+    def test_zone_only_units_sit_at_centroids(self):
+        unit = Resource(1, ResourceType.AMBULANCE, "Zone 4")
+        self.index.track(unit)
+        self.index.track(Resource(2, ResourceType.AMBULANCE, "Unknown place"))  # No position, not indexed
+        self.assertEqual(self.index.k_nearest(ResourceType.AMBULANCE, (4.0, 0.0), k=5), [(0.0, unit)])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(5)
+        units = [
+            self._unit(i, (rng.uniform(-40, 40), rng.uniform(-40, 40)), rng.choice(list(ResourceType)))
+            for i in range(400)
+        ]
+        for unit in rng.sample(units, 100):
+            unit.assign_to_incident(1)
+
+        for _ in range(50):
+            point = (rng.uniform(-60, 60), rng.uniform(-60, 60))
+            resource_type = rng.choice(list(ResourceType))
+            expected = sorted(
+                (euclidean(point, u.coordinates), u.resource_id)
+                for u in units if u.resource_type == resource_type and u.is_available
+            )[:7]
+            found = self.index.k_nearest(resource_type, point, k=7)
+            self.assertEqual([(d, u.resource_id) for d, u in found], expected)
+
+
+class TestSpatialAllocation(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ResourceManager(events=NullSink(), spatial=SpatialIndex(cell_size=1.0))
+
+    def test_allocates_by_coordinates_within_a_zone(self):
+        across_town = Resource(1, ResourceType.AMBULANCE, "Zone 3", coordinates=(3.0, 8.0))
+        next_door = Resource(2, ResourceType.AMBULANCE, "Zone 5", coordinates=(3.5, 0.5))
+        self.manager.add_resource(across_town)
+        self.manager.add_resource(next_door)
+
+        incident = Incident(1, "Zone 3", "Fall", PriorityLevel.HIGH, ["Ambulance"], coordinates=(3.0, 0.0))
+        self.manager.add_incident(incident)
+
+        # Zone distance would pick the unit in the incident's own zone
+        self.assertEqual(incident.allocated_resources, [next_door])
+
+    def test_zone_only_data_keeps_zone_semantics(self):
+        self.manager.add_resource(Resource(1, ResourceType.FIRE_TRUCK, "Zone 9"))
+        self.manager.add_resource(Resource(2, ResourceType.FIRE_TRUCK, "Zone 4"))
+        incident = Incident(1, "Zone 5", "Fire", PriorityLevel.HIGH, ["Fire Truck"])
+        self.manager.add_incident(incident)
+        self.assertEqual([r.resource_id for r in incident.allocated_resources], [2])
+
+    def test_nearest_resources_and_moves(self):
+        for rid, point in enumerate([(0.0, 5.0), (0.0, 1.0), (0.0, 3.0)], start=1):
+            self.manager.add_resource(Resource(rid, ResourceType.POLICE_UNIT, "Zone 1", coordinates=point))
+
+        nearest = self.manager.nearest_resources(ResourceType.POLICE_UNIT, "Zone 1", k=2, coordinates=(0.0, 0.0))
+        self.assertEqual([r.resource_id for r in nearest], [2, 3])
+
+        self.manager.move_resource(1, location="Zone 2", coordinates=(0.0, 0.2))
+        nearest = self.manager.nearest_resources(ResourceType.POLICE_UNIT, "Zone 1", k=1, coordinates=(0.0, 0.0))
+        self.assertEqual([r.resource_id for r in nearest], [1])
+        self.assertEqual([r.resource_id for r in self.manager.find_resources(zone="Zone 2")], [1])
+        self.assertIsNone(self.manager.move_resource(99, coordinates=(0.0, 0.0)))
+
+    def test_waiting_incident_gets_the_closest_released_unit(self):
+        unit = Resource(1, ResourceType.AMBULANCE, "Zone 1", coordinates=(0.0, 0.0))
+        self.manager.add_resource(unit)
+        first = Incident(1, "Zone 1", "Fall", PriorityLevel.HIGH, ["Ambulance"], coordinates=(0.0, 1.0))
+        second = Incident(2, "Zone 1", "Fall", PriorityLevel.HIGH, ["Ambulance"], coordinates=(0.0, 2.0))
+        self.manager.add_incident(first)
+        self.manager.add_incident(second)
+        self.assertEqual(second.status, "Pending")
+
+        self.manager.resolve_incident(1)
+        self.assertEqual(second.allocated_resources, [unit])
+
+    def test_nearest_resources_requires_spatial_index(self):
+        with self.assertRaises(ValueError):
+            ResourceManager(events=NullSink()).nearest_resources(ResourceType.AMBULANCE, "Zone 1")
+
+
+class TestCoordinatePersistence(unittest.TestCase):
+
+    def test_json_and_journal_keep_coordinates(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "resources.json")
+            save_data(filename, [Resource(1, ResourceType.AMBULANCE, "Zone 1", coordinates=(1.5, 2.5))], 'resource')
+            self.assertEqual(load_data(filename, 'resource')[0].coordinates, (1.5, 2.5))
+
+            journal = Journal(os.path.join(tmp, "journal"))
+            manager = ResourceManager(events=NullSink(), journal=journal)
+            manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+            manager.move_resource(1, location="Zone 6", coordinates=(6.0, 1.0))
+            journal.close()
+
+            _, resources = Journal(os.path.join(tmp, "journal")).load()
+            self.assertEqual((resources[0].location, resources[0].coordinates), ("Zone 6", (6.0, 1.0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# tests/test_sqlite_store.py
+
+import os
+import random
+import sqlite3
+import tempfile
+import unittest
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+from utils.sqlite_store import SQLiteStore
+
+
+def _state(incidents, resources):
+    return (
+        [(i.incident_id, i.location, i.priority, i.status, i.timestamp, i.required_resources,
+          [r.resource_id for r in i.allocated_resources]) for i in incidents],
+        [(r.resource_id, r.resource_type, r.location, r.is_available, r.assigned_to_incident) for r in resources],
+    )
+
+
+class TestSQLiteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SQLiteStore()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_save_and_load_restore_allocations(self):
+        truck = Resource(1, ResourceType.FIRE_TRUCK, "Zone 2", is_available=False)
+        truck.assigned_to_incident = 7
+        fire = Incident(7, "Zone 2", "Fire", PriorityLevel.HIGH, ["Fire Truck", "Ambulance"])
+        fire.allocated_resources.append(truck)
+        self.store.save([fire], [truck])
+
+        incidents, resources = self.store.load()
+        self.assertEqual(_state(incidents, resources), _state([fire], [truck]))
+        self.assertIs(incidents[0].allocated_resources[0], resources[0])
+
+    def test_flush_writes_only_dirty_rows(self):
+        ambulance = Resource(1, ResourceType.AMBULANCE, "Zone 1")
+        crash = Incident(1, "Zone 1", "Crash", PriorityLevel.MEDIUM, ["Ambulance"])
+        self.store.watch(ambulance)
+        self.store.watch(crash)
+        self.store.flush()
+        self.assertEqual(self.store.pending, 0)
+
+        ambulance.assign_to_incident(crash.incident_id)
+        crash.allocated_resources.append(ambulance)
+        self.assertEqual(self.store.pending, 1)
+        crash.update_status("In Progress")
+        self.assertEqual(self.store.pending, 2)
+
+        incidents, resources = self.store.load()
+        self.assertEqual(incidents[0].status, "In Progress")
+        self.assertEqual([r.resource_id for r in incidents[0].allocated_resources], [1])
+
+        ambulance.release()
+        crash.allocated_resources.clear()
+        incidents, _ = self.store.load()
+        self.assertEqual(incidents[0].allocated_resources, [])
+
+    def test_filtered_queries(self):
+        self.store.save([
+            Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, []),
+            Incident(2, "Zone 2", "Crash", PriorityLevel.LOW, []),
+            Incident(3, "Zone 1", "Crash", PriorityLevel.LOW, []),
+        ], [])
+        ids = [i.incident_id for i in self.store.load_incidents(zone="zone 1", priority="low")]
+        self.assertEqual(ids, [3])
+        self.assertEqual(self.store.load_incidents(priority="urgent"), [])
+
+
+class TestManagerWithStore(unittest.TestCase):
+
+    def test_sql_summary_matches_in_memory_counts(self):
+        rng = random.Random(3)
+        store = SQLiteStore()
+        with_store = ResourceManager(events=NullSink(), store=store)
+        in_memory = ResourceManager(events=NullSink())
+        fleet = [rng.choice(list(ResourceType)) for _ in range(30)]
+        for manager in (with_store, in_memory):
+            for rid, resource_type in enumerate(fleet):
+                manager.add_resource(Resource(rid, resource_type, f"Zone {rid % 5 + 1}"))
+        for iid in range(60):
+            priority = rng.choice(list(PriorityLevel))
+            location = f"Zone {rng.randint(1, 6)}"
+            required = [rng.choice(list(ResourceType)).value]
+            for manager in (with_store, in_memory):
+                manager.add_incident(Incident(iid, location, "Test", priority, list(required)))
+                if iid % 4 == 0:
+                    manager.get_all_incidents()[iid // 2].update_status("Resolved")
+                    manager.release_resources_from_resolved()
+
+        for filters in [(None, None, None), ("resolved", None, None), (None, "ZONE 2", "high"), ("Pending", None, "Low")]:
+            self.assertEqual(with_store.summary_counts(*filters), in_memory.summary_counts(*filters))
+
+        incidents, resources = store.load()
+        self.assertEqual(
+            _state(incidents, resources),
+            _state(with_store.get_all_incidents(), sorted(with_store.get_all_resources(), key=lambda r: r.resource_id))
+        )
+        store.close()
+
+    def test_each_operation_reaches_the_database(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state.db")
+            store = SQLiteStore(path)
+            manager = ResourceManager(events=NullSink(), store=store)
+            reader = sqlite3.connect(path)
+
+            def row(table, key, value):
+                return reader.execute(f"SELECT * FROM {table} WHERE {key} = ?", (value,)).fetchone()
+
+            manager.add_resource(Resource(1, ResourceType.AMBULANCE, "Zone 1"))
+            self.assertEqual(store.pending, 0)
+            self.assertEqual(row("resources", "resource_id", 1)[3], 1)
+
+            manager.add_incident(Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, ["Ambulance"]))
+            self.assertEqual(store.pending, 0)
+            self.assertEqual(row("incidents", "incident_id", 1)[5], "In Progress")
+            self.assertEqual(row("allocations", "resource_id", 1), (1, 1))
+
+            manager.resolve_incident(1)
+            self.assertEqual(store.pending, 0)
+            self.assertEqual(row("incidents", "incident_id", 1)[5], "Resolved")
+            self.assertIsNone(row("allocations", "resource_id", 1))
+
+            manager.move_resource(1, location="Zone 3")
+            self.assertEqual(row("resources", "resource_id", 1)[2], "Zone 3")
+            reader.close()
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
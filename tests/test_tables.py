@@ -0,0 +1,70 @@
+# tests/test_tables.py
+
+import unittest
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from models.tables import IncidentTable, ResourceTable, StringTable
+from services.resource_manager import ResourceManager
+from utils.events import NullSink
+
+
+class TestTables(unittest.TestCase):
+
+    def setUp(self):
+        self.ambulance = Resource(1, ResourceType.AMBULANCE, "Zone 1")
+        self.truck = Resource(2, ResourceType.FIRE_TRUCK, "Zone 4", is_available=False)
+        self.truck.assigned_to_incident = 10
+        self.incident = Incident(10, "Zone 4", "Fire", PriorityLevel.HIGH, ["Fire Truck", "Ambulance"])
+        self.incident.allocated_resources.append(self.truck)
+        self.incident.update_status("In Progress")
+
+    def test_models_use_slots(self):
+        with self.assertRaises(AttributeError):
+            self.ambulance.colour = "white"
+        with self.assertRaises(AttributeError):
+            self.incident.notes = "none"
+
+    def test_resource_round_trip(self):
+        table = ResourceTable.from_resources([self.ambulance, self.truck])
+        restored = list(table)
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(restored[1].resource_type, ResourceType.FIRE_TRUCK)
+        self.assertEqual(restored[1].location, "Zone 4")
+        self.assertFalse(restored[1].is_available)
+        self.assertEqual(restored[1].assigned_to_incident, 10)
+        self.assertIsNone(restored[0].assigned_to_incident)
+
+    def test_incident_round_trip_with_shared_strings(self):
+        strings = StringTable()
+        resources = ResourceTable.from_resources([self.ambulance, self.truck], strings)
+        incidents = IncidentTable.from_incidents([self.incident], strings)
+        by_id = {r.resource_id: r for r in resources}
+
+        restored = incidents.incident(0, by_id)
+        self.assertEqual(restored.required_resources, ["Fire Truck", "Ambulance"])
+        self.assertEqual(restored.status, "In Progress")
+        self.assertEqual(restored.priority, PriorityLevel.HIGH)
+        self.assertEqual(restored.timestamp, self.incident.timestamp)
+        self.assertEqual([r.resource_id for r in restored.allocated_resources], [2])
+        # 'Zone 4' is stored once for both tables
+        self.assertEqual(strings.strings.count("Zone 4"), 1)
+
+    def test_status_updates_in_place(self):
+        table = IncidentTable.from_incidents([self.incident])
+        table.set_status(0, "Resolved")
+        self.assertEqual(table.status(0), "Resolved")
+
+    def test_manager_loads_from_tables(self):
+        pending = Incident(11, "Zone 2", "Crash", PriorityLevel.MEDIUM, ["Ambulance"])
+        manager = ResourceManager(events=NullSink())
+        manager.bulk_load(IncidentTable.from_incidents([pending]), ResourceTable.from_resources([self.ambulance]))
+
+        restored = manager.get_all_incidents()[0]
+        self.assertEqual(restored.status, "In Progress")
+        self.assertEqual(restored.allocated_resources[0].resource_id, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
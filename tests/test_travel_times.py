@@ -0,0 +1,70 @@
+# tests/test_travel_times.py
+
+import json
+import os
+import tempfile
+import unittest
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+from services.resource_manager import ResourceManager
+from utils.travel_times import GraphDistanceProvider, UNREACHABLE
+from utils.zones import ZONES
+
+
+class TestGraphDistanceProvider(unittest.TestCase):
+
+    def setUp(self):
+        # Ring road: 1 - 2 - 3 - 9 - 1, with a slow link between 1 and 2
+        self.graph = {"edges": [
+            ["Zone 1", "Zone 2", 10],
+            ["Zone 2", "Zone 3", 1],
+            ["Zone 3", "Zone 9", 1],
+            ["Zone 9", "Zone 1", 1],
+        ]}
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w") as f:
+            json.dump(self.graph, f)
+        self.provider = GraphDistanceProvider.from_file(self.path)
+        self.z1, self.z2, self.z3, self.z9 = (ZONES.intern(f"Zone {n}") for n in (1, 2, 3, 9))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_shortest_paths(self):
+        self.assertEqual(self.provider.distance(self.z1, self.z2), 3)
+        self.assertEqual(self.provider.distance(self.z1, self.z9), 1)
+        self.assertEqual(self.provider.distance(self.z1, ZONES.intern("Zone 42")), UNREACHABLE)
+
+    def test_road_closure_updates_travel_time(self):
+        self.assertEqual(self.provider.distance(self.z1, self.z3), 2)
+        self.provider.remove_edge("Zone 3", "Zone 9")
+        self.assertEqual(self.provider.distance(self.z1, self.z3), 11)
+
+    def test_only_affected_rows_are_invalidated(self):
+        self.provider.row(self.z1)
+        self.provider.row(self.z3)
+        # Zone 1 -> Zone 2 is not on any shortest path from Zone 3, so slowing it keeps that row
+        self.provider.set_edge("Zone 1", "Zone 2", 20)
+        self.assertIn(self.z3, self.provider._rows)
+        self.assertIn(self.z1, self.provider._rows)
+
+        # Zone 3 -> Zone 9 is on Zone 1's path to Zone 3
+        self.provider.set_edge("Zone 3", "Zone 9", 5)
+        self.assertNotIn(self.z1, self.provider._rows)
+        self.assertEqual(self.provider.distance(self.z1, self.z3), 6)
+
+    def test_manager_uses_road_distances(self):
+        manager = ResourceManager(distances=self.provider)
+        numeric_neighbor = Resource(1, ResourceType.AMBULANCE, "Zone 2")
+        road_neighbor = Resource(2, ResourceType.AMBULANCE, "Zone 9")
+        manager.add_resource(numeric_neighbor)
+        manager.add_resource(road_neighbor)
+
+        incident = Incident(1, "Zone 1", "Crash", PriorityLevel.HIGH, ["Ambulance"])
+        manager.add_incident(incident)
+        self.assertEqual(incident.allocated_resources, [road_neighbor])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# tests/test_workload.py
+
+import unittest
+from datetime import datetime, timedelta
+from benchmarks.suite import compare
+from benchmarks.workload import WorkloadGenerator, WorkloadSpec
+
+
+def _fleet(generator, size):
+    return [(r.resource_type.value, r.location) for r in generator.fleet(size)]
+
+
+def _stream(generator, count):
+    return [(i.location, i.priority.name, i.required_resources, i.timestamp) for i in generator.incidents(count)]
+
+
+class TestWorkloadGenerator(unittest.TestCase):
+
+    def test_seed_pins_the_output(self):
+        generator = WorkloadGenerator(WorkloadSpec(zones=5, seed=7))
+        self.assertEqual(_fleet(generator, 3), [
+            ("Fire Truck", "Zone 1"), ("Ambulance", "Zone 5"), ("Police Unit", "Zone 1"),
+        ])
+        self.assertEqual(_stream(generator, 3), [
+            ("Zone 1", "MEDIUM", ["Search & Rescue Team"], datetime(2024, 1, 1, 0, 0, 0, 45522)),
+            ("Zone 1", "LOW", ["Fire Truck"], datetime(2024, 1, 1, 0, 0, 0, 102376)),
+            ("Zone 5", "LOW", ["Search & Rescue Team"], datetime(2024, 1, 1, 0, 0, 0, 277737)),
+        ])
+
+    def test_same_spec_same_workload(self):
+        first, second = WorkloadGenerator(WorkloadSpec(seed=3)), WorkloadGenerator(WorkloadSpec(seed=3))
+        self.assertEqual(_fleet(first, 50), _fleet(second, 50))
+        self.assertEqual(_stream(first, 200), _stream(second, 200))
+        self.assertNotEqual(_stream(WorkloadGenerator(WorkloadSpec(seed=4)), 200), _stream(first, 200))
+
+    def test_arrivals_follow_the_rate(self):
+        start = datetime(2025, 6, 1)
+        stream = WorkloadGenerator(WorkloadSpec(arrival_rate=20.0, seed=5)).incidents(5000, start)
+        timestamps = [i.timestamp for i in stream]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertGreater(timestamps[0], start)
+        # 5000 exponential gaps with mean 1/20 s: the span is within a few percent of 250 s
+        span = (timestamps[-1] - start) / timedelta(seconds=1)
+        self.assertAlmostEqual(span / 250.0, 1.0, delta=0.05)
+
+    def test_mixes_and_requirement_bound(self):
+        spec = WorkloadSpec(
+            zones=3, type_mix={"Ambulance": 1.0, "Fire Truck": 0.0},
+            priority_mix={"HIGH": 1.0}, max_requirements=3, seed=1
+        )
+        generator = WorkloadGenerator(spec)
+        self.assertEqual({t for t, _ in _fleet(generator, 100)}, {"Ambulance"})
+        for location, priority, required, _ in _stream(generator, 100):
+            self.assertIn(location, ("Zone 1", "Zone 2", "Zone 3"))
+            self.assertEqual(priority, "HIGH")
+            self.assertEqual(required, ["Ambulance"])
+
+
+class TestSuiteCompare(unittest.TestCase):
+
+    def test_flags_only_regressions_past_the_threshold(self):
+        baseline = {"steps": [
+            {"incidents": 1000, "fleet": 500, "allocate_seconds": 1.0, "allocate_throughput": 1000.0,
+             "save_seconds": 0.0, "report_seconds": 0.5},
+            {"incidents": 5000, "fleet": 2500, "allocate_seconds": 1.0},
+        ]}
+        current = {"steps": [
+            {"incidents": 1000, "fleet": 400, "allocate_seconds": 1.1, "allocate_throughput": 700.0,
+             "save_seconds": 9.0, "report_seconds": 0.8},
+            {"incidents": 2000, "fleet": 1000, "allocate_seconds": 50.0},  # No baseline step
+        ]}
+        regressions = compare(baseline, current, threshold=0.2)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("scale=1000 allocate_throughput: 1000 -> 700"))
+        self.assertTrue(regressions[1].startswith("scale=1000 report_seconds: 0.5 -> 0.8"))
+
+    def test_improvements_are_not_regressions(self):
+        baseline = {"steps": [{"incidents": 10, "allocate_seconds": 2.0, "allocate_throughput": 5.0}]}
+        current = {"steps": [{"incidents": 10, "allocate_seconds": 1.0, "allocate_throughput": 10.0}]}
+        self.assertEqual(compare(baseline, current, threshold=0.0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# tests/test_zones.py
+
+import sys
+import threading
+import unittest
+from utils.zones import ZoneRegistry, FALLBACK_DISTANCE, parse_zone_number
+
+
+class TestZoneRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.zones = ZoneRegistry()
+
+    def test_parse_zone_number(self):
+        self.assertEqual(parse_zone_number("Zone 12"), 12)
+        self.assertIsNone(parse_zone_number("Depot"))
+        self.assertIsNone(parse_zone_number(None))
+
+    def test_same_zone_number_shares_an_id(self):
+        self.assertEqual(self.zones.intern("Zone 2"), self.zones.intern("zone2"))
+        self.assertNotEqual(self.zones.intern("Zone 2"), self.zones.intern("Zone 3"))
+        self.assertEqual(self.zones.intern(""), ZoneRegistry.UNKNOWN_ZONE)
+
+    def test_distance_table(self):
+        z1 = self.zones.intern("Zone 1")
+        z4 = self.zones.intern("Zone 4")
+        unknown = self.zones.intern("Nowhere")
+
+        self.assertEqual(self.zones.distance(z1, z4), 3)
+        self.assertEqual(self.zones.distance(z4, z1), 3)
+        self.assertEqual(self.zones.distance(z4, z4), 0)
+        self.assertEqual(self.zones.distance(z1, unknown), FALLBACK_DISTANCE)
+        self.assertEqual(self.zones.distance(unknown, unknown), FALLBACK_DISTANCE)
+
+    def test_zones_by_distance_is_refreshed_for_new_zones(self):
+        z5 = self.zones.intern("Zone 5")
+        first = self.zones.zones_by_distance(z5)
+        z6 = self.zones.intern("Zone 6")
+
+        self.assertNotIn((1, z6), first)
+        self.assertEqual(self.zones.zones_by_distance(z5)[:2], [(0, z5), (1, z6)])
+
+    def test_concurrent_registration_assigns_unique_ids(self):
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+        try:
+            barrier = threading.Barrier(8)
+
+            def register(offset):
+                barrier.wait()
+                for number in range(offset, 400, 8):
+                    self.zones.intern(f"Zone {number}")
+                    self.zones.intern(f"Zone {number + 1}")
+
+            threads = [threading.Thread(target=register, args=(offset,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        ids = {number: self.zones.intern(f"Zone {number}") for number in range(401)}
+        self.assertEqual(sorted(ids.values()), list(range(1, 402)))
+        self.assertEqual(len(self.zones), 402)
+        for number, zone_id in ids.items():
+            self.assertEqual(self.zones.number(zone_id), number)
+            self.assertEqual(len(self.zones.row(zone_id)), 402)
+            self.assertEqual(self.zones.distance(zone_id, ids[0]), number)
+
+
+if __name__ == '__main__':
+    unittest.main()
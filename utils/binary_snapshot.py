@@ -0,0 +1,336 @@
+# utils/binary_snapshot.py
+
+import math
+import mmap
+import os
+import struct
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from models.enums import PriorityLevel
+from models.incident import Incident
+from models.resource import Resource
+from models.tables import NO_INCIDENT, RESOURCE_TYPES, TYPE_CODES, StringTable
+
+MAGIC = b"ERAS"
+VERSION = 2  # 2 added coordinates; version 1 files are still read
+
+# magic, version, journal sequence number, then counts and section offsets
+# for: strings, resources, incidents, required, allocated
+_HEADER = struct.Struct("<4sH2xQ5Q5Q")
+_STRING_LENGTH = struct.Struct("<I")
+# resource_id, type code, is_available, location string id, assigned incident id,
+# x, y (NaN when the unit has no coordinates)
+_RESOURCE = struct.Struct("<qBB2xiqdd")
+# incident_id, location, emergency type, status (string ids), priority, timestamp,
+# required start/count, allocated start/count, x, y (NaN when none)
+_INCIDENT = struct.Struct("<qiiiB3xdqIqIdd")
+# Version 1 records: the same fields without the coordinates
+_V1_RECORDS = (struct.Struct("<qBB2xiq"), struct.Struct("<qiiiB3xdqIqI"))
+_NO_COORDINATES = (math.nan, math.nan)
+_REQUIRED = struct.Struct("<i")
+_ALLOCATED = struct.Struct("<q")
+
+
+class BinarySnapshot:
+    """
+    Read-only, memory-mapped view of a binary snapshot file.
+
+    The file holds a string table followed by fixed-width resource and incident
+    records, so any record can be decoded straight from the mapping by offset.
+    Opening a snapshot only reads the header and string table; resources and
+    active incidents are decoded on request, and resolved history is handed out
+    as a LazyIncidentHistory that decodes a record only when it is accessed.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Maps a snapshot file.
+
+        :param filename: Path to a file written by save_binary_snapshot.
+        """
+        self._file = open(filename, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _HEADER.unpack_from(self._map, 0)
+        if header[0] != MAGIC or header[1] not in (1, VERSION):
+            raise ValueError(f"Not a version 1 or {VERSION} snapshot: {filename}")
+        self._resource, self._incident = _V1_RECORDS if header[1] == 1 else (_RESOURCE, _INCIDENT)
+        self.seq = header[2]
+        (self.string_count, self.resource_count, self.incident_count,
+         self.required_count, self.allocated_count) = header[3:8]
+        (strings_at, self._resources_at, self._incidents_at,
+         self._required_at, self._allocated_at) = header[8:13]
+
+        self.strings: List[str] = []
+        offset = strings_at
+        for _ in range(self.string_count):
+            (length,) = _STRING_LENGTH.unpack_from(self._map, offset)
+            offset += _STRING_LENGTH.size
+            self.strings.append(self._map[offset:offset + length].decode('utf-8'))
+            offset += length
+        self._string_ids = {value: i for i, value in enumerate(self.strings)}
+
+    def resources(self) -> List[Resource]:
+        """
+        Decodes every resource record.
+        """
+        resources = []
+        record = self._resource
+        for row in range(self.resource_count):
+            rid, type_code, available, location, assigned, *point = record.unpack_from(
+                self._map, self._resources_at + row * record.size
+            )
+            resource = Resource(
+                rid, RESOURCE_TYPES[type_code], self.strings[location], bool(available), _coordinates(point)
+            )
+            resource.assigned_to_incident = None if assigned == NO_INCIDENT else assigned
+            resources.append(resource)
+        return resources
+
+    def incident_fields(self, row: int) -> tuple:
+        """
+        Unpacks the raw fixed-width fields of an incident record without building an object.
+        Version 1 records are padded with NaN coordinates, so the layout is always the current one.
+        """
+        fields = self._incident.unpack_from(self._map, self._incidents_at + row * self._incident.size)
+        return fields if self._incident is _INCIDENT else fields + _NO_COORDINATES
+
+    def required_ids(self, start: int, count: int) -> List[int]:
+        """
+        Returns the string ids of an incident's required resource types.
+        """
+        return [
+            _REQUIRED.unpack_from(self._map, self._required_at + (start + i) * _REQUIRED.size)[0]
+            for i in range(count)
+        ]
+
+    def incident(self, row: int, resources_by_id: Optional[Dict[int, Resource]] = None) -> Incident:
+        """
+        Decodes one incident record.
+
+        :param row: Record number.
+        :param resources_by_id: Optional lookup used to restore allocated resources.
+        :return: Incident object.
+        """
+        (iid, location, emergency, status, priority, timestamp,
+         req_start, req_count, alloc_start, alloc_count, x, y) = self.incident_fields(row)
+        incident = Incident(
+            incident_id=iid,
+            location=self.strings[location],
+            emergency_type=self.strings[emergency],
+            priority=PriorityLevel(priority),
+            required_resources=[self.strings[i] for i in self.required_ids(req_start, req_count)],
+            coordinates=_coordinates((x, y))
+        )
+        incident.status = self.strings[status]
+        incident.timestamp = datetime.fromtimestamp(timestamp)
+        if resources_by_id is not None:
+            for i in range(alloc_count):
+                (rid,) = _ALLOCATED.unpack_from(self._map, self._allocated_at + (alloc_start + i) * _ALLOCATED.size)
+                if rid in resources_by_id:
+                    incident.allocated_resources.append(resources_by_id[rid])
+        return incident
+
+    def split_incidents(self, resources_by_id: Dict[int, Resource]) -> Tuple[List[Incident], "LazyIncidentHistory"]:
+        """
+        Decodes active incidents now and defers resolved history.
+
+        Only the status and allocation count of each record are read to decide;
+        resolved incidents still holding units count as active so they can be released.
+
+        :param resources_by_id: Lookup used to restore allocated resources.
+        :return: (active incidents, lazy resolved history)
+        """
+        resolved = self._string_ids.get("Resolved", -1)
+        active, history_rows = [], []
+        for row in range(self.incident_count):
+            fields = self.incident_fields(row)
+            if fields[3] == resolved and fields[9] == 0:
+                history_rows.append(row)
+            else:
+                active.append(self.incident(row, resources_by_id))
+        return active, LazyIncidentHistory(self, history_rows)
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file.
+        """
+        self._map.close()
+        self._file.close()
+
+
+def _coordinates(point: Sequence[float]) -> Optional[Tuple[float, float]]:
+    """
+    Turns a stored (x, y) pair back into coordinates; NaN (or a version 1 record) means none.
+    """
+    if len(point) != 2 or math.isnan(point[0]):
+        return None
+    return point[0], point[1]
+
+
+def _point(coordinates: Optional[Tuple[float, float]]) -> Tuple[float, float]:
+    """
+    Turns optional coordinates into the stored (x, y) pair.
+    """
+    return _NO_COORDINATES if coordinates is None else (coordinates[0], coordinates[1])
+
+
+class LazyIncidentHistory(Sequence):
+    """
+    Sequence of resolved incidents that are decoded from the snapshot on access.
+    """
+
+    def __init__(self, snapshot: BinarySnapshot, rows: List[int]):
+        """
+        :param snapshot: Snapshot the records live in.
+        :param rows: Record numbers of the history incidents, in file order.
+        """
+        self.snapshot = snapshot
+        self.rows = rows
+        self._decoded: Dict[int, Incident] = {}  # row -> Incident
+        self._rows_by_id: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.rows)))]
+        row = self.rows[index]
+        incident = self._decoded.get(row)
+        if incident is None:
+            incident = self.snapshot.incident(row)
+            self._decoded[row] = incident
+        return incident
+
+    def __iter__(self) -> Iterator[Incident]:
+        for i in range(len(self.rows)):
+            yield self[i]
+
+    def incident_ids(self) -> List[int]:
+        """
+        Returns the IDs of the history incidents without decoding them.
+        """
+        return [self.snapshot.incident_fields(row)[0] for row in self.rows]
+
+    def summary_keys(self) -> Iterator[Tuple[str, str, str]]:
+        """
+        Yields each incident's (status, priority name, location), decoding nothing
+        that has not already been materialized.
+        """
+        strings = self.snapshot.strings
+        for row in self.rows:
+            incident = self._decoded.get(row)
+            if incident is not None:
+                yield incident.status, incident.priority.name, incident.location
+            else:
+                fields = self.snapshot.incident_fields(row)
+                yield strings[fields[3]], PriorityLevel(fields[4]).name, strings[fields[1]]
+
+    def pop_by_id(self, incident_id: int) -> Optional[Incident]:
+        """
+        Decodes and removes the incident with an ID, e.g. when a journal record touches it.
+
+        :return: The Incident, or None if it is not in the history.
+        """
+        if self._rows_by_id is None:
+            self._rows_by_id = dict(zip(self.incident_ids(), self.rows))
+        row = self._rows_by_id.pop(incident_id, None)
+        if row is None:
+            return None
+        self.rows.remove(row)
+        return self._decoded.pop(row, None) or self.snapshot.incident(row)
+
+    def is_decoded(self, position: int) -> bool:
+        """
+        Returns True if the incident at a position has been materialized.
+        """
+        return self.rows[position] in self._decoded
+
+
+def save_binary_snapshot(
+    filename: str,
+    incidents: Sequence[Incident],
+    resources: Sequence[Resource],
+    history: Optional[LazyIncidentHistory] = None,
+    seq: int = 0
+) -> None:
+    """
+    Writes incidents and resources to a binary snapshot file.
+
+    History records that were never decoded are copied field by field from their
+    source snapshot without building Incident objects. The file is written to a
+    temporary path and moved into place, so readers never see a partial file.
+
+    :param filename: Output path.
+    :param incidents: Incidents to write (after any history).
+    :param resources: Resources to write.
+    :param history: Optional lazy history to write first.
+    :param seq: Journal sequence number the snapshot covers.
+    """
+    strings = StringTable(history.snapshot.strings if history is not None else ())
+    intern = strings.intern
+    resource_records = []
+    for r in resources:
+        assigned = NO_INCIDENT if r.assigned_to_incident is None else r.assigned_to_incident
+        resource_records.append(_RESOURCE.pack(
+            r.resource_id, TYPE_CODES[r.resource_type], 1 if r.is_available else 0, intern(r.location), assigned,
+            *_point(r.coordinates)
+        ))
+
+    incident_records, required, allocated = [], [], []
+
+    def add_incident(iid, location, emergency, status, priority, timestamp, required_ids, allocated_ids, point):
+        incident_records.append(_INCIDENT.pack(
+            iid, location, emergency, status, priority, timestamp,
+            len(required), len(required_ids), len(allocated), len(allocated_ids), *point
+        ))
+        required.extend(required_ids)
+        allocated.extend(allocated_ids)
+
+    if history is not None:
+        for position, row in enumerate(history.rows):
+            if history.is_decoded(position):
+                continue  # Written below from the (possibly updated) object
+            (iid, location, emergency, status, priority, timestamp,
+             req_start, req_count, _, _, x, y) = history.snapshot.incident_fields(row)
+            # The string table starts with the source table, so string ids carry over unchanged
+            add_incident(iid, location, emergency, status, priority, timestamp,
+                         history.snapshot.required_ids(req_start, req_count), [], (x, y))
+        decoded = [history[p] for p in range(len(history)) if history.is_decoded(p)]
+    else:
+        decoded = []
+
+    for incident in list(decoded) + list(incidents):
+        add_incident(
+            incident.incident_id, intern(incident.location), intern(incident.emergency_type),
+            intern(incident.status), incident.priority.value, incident.timestamp.timestamp(),
+            [intern(name) for name in incident.required_resources],
+            [r.resource_id for r in incident.allocated_resources],
+            _point(incident.coordinates)
+        )
+
+    encoded = [s.encode('utf-8') for s in strings.strings]
+    strings_at = _HEADER.size
+    resources_at = strings_at + sum(_STRING_LENGTH.size + len(b) for b in encoded)
+    incidents_at = resources_at + len(resource_records) * _RESOURCE.size
+    required_at = incidents_at + len(incident_records) * _INCIDENT.size
+    allocated_at = required_at + len(required) * _REQUIRED.size
+
+    temp_path = filename + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_HEADER.pack(
+            MAGIC, VERSION, seq,
+            len(encoded), len(resource_records), len(incident_records), len(required), len(allocated),
+            strings_at, resources_at, incidents_at, required_at, allocated_at
+        ))
+        for data in encoded:
+            f.write(_STRING_LENGTH.pack(len(data)))
+            f.write(data)
+        f.write(b"".join(resource_records))
+        f.write(b"".join(incident_records))
+        f.write(struct.pack(f"<{len(required)}i", *required))
+        f.write(struct.pack(f"<{len(allocated)}q", *allocated))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, filename)
@@ -0,0 +1,238 @@
+# utils/events.py
+
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from typing import List, Optional, TextIO
+
+
+class EventLevel(IntEnum):
+    """
+    Severity of an allocation event. Sinks drop events below their level
+    before any message formatting happens.
+    """
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+
+
+class AllocationEvent:
+    """
+    Structured record of something the allocator did (or could not do).
+
+    Fields are copied from the incident and resource when the event is created,
+    so writers running later (e.g., on a background thread) see the state at the
+    time of the event. The console message is only built when asked for.
+    """
+
+    __slots__ = ("kind", "level", "data", "timestamp")
+
+    _TEMPLATES = {
+        "INCIDENT_ADDED": "\n[INFO] New incident reported (Priority: {priority})",
+        "ALLOCATED": (
+            "[ALLOCATED] {resource_type} from {resource_location} "
+            "→ Incident {incident_id} ({incident_location}) "
+            "[Distance: {distance} zone(s)]"
+        ),
+        "WAITING": "[WAITING] No available {resource_type} for Incident {incident_id}",
+        "PREEMPTED": (
+            "[PREEMPTED] {resource_type} taken from Incident {victim_id} "
+            "(Priority: {victim_priority}) for Incident {incident_id} (Priority: {priority})"
+        ),
+        "LENT": "[LENT] {resource_type} from {resource_location} → remote Incident {incident_id} ({incident_location})",
+        "BORROWED": "[BORROWED] {resource_type} from {resource_location} → Incident {incident_id} ({incident_location})",
+        "RETURNED": "[RETURNED] {resource_type} back in service at {resource_location}",
+    }
+
+    def __init__(self, kind: str, level: EventLevel, **data):
+        """
+        Initializes an event.
+
+        :param kind: Event kind, e.g. 'ALLOCATED' or 'WAITING'.
+        :param level: EventLevel of the event.
+        :param data: Event fields used by the message template.
+        """
+        self.kind = kind
+        self.level = level
+        self.data = data
+        self.timestamp = time.time()
+
+    def message(self) -> str:
+        """
+        Formats the event as the console line shown to operators.
+        """
+        return self._TEMPLATES[self.kind].format(**self.data)
+
+    def __str__(self) -> str:
+        return self.message()
+
+
+class EventSink:
+    """
+    Base class for event destinations. Subclasses implement _write.
+    """
+
+    def __init__(self, level: EventLevel = EventLevel.DEBUG):
+        """
+        :param level: Minimum EventLevel this sink accepts.
+        """
+        self.level = level
+
+    def enabled_for(self, level: EventLevel) -> bool:
+        """
+        Returns True if events of this level would be recorded.
+        Callers check this before building an event.
+        """
+        return level >= self.level
+
+    def emit(self, event: AllocationEvent) -> None:
+        """
+        Records an event if its level is enabled.
+        """
+        if event.level >= self.level:
+            self._write(event)
+
+    def flush(self) -> None:
+        """
+        Pushes out any buffered output.
+        """
+
+    def close(self) -> None:
+        """
+        Flushes and releases any resources held by the sink.
+        """
+        self.flush()
+
+    def _write(self, event: AllocationEvent) -> None:
+        raise NotImplementedError
+
+
+class NullSink(EventSink):
+    """
+    Discards every event; enabled_for is always False so nothing is built.
+    """
+
+    def enabled_for(self, level: EventLevel) -> bool:
+        return False
+
+    def _write(self, event: AllocationEvent) -> None:
+        pass
+
+
+class StreamSink(EventSink):
+    """
+    Writes event messages to a text stream, optionally buffering lines so that
+    many events cost one write call.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, level: EventLevel = EventLevel.DEBUG, buffer_size: int = 0):
+        """
+        :param stream: Target stream. Defaults to whatever sys.stdout is at write time.
+        :param level: Minimum EventLevel to write.
+        :param buffer_size: Number of lines to hold before writing; 0 writes immediately.
+        """
+        super().__init__(level)
+        self._stream = stream
+        self.buffer_size = buffer_size
+        self._buffer: List[str] = []
+
+    def _write(self, event: AllocationEvent) -> None:
+        self._buffer.append(event.message())
+        if len(self._buffer) > self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            stream = self._stream or sys.stdout
+            stream.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+
+
+class FileSink(StreamSink):
+    """
+    Appends event messages to a log file with line buffering.
+    """
+
+    def __init__(self, filename: str, level: EventLevel = EventLevel.DEBUG, buffer_size: int = 1000):
+        """
+        :param filename: Path of the log file to append to.
+        :param level: Minimum EventLevel to write.
+        :param buffer_size: Number of lines to hold before writing.
+        """
+        super().__init__(open(filename, 'a', encoding='utf-8'), level, buffer_size)
+
+    def close(self) -> None:
+        self.flush()
+        self._stream.close()
+
+
+class RingBufferSink(EventSink):
+    """
+    Keeps the most recent events in memory without formatting them.
+    """
+
+    def __init__(self, capacity: int = 10000, level: EventLevel = EventLevel.DEBUG):
+        """
+        :param capacity: Number of events to retain.
+        :param level: Minimum EventLevel to keep.
+        """
+        super().__init__(level)
+        self.events = deque(maxlen=capacity)
+
+    def _write(self, event: AllocationEvent) -> None:
+        self.events.append(event)
+
+    def messages(self) -> List[str]:
+        """
+        Returns the retained events formatted as console lines, oldest first.
+        """
+        return [event.message() for event in self.events]
+
+
+class ThreadedSink(EventSink):
+    """
+    Hands events to another sink on a background thread, so slow output
+    (a console or network file system) never blocks the allocator.
+    """
+
+    _STOP = object()
+
+    def __init__(self, inner: EventSink):
+        """
+        :param inner: Sink that does the actual writing; its level is used for filtering.
+        """
+        super().__init__(inner.level)
+        self._inner = inner
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, name="event-sink", daemon=True)
+        self._thread.start()
+
+    def enabled_for(self, level: EventLevel) -> bool:
+        return self._inner.enabled_for(level)
+
+    def _write(self, event: AllocationEvent) -> None:
+        self._queue.put(event)
+
+    def flush(self) -> None:
+        self._queue.join()
+        self._inner.flush()
+
+    def close(self) -> None:
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._inner.close()
+
+    def _drain(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                if event is self._STOP:
+                    return
+                self._inner.emit(event)
+                if self._queue.empty():
+                    self._inner.flush()
+            finally:
+                self._queue.task_done()
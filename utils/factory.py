@@ -1,9 +1,12 @@
 # utils/factory.py
 
+import threading
+from datetime import datetime
+
 from models.incident import Incident
 from models.resource import Resource
 from models.enums import PriorityLevel, ResourceType
-from typing import List
+from typing import List, Mapping, Optional, Union
 
 
 class IncidentFactory:
@@ -13,6 +16,7 @@ class IncidentFactory:
     """
 
     _incident_counter = 1  # Internal counter to auto-generate unique incident IDs
+    _lock = threading.Lock()  # Guards the counter so concurrent callers never share an ID
 
     @classmethod
     def create_incident(
@@ -20,7 +24,8 @@ class IncidentFactory:
         location: str,
         emergency_type: str,
         priority_str: str,
-        required_resource_names: List[str]
+        required_resource_names: Union[List[str], Mapping[str, int]],
+        timestamp: Optional[datetime] = None
     ) -> Incident:
         """
         Creates and returns a new Incident object.
@@ -28,21 +33,35 @@ class IncidentFactory:
         :param location: Location of the incident (e.g., 'Zone 3').
         :param emergency_type: Description of the emergency (e.g., 'Accident').
         :param priority_str: Priority as a string (e.g., 'High').
-        :param required_resource_names: List of resource type strings.
+        :param required_resource_names: Resource type strings, one per unit, or a
+                                        mapping of type string to unit count.
+        :param timestamp: Report time; defaults to now.
         :return: Incident object.
         """
         priority = PriorityLevel[priority_str.upper()]
-        incident_id = cls._incident_counter
-        cls._incident_counter += 1
+        with cls._lock:
+            incident_id = cls._incident_counter
+            cls._incident_counter += 1
 
         return Incident(
             incident_id=incident_id,
             location=location,
             emergency_type=emergency_type,
             priority=priority,
-            required_resources=required_resource_names
+            required_resources=required_resource_names,
+            timestamp=timestamp
         )
 
+    @classmethod
+    def skip_past(cls, incident_id: int) -> None:
+        """
+        Ensures future incident IDs are greater than an existing one (e.g., after a restore).
+
+        :param incident_id: Highest incident ID already in use.
+        """
+        with cls._lock:
+            cls._incident_counter = max(cls._incident_counter, incident_id + 1)
+
 
 class ResourceFactory:
     """
@@ -51,6 +70,7 @@ class ResourceFactory:
     """
 
     _resource_counter = 1  # Internal counter to auto-generate unique resource IDs
+    _lock = threading.Lock()  # Guards the counter so concurrent callers never share an ID
 
     @classmethod
     def create_resource(cls, resource_type_str: str, location: str) -> Resource:
@@ -62,11 +82,22 @@ class ResourceFactory:
         :return: Resource object.
         """
         resource_type_enum = ResourceType(resource_type_str.title())
-        resource_id = cls._resource_counter
-        cls._resource_counter += 1
+        with cls._lock:
+            resource_id = cls._resource_counter
+            cls._resource_counter += 1
 
         return Resource(
             resource_id=resource_id,
             resource_type=resource_type_enum,
             location=location
         )
+
+    @classmethod
+    def skip_past(cls, resource_id: int) -> None:
+        """
+        Ensures future resource IDs are greater than an existing one (e.g., after a restore).
+
+        :param resource_id: Highest resource ID already in use.
+        """
+        with cls._lock:
+            cls._resource_counter = max(cls._resource_counter, resource_id + 1)
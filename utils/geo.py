@@ -0,0 +1,97 @@
+# utils/geo.py
+
+import json
+import math
+from typing import Dict, Optional, Tuple
+
+from utils.zones import ZONES, ZoneRegistry
+
+Point = Tuple[float, float]
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def euclidean(a: Point, b: Point) -> float:
+    """
+    Straight-line distance between two planar points.
+    """
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def project_latlon(lat: float, lon: float, origin: Point) -> Point:
+    """
+    Projects a latitude/longitude pair to planar kilometres east and north of an
+    origin (equirectangular). Accurate to well under 1% across a metro area, which
+    lets lat/lon positions share the planar spatial index.
+
+    :param lat: Latitude in degrees.
+    :param lon: Longitude in degrees.
+    :param origin: (lat, lon) of the projection origin, e.g. the city centre.
+    :return: (x, y) in kilometres.
+    """
+    origin_lat, origin_lon = origin
+    x = math.radians(lon - origin_lon) * math.cos(math.radians(origin_lat)) * EARTH_RADIUS_KM
+    y = math.radians(lat - origin_lat) * EARTH_RADIUS_KM
+    return x, y
+
+
+class ZoneCentroids:
+    """
+    Maps zones to the planar point that stands in for any incident or unit that
+    only has a zone string. Unless a centroid is set, "Zone N" sits at (N, 0), so
+    distances between zone-only positions equal the zone number difference used by
+    the ZoneRegistry. Unparseable locations have no position.
+    """
+
+    def __init__(self, zones: ZoneRegistry = ZONES):
+        """
+        :param zones: Registry used to intern zone names into ids.
+        """
+        self._zones = zones
+        self._centroids: Dict[int, Point] = {}  # zone id -> explicitly set centroid
+
+    @classmethod
+    def from_file(cls, filename: str, zones: ZoneRegistry = ZONES) -> "ZoneCentroids":
+        """
+        Loads centroids from a JSON file of the form {"Zone 1": [x, y], ...}.
+
+        :param filename: Path to the JSON centroid file.
+        :param zones: Registry used to intern zone names into ids.
+        :return: ZoneCentroids with all centroids set.
+        """
+        centroids = cls(zones)
+        with open(filename, 'r') as f:
+            raw = json.load(f)
+        for location, (x, y) in raw.items():
+            centroids.set_centroid(location, (float(x), float(y)))
+        return centroids
+
+    def set_centroid(self, location: str, point: Point) -> None:
+        """
+        Places a zone's centroid, e.g. at the projected centre of its district.
+
+        :param location: Location string naming the zone (e.g., 'Zone 3').
+        :param point: Planar (x, y) position.
+        """
+        self._centroids[self._zones.intern(location)] = point
+
+    def centroid(self, zone_id: int) -> Optional[Point]:
+        """
+        Returns the centroid of a zone id, or None for the unknown zone.
+        """
+        point = self._centroids.get(zone_id)
+        if point is None:
+            number = self._zones.number(zone_id)
+            if number is not None:
+                point = (float(number), 0.0)
+        return point
+
+    def position(self, item) -> Optional[Point]:
+        """
+        Returns where an incident or resource is: its own coordinates if it has
+        them, otherwise its zone's centroid.
+        """
+        return item.coordinates if item.coordinates is not None else self.centroid(item.zone_id)
+
+
+CENTROIDS = ZoneCentroids()  # Shared centroids for the shared ZoneRegistry
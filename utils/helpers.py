@@ -1,25 +1,21 @@
 # utils/helpers.py
 
-import re
+from utils.zones import ZONES, parse_zone_number
 
 
 def calculate_zone_distance(zone1: str, zone2: str) -> int:
     """
     Calculates the simulated distance between two zones.
 
-    Assumes zones are formatted like 'Zone 1', 'Zone 2', etc.
+    Assumes zones are formatted like 'Zone 1', 'Zone 2', etc. Locations are
+    interned through the shared ZoneRegistry, so each string is parsed once
+    and later calls are a table lookup.
 
     :param zone1: The first location string.
     :param zone2: The second location string.
-    :return: Integer distance (e.g., abs(1 - 3) = 2).
+    :return: Integer distance (e.g., abs(1 - 3) = 2), or 99 if parsing fails.
     """
-    try:
-        z1 = int(_extract_zone_number(zone1))
-        z2 = int(_extract_zone_number(zone2))
-        return abs(z1 - z2)
-    except Exception:
-        # Fallback if parsing fails: treat as far apart
-        return 99
+    return ZONES.distance(ZONES.intern(zone1), ZONES.intern(zone2))
 
 
 def _extract_zone_number(zone: str) -> int:
@@ -29,8 +25,7 @@ def _extract_zone_number(zone: str) -> int:
     :param zone: String like 'Zone 4'.
     :return: Integer zone number (e.g., 4).
     """
-    match = re.search(r'\d+', zone)
-    if match:
-        return int(match.group())
+    number = parse_zone_number(zone)
+    if number is not None:
+        return number
     raise ValueError(f"Invalid zone format: {zone}")
-
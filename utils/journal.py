@@ -0,0 +1,286 @@
+# utils/journal.py
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from models.incident import Incident
+from models.resource import Resource
+from utils.binary_snapshot import BinarySnapshot, LazyIncidentHistory, save_binary_snapshot
+from utils.persistence import (
+    _dict_to_incident, _dict_to_resource, _incident_to_dict, _resource_to_dict
+)
+
+
+class Journal:
+    """
+    Append-only JSON Lines journal of state changes, with snapshot compaction.
+
+    Every change (incident added, resource added, allocation, release, status
+    change) is appended as one record, so the cost of persisting is proportional
+    to the change rather than the dataset. Every `compact_every` records the full
+    state is written to a snapshot and the journal is truncated. On startup the
+    latest snapshot is loaded and newer journal records are replayed on top.
+
+    Records carry increasing sequence numbers and the snapshot stores the last one
+    it covers, so a crash between writing a snapshot and truncating the journal
+    never applies a record twice.
+
+    With `binary=True` snapshots use the memory-mapped format from
+    utils.binary_snapshot: loading decodes resources and active incidents, and
+    leaves resolved incidents in `history` to be decoded on access.
+    """
+
+    SNAPSHOT_FILE = "snapshot.json"
+    BINARY_SNAPSHOT_FILE = "snapshot.bin"
+    JOURNAL_FILE = "journal.jsonl"
+
+    def __init__(self, directory: str, compact_every: int = 10000, fsync: bool = False, binary: bool = False):
+        """
+        :param directory: Directory holding the snapshot and journal files.
+        :param compact_every: Number of records after which compaction is due.
+        :param fsync: If True, fsync after every record for durability against power loss.
+        :param binary: If True, write and read binary snapshots instead of JSON.
+        """
+        self.directory = directory
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.binary = binary
+        self.snapshot_path = os.path.join(directory, self.BINARY_SNAPSHOT_FILE if binary else self.SNAPSHOT_FILE)
+        self._json_snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)  # Readable in either mode
+        self.journal_path = os.path.join(directory, self.JOURNAL_FILE)
+        self.seq = 0
+        self.history: Optional[LazyIncidentHistory] = None  # Resolved incidents left undecoded by load()
+        self._records_since_snapshot = 0
+        self._file = None
+
+    def exists(self) -> bool:
+        """
+        Returns True if there is saved state to restore.
+        """
+        return any(os.path.exists(path) for path in (self.snapshot_path, self._json_snapshot_path, self.journal_path))
+
+    def load(self) -> Tuple[List[Incident], List[Resource]]:
+        """
+        Restores state from the latest snapshot plus any newer journal records.
+        Allocation links between incidents and resources are restored too.
+
+        For binary snapshots, resolved incidents without units are not returned but
+        kept in `history`; any that a newer record touches are decoded and returned.
+
+        :return: (incidents, resources) in their original order.
+        """
+        incidents: Dict[int, Incident] = {}
+        resources: Dict[int, Resource] = {}
+        snapshot_seq = 0
+        self.history = None
+
+        if self.binary and os.path.exists(self.snapshot_path):
+            snapshot = BinarySnapshot(self.snapshot_path)
+            snapshot_seq = snapshot.seq
+            for resource in snapshot.resources():
+                resources[resource.resource_id] = resource
+            active, self.history = snapshot.split_incidents(resources)
+            for incident in active:
+                incidents[incident.incident_id] = incident
+        elif os.path.exists(self._json_snapshot_path):
+            with open(self._json_snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+            snapshot_seq = snapshot.get('seq', 0)
+            for data in snapshot.get('resources', []):
+                resources[data['resource_id']] = _dict_to_resource(data)
+            for data in snapshot.get('incidents', []):
+                incident = _dict_to_incident(data)
+                incident.allocated_resources = [
+                    resources[rid] for rid in data.get('allocated_resources', []) if rid in resources
+                ]
+                incidents[incident.incident_id] = incident
+
+        self.seq = snapshot_seq
+        self._records_since_snapshot = 0
+        if os.path.exists(self.journal_path):
+            valid_length = 0
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line) if line.endswith("\n") else None
+                    except ValueError:
+                        record = None
+                    if record is None:
+                        break  # Torn final line from a crash mid-write
+                    valid_length += len(line)  # Records are ASCII, so characters == bytes
+                    if record['seq'] <= snapshot_seq:
+                        continue
+                    if self.history is not None and record.get('incident_id') not in incidents:
+                        incident = self.history.pop_by_id(record.get('incident_id'))
+                        if incident is not None:
+                            incidents[incident.incident_id] = incident
+                    _apply(record, incidents, resources)
+                    self.seq = record['seq']
+                    self._records_since_snapshot += 1
+            # Drop a torn tail so new records are not appended after garbage
+            if valid_length < os.path.getsize(self.journal_path):
+                os.truncate(self.journal_path, valid_length)
+
+        return list(incidents.values()), list(resources.values())
+
+    def record_incident(self, incident: Incident) -> None:
+        """
+        Records that an incident was added.
+        """
+        self.append('incident_added', incident=_incident_to_dict(incident))
+
+    def record_resource(self, resource: Resource) -> None:
+        """
+        Records that a resource was added.
+        """
+        self.append('resource_added', resource=_resource_to_dict(resource))
+
+    def record_allocation(self, incident: Incident, resource: Resource) -> None:
+        """
+        Records that a resource was allocated to an incident (moving it from any previous holder).
+        """
+        self.append('allocated', incident_id=incident.incident_id, resource_id=resource.resource_id)
+
+    def record_release(self, resource: Resource) -> None:
+        """
+        Records that a resource was released back to the available pool.
+        """
+        self.append('released', resource_id=resource.resource_id)
+
+    def record_lend(self, resource: Resource) -> None:
+        """
+        Records that a resource was lent to an incident managed elsewhere.
+        """
+        self.append('lent', resource_id=resource.resource_id, incident_id=resource.assigned_to_incident)
+
+    def record_move(self, resource: Resource) -> None:
+        """
+        Records a resource's new location and coordinates.
+        """
+        self.append('moved', resource_id=resource.resource_id, location=resource.location,
+                    coordinates=resource.coordinates)
+
+    def record_status(self, incident: Incident) -> None:
+        """
+        Records an incident's new status.
+        """
+        self.append('status', incident_id=incident.incident_id, status=incident.status)
+
+    def append(self, op: str, **fields) -> None:
+        """
+        Appends one state-change record.
+
+        :param op: Record type ('incident_added', 'resource_added', 'allocated', 'released',
+                   'lent', 'moved', 'status').
+        :param fields: Record payload.
+        """
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.journal_path, 'a')
+        self.seq += 1
+        fields['seq'] = self.seq
+        fields['op'] = op
+        self._file.write(json.dumps(fields) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._records_since_snapshot += 1
+
+    @property
+    def compaction_due(self) -> bool:
+        """
+        True once enough records have accumulated since the last snapshot.
+        """
+        return self._records_since_snapshot >= self.compact_every
+
+    def compact(
+        self,
+        incidents: List[Incident],
+        resources: List[Resource],
+        history: Optional[LazyIncidentHistory] = None
+    ) -> None:
+        """
+        Writes a snapshot of the full state and truncates the journal.
+
+        :param incidents: All incidents not in `history`.
+        :param resources: All resources.
+        :param history: Lazy resolved history still held outside `incidents`, if any.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        if self.binary:
+            save_binary_snapshot(self.snapshot_path, incidents, resources, history, seq=self.seq)
+        else:
+            if history is not None:
+                incidents = list(history) + list(incidents)
+            temp_path = self.snapshot_path + ".tmp"
+            with open(temp_path, 'w') as f:
+                json.dump({
+                    'seq': self.seq,
+                    'incidents': [_incident_to_dict(i) for i in incidents],
+                    'resources': [_resource_to_dict(r) for r in resources],
+                }, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.journal_path, 'w')
+        self._records_since_snapshot = 0
+
+    def close(self) -> None:
+        """
+        Closes the journal file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _apply(record: dict, incidents: Dict[int, Incident], resources: Dict[int, Resource]) -> None:
+    """
+    Applies one journal record to the state being rebuilt. Records set state rather
+    than increment it, so applying one again is harmless.
+    """
+    op = record['op']
+    if op == 'incident_added':
+        incident = _dict_to_incident(record['incident'])
+        incidents[incident.incident_id] = incident
+    elif op == 'resource_added':
+        resource = _dict_to_resource(record['resource'])
+        resources[resource.resource_id] = resource
+    elif op == 'allocated':
+        resource = resources.get(record['resource_id'])
+        incident = incidents.get(record['incident_id'])
+        if resource is None or incident is None:
+            return
+        _detach(resource, incidents)
+        resource.assign_to_incident(incident.incident_id)
+        incident.allocated_resources.append(resource)
+    elif op == 'released':
+        resource = resources.get(record['resource_id'])
+        if resource is not None:
+            _detach(resource, incidents)
+            resource.release()
+    elif op == 'lent':
+        resource = resources.get(record['resource_id'])
+        if resource is not None:
+            _detach(resource, incidents)
+            resource.assign_to_incident(record['incident_id'])
+    elif op == 'moved':
+        resource = resources.get(record['resource_id'])
+        if resource is not None:
+            resource.location = record['location']
+            coordinates = record.get('coordinates')
+            resource.coordinates = tuple(coordinates) if coordinates is not None else None
+    elif op == 'status':
+        incident = incidents.get(record['incident_id'])
+        if incident is not None:
+            incident.status = record['status']
+
+
+def _detach(resource: Resource, incidents: Dict[int, Incident]) -> None:
+    holder: Optional[Incident] = incidents.get(resource.assigned_to_incident)
+    if holder is not None and resource in holder.allocated_resources:
+        holder.allocated_resources.remove(resource)
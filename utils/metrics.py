@@ -0,0 +1,182 @@
+# utils/metrics.py
+
+import functools
+import os
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Optional, Sequence
+
+# Upper bounds (seconds) of the call latency histogram buckets
+LATENCY_BUCKETS = (
+    1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0
+)
+# Upper bounds of the candidates-scanned-per-search histogram buckets
+CANDIDATE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with a running count and sum, in the Prometheus style.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        :param bounds: Increasing upper bounds; values above the last one go to +Inf.
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> dict:
+        """
+        :return: {'count', 'sum', 'buckets': [[upper bound, cumulative count], ...]}
+                 with the +Inf bucket last (as the string '+Inf').
+        """
+        buckets = []
+        running = 0
+        for bound, n in zip(self.bounds + ("+Inf",), self.counts):
+            running += n
+            buckets.append([bound, running])
+        return {'count': self.count, 'sum': self.sum, 'buckets': buckets}
+
+
+class Metrics:
+    """
+    Registry of call timings and search statistics for the allocator. Gauges such
+    as queue depths are read from the manager when a snapshot is taken.
+
+    Nothing here is wired into the code paths by default: a ResourceManager created
+    with a Metrics instance wraps its own hot methods and distance provider per
+    instance. Without one, the instrumented code runs unchanged.
+    """
+
+    def __init__(self):
+        self.timers: Dict[str, Histogram] = {}
+        self.candidates = Histogram(CANDIDATE_BUCKETS)
+
+    def record_call(self, name: str, seconds: float) -> None:
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = Histogram(LATENCY_BUCKETS)
+        timer.observe(seconds)
+
+    def record_candidates(self, scanned: int) -> None:
+        self.candidates.observe(scanned)
+
+    def timed(self, name: str, func: Callable) -> Callable:
+        """
+        Wraps a callable so every call's duration is recorded under `name`.
+        """
+        clock = time.perf_counter
+        record = self.record_call
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, clock() - start)
+        return wrapper
+
+    def snapshot(self, gauges: Optional[dict] = None) -> dict:
+        """
+        Returns the current values as plain data.
+
+        :param gauges: Point-in-time values to include: name -> number, or for a labelled
+                       gauge name -> {'label': label name, 'values': {label value: number}}.
+        :return: {'calls': {name: histogram}, 'candidates_scanned': histogram, 'gauges': {...}}
+        """
+        return {
+            'calls': {name: timer.to_dict() for name, timer in sorted(self.timers.items())},
+            'candidates_scanned': self.candidates.to_dict(),
+            'gauges': gauges or {},
+        }
+
+
+class TimedDistances:
+    """
+    Distance provider wrapper that records the duration of every distance, row and
+    nearest-zones lookup. Other attributes (e.g. set_edge) go to the wrapped provider.
+    """
+
+    def __init__(self, provider, metrics: Metrics):
+        """
+        :param provider: ZoneRegistry or GraphDistanceProvider to wrap.
+        :param metrics: Registry to record into.
+        """
+        self.provider = provider
+        self.distance = metrics.timed("distance", provider.distance)
+        self.row = metrics.timed("distance_row", provider.row)
+        self.zones_by_distance = metrics.timed("zones_by_distance", provider.zones_by_distance)
+
+    def __len__(self) -> int:
+        return len(self.provider)
+
+    def __getattr__(self, name: str):
+        return getattr(self.provider, name)
+
+
+# ------------------------ Prometheus export ------------------------
+
+def to_prometheus(snapshot: dict, prefix: str = "era") -> str:
+    """
+    Renders a Metrics snapshot in the Prometheus text exposition format.
+
+    :param snapshot: Result of Metrics.snapshot (or ResourceManager.metrics).
+    :param prefix: Metric name prefix.
+    """
+    lines = [
+        f"# HELP {prefix}_call_seconds Duration of instrumented calls.",
+        f"# TYPE {prefix}_call_seconds histogram",
+    ]
+    for name, histogram in snapshot['calls'].items():
+        lines.extend(_histogram_lines(f"{prefix}_call_seconds", histogram, f'function="{name}"'))
+
+    lines.append(f"# HELP {prefix}_search_candidates Zones or buckets examined per nearest-unit search.")
+    lines.append(f"# TYPE {prefix}_search_candidates histogram")
+    lines.extend(_histogram_lines(f"{prefix}_search_candidates", snapshot['candidates_scanned'], ""))
+
+    for name, value in sorted(snapshot['gauges'].items()):
+        lines.append(f"# TYPE {prefix}_{name} gauge")
+        if isinstance(value, dict):
+            for key, number in sorted(value['values'].items()):
+                lines.append(f'{prefix}_{name}{{{value["label"]}="{_escape(str(key))}"}} {number}')
+        else:
+            lines.append(f"{prefix}_{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(filename: str, snapshot: dict, prefix: str = "era") -> None:
+    """
+    Writes a snapshot for the Prometheus node exporter's textfile collector.
+    The file is replaced atomically so a scrape never sees a partial write.
+    """
+    tmp = filename + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(to_prometheus(snapshot, prefix))
+    os.replace(tmp, filename)
+
+
+def _histogram_lines(metric: str, histogram: dict, labels: str) -> list:
+    sep = "," if labels else ""
+    lines = []
+    for bound, cumulative in histogram['buckets']:
+        le = bound if bound == "+Inf" else repr(float(bound))
+        lines.append(f'{metric}_bucket{{{labels}{sep}le="{le}"}} {cumulative}')
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{metric}_sum{suffix} {histogram['sum']}")
+    lines.append(f"{metric}_count{suffix} {histogram['count']}")
+    return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -44,7 +44,7 @@ def load_data(filename: str, data_type: str) -> list:
 # ------------------------ Helpers ------------------------
 
 def _incident_to_dict(incident: Incident) -> dict:
-    return {
+    data = {
         'incident_id': incident.incident_id,
         'location': incident.location,
         'emergency_type': incident.emergency_type,
@@ -54,16 +54,22 @@ def _incident_to_dict(incident: Incident) -> dict:
         'status': incident.status,
         'timestamp': incident.timestamp.isoformat()
     }
+    if incident.coordinates is not None:
+        data['coordinates'] = list(incident.coordinates)
+    return data
 
 
 def _resource_to_dict(resource: Resource) -> dict:
-    return {
+    data = {
         'resource_id': resource.resource_id,
         'resource_type': resource.resource_type.value,
         'location': resource.location,
         'is_available': resource.is_available,
         'assigned_to_incident': resource.assigned_to_incident
     }
+    if resource.coordinates is not None:
+        data['coordinates'] = list(resource.coordinates)
+    return data
 
 
 def _dict_to_incident(data: dict) -> Incident:
@@ -75,7 +81,8 @@ def _dict_to_incident(data: dict) -> Incident:
         location=data['location'],
         emergency_type=data['emergency_type'],
         priority=PriorityLevel[data['priority']],
-        required_resources=data['required_resources']
+        required_resources=data['required_resources'],
+        coordinates=_coordinates(data)
     )
     incident.status = data['status']
     incident.timestamp = datetime.fromisoformat(data.get('timestamp', datetime.now().isoformat()))
@@ -87,8 +94,13 @@ def _dict_to_resource(data: dict) -> Resource:
         resource_id=data['resource_id'],
         resource_type=ResourceType(data['resource_type']),
         location=data['location'],
-        is_available=data['is_available']
+        is_available=data['is_available'],
+        coordinates=_coordinates(data)
     )
     resource.assigned_to_incident = data['assigned_to_incident']
     return resource
 
+
+def _coordinates(data: dict):
+    coordinates = data.get('coordinates')
+    return tuple(coordinates) if coordinates is not None else None
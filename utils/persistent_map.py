@@ -0,0 +1,100 @@
+# utils/persistent_map.py
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_BITS = 5
+_WIDTH = 1 << _BITS  # Children per trie node
+_MASK = _WIDTH - 1
+_LEAF_SIZE = 16  # Buckets larger than this are split into a child node
+_MAX_DEPTH = 13  # 13 * 5 bits cover a 64-bit hash; deeper buckets just grow
+
+
+class PersistentMap(Mapping):
+    """
+    Immutable mapping that shares structure with the map it was derived from.
+
+    Entries live in a hash trie of 32-way nodes with small dict buckets at the
+    leaves. `updated` copies only the nodes on the paths to the changed keys, so
+    deriving a new version costs O(changes * log n) instead of a full copy, and
+    every earlier version stays valid for readers still holding it.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: Optional[Dict] = None):
+        """
+        :param items: Optional initial entries.
+        """
+        self._root: Optional[tuple] = None
+        self._size = 0
+        if items:
+            self._root, self._size = _assoc(None, [(hash(k), k, v) for k, v in items.items()], 0)
+
+    def updated(self, changes: Dict) -> "PersistentMap":
+        """
+        Returns a new map with the changed entries set; this map is left unchanged.
+
+        :param changes: Key -> new value.
+        """
+        if not changes:
+            return self
+        result = PersistentMap()
+        result._root, added = _assoc(self._root, [(hash(k), k, v) for k, v in changes.items()], 0)
+        result._size = self._size + added
+        return result
+
+    def __getitem__(self, key):
+        h = hash(key)
+        node = self._root
+        depth = 0
+        while node is not None:
+            child = node[(h >> (depth * _BITS)) & _MASK]
+            if isinstance(child, dict):
+                return child[key]
+            node = child
+            depth += 1
+        raise KeyError(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator:
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            for child in stack.pop():
+                if isinstance(child, dict):
+                    yield from child
+                elif child is not None:
+                    stack.append(child)
+
+
+def _assoc(node: Optional[tuple], items: List[Tuple[int, object, object]], depth: int) -> Tuple[tuple, int]:
+    """
+    Path-copies a node with a batch of (hash, key, value) entries set.
+
+    :return: (new node, number of keys that were not present before)
+    """
+    children = list(node) if node is not None else [None] * _WIDTH
+    groups: Dict[int, List[Tuple[int, object, object]]] = {}
+    shift = depth * _BITS
+    for item in items:
+        groups.setdefault((item[0] >> shift) & _MASK, []).append(item)
+
+    added = 0
+    for index, group in groups.items():
+        child = children[index]
+        if child is None or isinstance(child, dict):
+            bucket = dict(child) if child else {}
+            before = len(bucket)
+            for _, key, value in group:
+                bucket[key] = value
+            added += len(bucket) - before
+            if len(bucket) > _LEAF_SIZE and depth + 1 < _MAX_DEPTH:
+                children[index], _ = _assoc(None, [(hash(k), k, v) for k, v in bucket.items()], depth + 1)
+            else:
+                children[index] = bucket
+        else:
+            children[index], child_added = _assoc(child, group, depth + 1)
+            added += child_added
+    return tuple(children), added
@@ -0,0 +1,293 @@
+# utils/sqlite_store.py
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.enums import PriorityLevel, ResourceType
+from models.incident import Incident
+from models.resource import Resource
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    incident_id INTEGER PRIMARY KEY,
+    location TEXT NOT NULL COLLATE NOCASE,
+    emergency_type TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    required_resources TEXT NOT NULL,
+    status TEXT NOT NULL COLLATE NOCASE,
+    timestamp TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resources (
+    resource_id INTEGER PRIMARY KEY,
+    resource_type TEXT NOT NULL,
+    location TEXT NOT NULL COLLATE NOCASE,
+    is_available INTEGER NOT NULL,
+    assigned_to_incident INTEGER
+);
+CREATE TABLE IF NOT EXISTS allocations (
+    resource_id INTEGER PRIMARY KEY,
+    incident_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS incidents_status ON incidents (status);
+CREATE INDEX IF NOT EXISTS incidents_location ON incidents (location);
+CREATE INDEX IF NOT EXISTS incidents_priority ON incidents (priority);
+CREATE INDEX IF NOT EXISTS resources_type ON resources (resource_type, is_available);
+CREATE INDEX IF NOT EXISTS resources_location ON resources (location);
+CREATE INDEX IF NOT EXISTS allocations_incident ON allocations (incident_id);
+"""
+
+_UPSERT_INCIDENT = """
+INSERT INTO incidents (incident_id, location, emergency_type, priority, required_resources, status, timestamp)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (incident_id) DO UPDATE SET
+    location = excluded.location, emergency_type = excluded.emergency_type, priority = excluded.priority,
+    required_resources = excluded.required_resources, status = excluded.status, timestamp = excluded.timestamp
+"""
+
+_UPSERT_RESOURCE = """
+INSERT INTO resources (resource_id, resource_type, location, is_available, assigned_to_incident)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (resource_id) DO UPDATE SET
+    resource_type = excluded.resource_type, location = excluded.location,
+    is_available = excluded.is_available, assigned_to_incident = excluded.assigned_to_incident
+"""
+
+
+class SQLiteStore:
+    """
+    SQLite storage backend for incidents, resources and the allocation links between them.
+
+    Unlike the JSON files, the store keeps which resources are allocated to which
+    incident, and can be updated incrementally: objects registered with `watch`
+    are marked dirty by their listeners whenever they change, and `flush` upserts
+    only those rows in one transaction. A ResourceManager given the store flushes
+    it at the end of every operation, so the database never lags behind by more
+    than the operation in progress. Dashboard filters and counts run as
+    indexed SQL queries, so reports never need the history loaded into Python.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Opens (and creates, if needed) a store.
+
+        :param path: Database file path, or ':memory:' for a private in-memory database.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._dirty_incidents: Dict[int, Incident] = {}
+        self._dirty_resources: Dict[int, Resource] = {}
+
+    def watch(self, item) -> None:
+        """
+        Marks an Incident or Resource dirty now and whenever it changes from here on.
+        """
+        if isinstance(item, Incident):
+            item.add_listener(self._on_incident_changed)
+        else:
+            item.add_listener(self._on_resource_changed)
+        self.mark_dirty(item)
+
+    def mark_dirty(self, item) -> None:
+        """
+        Queues an Incident or Resource to be written by the next flush.
+        """
+        if isinstance(item, Incident):
+            self._dirty_incidents[item.incident_id] = item
+        else:
+            self._dirty_resources[item.resource_id] = item
+
+    def _on_incident_changed(self, incident: Incident, old_status: str) -> None:
+        self._dirty_incidents[incident.incident_id] = incident
+
+    def _on_resource_changed(self, resource: Resource) -> None:
+        self._dirty_resources[resource.resource_id] = resource
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of dirty rows waiting for a flush.
+        """
+        return len(self._dirty_incidents) + len(self._dirty_resources)
+
+    def flush(self) -> None:
+        """
+        Upserts every dirty incident and resource in a single transaction.
+        A resource's allocation link follows the incident it is assigned to.
+        """
+        if not self.pending:
+            return
+        with self._conn:
+            self._conn.executemany(_UPSERT_INCIDENT, [
+                _incident_row(incident) for incident in self._dirty_incidents.values()
+            ])
+            self._conn.executemany(_UPSERT_RESOURCE, [
+                _resource_row(resource) for resource in self._dirty_resources.values()
+            ])
+            self._conn.executemany(
+                "DELETE FROM allocations WHERE resource_id = ?",
+                [(rid,) for rid in self._dirty_resources]
+            )
+            self._conn.executemany("INSERT INTO allocations (resource_id, incident_id) VALUES (?, ?)", [
+                (resource.resource_id, resource.assigned_to_incident)
+                for resource in self._dirty_resources.values()
+                if resource.assigned_to_incident is not None
+            ])
+        self._dirty_incidents.clear()
+        self._dirty_resources.clear()
+
+    def save(self, incidents: Iterable[Incident], resources: Iterable[Resource]) -> None:
+        """
+        Writes incidents and resources in full, with allocation links taken from
+        each incident's allocated resources.
+
+        :param incidents: Incidents to write.
+        :param resources: Resources to write.
+        """
+        incidents = list(incidents)
+        with self._conn:
+            self._conn.executemany(_UPSERT_INCIDENT, [_incident_row(i) for i in incidents])
+            self._conn.executemany(_UPSERT_RESOURCE, [_resource_row(r) for r in resources])
+            self._conn.executemany("INSERT OR REPLACE INTO allocations (resource_id, incident_id) VALUES (?, ?)", [
+                (resource.resource_id, incident.incident_id)
+                for incident in incidents for resource in incident.allocated_resources
+            ])
+
+    def load(self) -> Tuple[List[Incident], List[Resource]]:
+        """
+        Loads every incident and resource, restoring allocation links.
+
+        :return: (incidents, resources), each ordered by ID.
+        """
+        self.flush()
+        resources = self.load_resources()
+        return self.load_incidents(resources_by_id={r.resource_id: r for r in resources}), resources
+
+    def load_resources(self) -> List[Resource]:
+        """
+        Loads every resource, ordered by ID.
+        """
+        rows = self._conn.execute(
+            "SELECT resource_id, resource_type, location, is_available, assigned_to_incident "
+            "FROM resources ORDER BY resource_id"
+        )
+        resources = []
+        for rid, resource_type, location, available, assigned in rows:
+            resource = Resource(rid, ResourceType(resource_type), location, bool(available))
+            resource.assigned_to_incident = assigned
+            resources.append(resource)
+        return resources
+
+    def load_incidents(
+        self,
+        status: Optional[str] = None,
+        zone: Optional[str] = None,
+        priority: Optional[str] = None,
+        resources_by_id: Optional[Dict[int, Resource]] = None
+    ) -> List[Incident]:
+        """
+        Loads incidents matching optional filters, using the indexes.
+
+        :param status: Status to match (case-insensitive).
+        :param zone: Location to match (case-insensitive).
+        :param priority: Priority name to match (case-insensitive).
+        :param resources_by_id: Optional lookup used to restore allocated resources.
+        :return: Matching incidents ordered by ID.
+        """
+        self.flush()
+        where, params = _where(status, zone, priority)
+        rows = self._conn.execute(
+            "SELECT incident_id, location, emergency_type, priority, required_resources, status, timestamp "
+            f"FROM incidents{where} ORDER BY incident_id", params
+        ).fetchall()
+        allocated: Dict[int, List[int]] = {}
+        if resources_by_id is not None:
+            for rid, iid in self._conn.execute("SELECT resource_id, incident_id FROM allocations ORDER BY resource_id"):
+                allocated.setdefault(iid, []).append(rid)
+
+        incidents = []
+        for iid, location, emergency_type, priority_value, required, status_value, timestamp in rows:
+            incident = Incident(iid, location, emergency_type, PriorityLevel(priority_value), json.loads(required))
+            incident.status = status_value
+            incident.timestamp = datetime.fromisoformat(timestamp)
+            if resources_by_id is not None:
+                incident.allocated_resources = [
+                    resources_by_id[rid] for rid in allocated.get(iid, ()) if rid in resources_by_id
+                ]
+            incidents.append(incident)
+        return incidents
+
+    def summary(
+        self,
+        status: Optional[str] = None,
+        zone: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> dict:
+        """
+        Computes dashboard counts in SQL, after flushing pending changes.
+
+        :param status: Status filter (case-insensitive).
+        :param zone: Location filter (case-insensitive).
+        :param priority: Priority name filter (case-insensitive).
+        :return: Dict with 'total', 'status', 'priority' and 'zone' incident counts
+                 and 'resources' / 'available' unit counts.
+        """
+        self.flush()
+        where, params = _where(status, zone, priority)
+
+        def grouped(column: str) -> Dict:
+            return dict(self._conn.execute(
+                f"SELECT {column}, COUNT(*) FROM incidents{where} GROUP BY {column}", params
+            ).fetchall())
+
+        status_count = grouped("status")
+        priority_count = {PriorityLevel(value).name: count for value, count in grouped("priority").items()}
+        resources, available = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(is_available), 0) FROM resources"
+        ).fetchone()
+        return {
+            'total': sum(status_count.values()),
+            'status': status_count,
+            'priority': priority_count,
+            'zone': grouped("location"),
+            'resources': resources,
+            'available': available,
+        }
+
+    def close(self) -> None:
+        """
+        Flushes pending changes and closes the database.
+        """
+        self.flush()
+        self._conn.close()
+
+
+def _where(status: Optional[str], zone: Optional[str], priority: Optional[str]) -> Tuple[str, list]:
+    clauses, params = [], []
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if zone:
+        clauses.append("location = ?")
+        params.append(zone)
+    if priority:
+        clauses.append("priority = ?")
+        level = PriorityLevel.__members__.get(priority.upper())
+        params.append(level.value if level else None)  # Unknown names match nothing
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _incident_row(incident: Incident) -> tuple:
+    return (
+        incident.incident_id, incident.location, incident.emergency_type, incident.priority.value,
+        json.dumps(incident.required_resources), incident.status, incident.timestamp.isoformat()
+    )
+
+
+def _resource_row(resource: Resource) -> tuple:
+    return (
+        resource.resource_id, resource.resource_type.value, resource.location,
+        1 if resource.is_available else 0, resource.assigned_to_incident
+    )
@@ -0,0 +1,147 @@
+# utils/travel_times.py
+
+import heapq
+import json
+import math
+from typing import Dict, List, Tuple
+
+from utils.zones import ZONES, ZoneRegistry
+
+UNREACHABLE = math.inf  # Travel time between zones with no connecting roads
+
+
+class GraphDistanceProvider:
+    """
+    Distance provider backed by a weighted, undirected zone adjacency graph.
+
+    Offers the same lookups as ZoneRegistry (distance, row, zones_by_distance),
+    so it can be passed to ResourceManager in place of the default linear model.
+    Shortest travel times from a zone are computed once with Dijkstra and cached
+    per source row. Changing an edge weight only drops the cached rows whose
+    shortest paths could be affected by that edge.
+    """
+
+    def __init__(self, zones: ZoneRegistry = ZONES):
+        """
+        Initializes an empty road graph.
+
+        :param zones: Registry used to intern zone names into ids.
+        """
+        self._zones = zones
+        self._edges: Dict[int, Dict[int, float]] = {}
+        self._rows: Dict[int, List[float]] = {}  # source zone id -> travel times by zone id
+        self._orders: Dict[int, List[Tuple[float, int]]] = {}
+
+    @classmethod
+    def from_file(cls, filename: str, zones: ZoneRegistry = ZONES) -> "GraphDistanceProvider":
+        """
+        Loads a road graph from a JSON file of the form
+        {"edges": [["Zone 1", "Zone 2", 4.5], ...]}.
+
+        :param filename: Path to the JSON graph file.
+        :param zones: Registry used to intern zone names into ids.
+        :return: GraphDistanceProvider with all edges loaded.
+        """
+        provider = cls(zones)
+        with open(filename, 'r') as f:
+            raw = json.load(f)
+        for zone_a, zone_b, weight in raw.get('edges', []):
+            provider._connect(zones.intern(zone_a), zones.intern(zone_b), float(weight))
+        return provider
+
+    def set_edge(self, zone_a: str, zone_b: str, weight: float) -> None:
+        """
+        Adds or re-weights a road between two zones, e.g. after congestion changes.
+        A weight of UNREACHABLE removes the road (road closure).
+
+        :param zone_a: First location string.
+        :param zone_b: Second location string.
+        :param weight: New travel time along the road.
+        """
+        a, b = self._zones.intern(zone_a), self._zones.intern(zone_b)
+        old = self._edges.get(a, {}).get(b, UNREACHABLE)
+        if weight == old:
+            return
+        self._invalidate_rows(a, b, old, weight)
+        if weight == UNREACHABLE:
+            self._edges[a].pop(b, None)
+            self._edges[b].pop(a, None)
+        else:
+            self._connect(a, b, weight)
+
+    def remove_edge(self, zone_a: str, zone_b: str) -> None:
+        """
+        Closes the road between two zones.
+        """
+        self.set_edge(zone_a, zone_b, UNREACHABLE)
+
+    def distance(self, zone_a: int, zone_b: int) -> float:
+        """
+        Returns the shortest travel time between two zone ids.
+        """
+        return self.row(zone_a)[zone_b]
+
+    def row(self, zone_id: int) -> List[float]:
+        """
+        Returns cached shortest travel times from a zone id, indexed by zone id.
+        """
+        row = self._rows.get(zone_id)
+        if row is None:
+            row = self._dijkstra(zone_id)
+            self._rows[zone_id] = row
+        elif len(row) < len(self._zones):
+            # Zones registered after this row was computed have no roads yet
+            row.extend([UNREACHABLE] * (len(self._zones) - len(row)))
+        return row
+
+    def zones_by_distance(self, zone_id: int) -> List[Tuple[float, int]]:
+        """
+        Returns (travel time, zone id) pairs for every zone, closest first.
+        """
+        order = self._orders.get(zone_id)
+        if order is None or len(order) < len(self._zones):
+            order = sorted((d, other) for other, d in enumerate(self.row(zone_id)))
+            self._orders[zone_id] = order
+        return order
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def _connect(self, a: int, b: int, weight: float) -> None:
+        self._edges.setdefault(a, {})[b] = weight
+        self._edges.setdefault(b, {})[a] = weight
+
+    def _dijkstra(self, source: int) -> List[float]:
+        dist = [UNREACHABLE] * len(self._zones)
+        dist[source] = 0
+        queue = [(0, source)]
+        while queue:
+            d, zone = heapq.heappop(queue)
+            if d > dist[zone]:
+                continue
+            for neighbor, weight in self._edges.get(zone, {}).items():
+                candidate = d + weight
+                if candidate < dist[neighbor]:
+                    dist[neighbor] = candidate
+                    heapq.heappush(queue, (candidate, neighbor))
+        return dist
+
+    def _invalidate_rows(self, a: int, b: int, old: float, new: float) -> None:
+        """
+        Drops cached rows whose shortest paths may change when edge (a, b) goes from old to new.
+
+        A cheaper edge matters to a source if it now offers a shorter route to either end.
+        A dearer or closed edge matters only if it lay on a current shortest path.
+        """
+        for source in list(self._rows):
+            row = self.row(source)
+            da, db = row[a], row[b]
+            if da == db == UNREACHABLE:
+                continue  # Neither end is reachable, so the edge cannot be used
+            if new < old:
+                affected = da + new < db or db + new < da
+            else:
+                affected = da + old == db or db + old == da
+            if affected:
+                del self._rows[source]
+                self._orders.pop(source, None)
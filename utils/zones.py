@@ -0,0 +1,122 @@
+# utils/zones.py
+
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+FALLBACK_DISTANCE = 99  # Distance used when a location cannot be parsed
+
+_ZONE_NUMBER = re.compile(r'\d+')
+
+
+def parse_zone_number(location: str) -> Optional[int]:
+    """
+    Parses the zone number from a location string, tolerating bad input.
+
+    :param location: String like 'Zone 4'.
+    :return: Integer zone number, or None if the location has no number.
+    """
+    match = _ZONE_NUMBER.search(location) if isinstance(location, str) else None
+    return int(match.group()) if match else None
+
+
+class ZoneRegistry:
+    """
+    Interns location strings into compact integer zone ids.
+
+    Each distinct location string is parsed once. Locations with the same zone
+    number share an id, and every unparseable location shares UNKNOWN_ZONE.
+    A distance matrix indexed by zone id is grown as zones are registered, so
+    distance lookups in the allocation loop are plain list indexing.
+
+    Registration is serialized with a lock, since models are created (and intern
+    their locations) on producer threads. Lookups take no lock: a new zone's row
+    and column are in place before its id is published.
+    """
+
+    UNKNOWN_ZONE = 0
+
+    def __init__(self):
+        """
+        Initializes the registry with only the unknown zone registered.
+        """
+        self._ids_by_location: Dict[str, int] = {}
+        self._ids_by_number: Dict[int, int] = {}
+        self._numbers: List[Optional[int]] = [None]  # zone id -> zone number
+        self._matrix: List[List[int]] = [[FALLBACK_DISTANCE]]
+        self._orders: Dict[int, List[Tuple[int, int]]] = {}  # zone id -> [(distance, zone id)]
+        self._lock = threading.Lock()  # Held while registering new locations
+
+    def intern(self, location: str) -> int:
+        """
+        Returns the zone id for a location string, registering it on first sight.
+
+        :param location: Location string (e.g., 'Zone 3').
+        :return: Compact integer zone id.
+        """
+        zone_id = self._ids_by_location.get(location)
+        if zone_id is None:
+            with self._lock:
+                zone_id = self._ids_by_location.get(location)  # Another thread may have won the race
+                if zone_id is None:
+                    number = parse_zone_number(location)
+                    zone_id = self.UNKNOWN_ZONE if number is None else self._register_number(number)
+                    self._ids_by_location[location] = zone_id
+        return zone_id
+
+    def distance(self, zone_a: int, zone_b: int) -> int:
+        """
+        Looks up the precomputed distance between two zone ids.
+        """
+        return self._matrix[zone_a][zone_b]
+
+    def row(self, zone_id: int) -> List[int]:
+        """
+        Returns the distance row for a zone id, indexed by the other zone's id.
+        """
+        return self._matrix[zone_id]
+
+    def zones_by_distance(self, zone_id: int) -> List[Tuple[int, int]]:
+        """
+        Returns (distance, zone id) pairs for every zone, closest first.
+        The ordering is computed once per zone and cached until a new zone appears.
+        """
+        order = self._orders.get(zone_id)
+        if order is None:
+            order = sorted((d, other) for other, d in enumerate(self._matrix[zone_id]))
+            self._orders[zone_id] = order
+        return order
+
+    def number(self, zone_id: int) -> Optional[int]:
+        """
+        Returns the zone number for an id, or None for the unknown zone.
+        """
+        return self._numbers[zone_id]
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def _register_number(self, number: int) -> int:
+        """
+        Registers a zone number; called with the lock held.
+        """
+        zone_id = self._ids_by_number.get(number)
+        if zone_id is not None:
+            return zone_id
+
+        zone_id = len(self._numbers)
+        new_row = [
+            FALLBACK_DISTANCE if other is None else abs(number - other)
+            for other in self._numbers + [number]
+        ]
+        for existing, row in zip(new_row, self._matrix):
+            row.append(existing)
+        self._matrix.append(new_row)
+        # The size (len) grows only once the matrix covers the new id
+        self._numbers.append(number)
+        self._ids_by_number[number] = zone_id
+        self._orders.clear()
+        return zone_id
+
+
+ZONES = ZoneRegistry()  # Shared registry used by models and the allocator